@@ -12,9 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import TYPE_CHECKING
+
 from . import version
-from .agents.llm_agent import Agent
-from .runners import Runner
+from .utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+  from .agents.llm_agent import Agent
+  from .runners import Runner
+
+__getattr__ = lazy_getattr(
+    __name__, {'Agent': '.agents.llm_agent', 'Runner': '.runners'}
+)
 
 __version__ = version.__version__
-__all__ = ["Agent", "Runner"]
+__all__ = ['Agent', 'Runner']
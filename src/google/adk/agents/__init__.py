@@ -12,15 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .base_agent import BaseAgent
-from .live_request_queue import LiveRequest
-from .live_request_queue import LiveRequestQueue
-from .llm_agent import Agent
-from .llm_agent import LlmAgent
-from .loop_agent import LoopAgent
-from .parallel_agent import ParallelAgent
-from .run_config import RunConfig
-from .sequential_agent import SequentialAgent
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+  from .base_agent import BaseAgent
+  from .live_request_queue import LiveRequest
+  from .live_request_queue import LiveRequestQueue
+  from .llm_agent import Agent
+  from .llm_agent import LlmAgent
+  from .loop_agent import LoopAgent
+  from .parallel_agent import ParallelAgent
+  from .run_config import RunConfig
+  from .sequential_agent import SequentialAgent
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'Agent': '.llm_agent',
+        'BaseAgent': '.base_agent',
+        'LiveRequest': '.live_request_queue',
+        'LiveRequestQueue': '.live_request_queue',
+        'LlmAgent': '.llm_agent',
+        'LoopAgent': '.loop_agent',
+        'ParallelAgent': '.parallel_agent',
+        'RunConfig': '.run_config',
+        'SequentialAgent': '.sequential_agent',
+    },
+)
 
 __all__ = [
     'Agent',
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 import uuid
 
@@ -30,7 +31,7 @@ from .active_streaming_tool import ActiveStreamingTool
 from .base_agent import BaseAgent
 from .live_request_queue import LiveRequestQueue
 from .run_config import RunConfig
-from .transcription_entry import TranscriptionEntry
+from .transcription_entry import TranscriptionCache
 
 
 class LlmCallsLimitExceededError(Exception):
@@ -147,7 +148,7 @@ class InvocationContext(BaseModel):
   active_streaming_tools: Optional[dict[str, ActiveStreamingTool]] = None
   """The running streaming tools of this invocation."""
 
-  transcription_cache: Optional[list[TranscriptionEntry]] = None
+  transcription_cache: Optional[TranscriptionCache] = None
   """Caches necessary, data audio or contents, that are needed by transcription."""
 
   run_config: Optional[RunConfig] = None
@@ -158,6 +159,14 @@ class InvocationContext(BaseModel):
   of this invocation.
   """
 
+  _preloaded_memory_instructions: dict[str, asyncio.Future[Optional[str]]] = {}
+  """The memory instructions rendered by PreloadMemoryTool in this invocation,
+  keyed by the user query they were searched for.
+
+  Shared by all the copies of this invocation context, so the memory is only
+  searched once per invocation.
+  """
+
   def increment_llm_call_count(
       self,
   ):
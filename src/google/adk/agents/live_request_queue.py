@@ -12,13 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import asyncio
+import collections
+import enum
+import logging
 from typing import Optional
 
 from google.genai import types
 from pydantic import BaseModel
 from pydantic import ConfigDict
 
+logger = logging.getLogger('google_adk.' + __name__)
+
+DEFAULT_MAX_REALTIME_REQUESTS = 1000
+"""The default maximum number of queued realtime blobs, e.g. 20s of 20ms audio
+frames."""
+DEFAULT_MAX_REALTIME_BYTES = 16 * 1024 * 1024
+"""The default maximum size of the queued realtime blobs."""
+
 
 class LiveRequest(BaseModel):
   """Request send to live agents."""
@@ -34,10 +47,185 @@ class LiveRequest(BaseModel):
   """If set, close the queue. queue.shutdown() is only supported in Python 3.13+."""
 
 
+class OverflowPolicy(str, enum.Enum):
+  """What to do with realtime blobs sent to a full LiveRequestQueue.
+
+  Contents and close requests are never dropped.
+  """
+
+  DROP_OLDEST = 'drop_oldest'
+  """Drops the oldest queued blobs, so that the model gets the latest data."""
+  DROP_NEWEST = 'drop_newest'
+  """Drops the blobs sent while the queue is full."""
+  COALESCE = 'coalesce'
+  """Appends the data of a blob sent while the queue is full to the last queued
+  blob, if it has the same MIME type, like consecutive audio frames. Drops the
+  oldest queued blobs beyond the size limit."""
+
+
+class LiveRequestQueueStats(BaseModel):
+  """The buffer gauges of a LiveRequestQueue."""
+
+  queued_requests: int = 0
+  """The number of queued requests."""
+  queued_realtime_requests: int = 0
+  """The number of queued realtime blobs."""
+  queued_realtime_bytes: int = 0
+  """The size of the queued realtime blobs."""
+  dropped_realtime_requests: int = 0
+  """The number of realtime blobs dropped so far."""
+  dropped_realtime_bytes: int = 0
+  """The size of the realtime blobs dropped so far."""
+  coalesced_realtime_requests: int = 0
+  """The number of realtime blobs appended to a queued blob so far."""
+
+
+def _blob_size(request: LiveRequest) -> int:
+  return len(request.blob.data or b'')
+
+
+class _BoundedRealtimeQueue:
+  """A queue of live requests that bounds the realtime blobs it holds.
+
+  Unlike asyncio.Queue, blobs may be dropped or merged once queued, so it does
+  not track unfinished tasks and has no join().
+  """
+
+  def __init__(
+      self,
+      max_realtime_requests: Optional[int],
+      max_realtime_bytes: Optional[int],
+      overflow_policy: OverflowPolicy,
+  ):
+    self._queue: collections.deque[LiveRequest] = collections.deque()
+    self._not_empty = asyncio.Event()
+    self._max_realtime_requests = max_realtime_requests
+    self._max_realtime_bytes = max_realtime_bytes
+    self._overflow_policy = overflow_policy
+    self.stats = LiveRequestQueueStats()
+
+  def _is_full(self, added_requests: int, added_bytes: int) -> bool:
+    return (
+        self._max_realtime_requests is not None
+        and self.stats.queued_realtime_requests + added_requests
+        > self._max_realtime_requests
+    ) or (
+        self._max_realtime_bytes is not None
+        and self.stats.queued_realtime_bytes + added_bytes
+        > self._max_realtime_bytes
+    )
+
+  def qsize(self) -> int:
+    return len(self._queue)
+
+  def empty(self) -> bool:
+    return not self._queue
+
+  def put_nowait(self, item: LiveRequest) -> None:
+    self._put(item)
+    if self._queue:
+      self._not_empty.set()
+
+  def _put(self, item: LiveRequest) -> None:
+    if item.blob is None:
+      self._queue.append(item)
+      return
+    size = _blob_size(item)
+    if self._is_full(1, size):
+      if self._overflow_policy == OverflowPolicy.DROP_NEWEST:
+        self._record_drop(size)
+        return
+      if self._overflow_policy == OverflowPolicy.COALESCE and self._coalesce(
+          item
+      ):
+        self._drop_oldest()
+        return
+    self._queue.append(item)
+    self.stats.queued_realtime_requests += 1
+    self.stats.queued_realtime_bytes += size
+    self._drop_oldest()
+
+  def _coalesce(self, item: LiveRequest) -> bool:
+    """Appends the blob to the last queued blob, if they are compatible."""
+    if not self._queue:
+      return False
+    last = self._queue[-1]
+    if last.blob is None or last.blob.mime_type != item.blob.mime_type:
+      return False
+    self._queue[-1] = LiveRequest(
+        blob=types.Blob(
+            mime_type=last.blob.mime_type,
+            data=(last.blob.data or b'') + (item.blob.data or b''),
+        )
+    )
+    self.stats.queued_realtime_bytes += _blob_size(item)
+    self.stats.coalesced_realtime_requests += 1
+    return True
+
+  def _drop_oldest(self) -> None:
+    """Drops the oldest queued blobs until the queue is within its limits."""
+    while self.stats.queued_realtime_requests > 1 and self._is_full(0, 0):
+      index = next(
+          i for i, request in enumerate(self._queue) if request.blob is not None
+      )
+      request = self._queue[index]
+      del self._queue[index]
+      size = _blob_size(request)
+      self.stats.queued_realtime_requests -= 1
+      self.stats.queued_realtime_bytes -= size
+      self._record_drop(size)
+
+  def _record_drop(self, size: int) -> None:
+    if not self.stats.dropped_realtime_requests:
+      logger.warning(
+          'The live request queue is full, dropping realtime blobs with the'
+          ' %s policy.',
+          self._overflow_policy.value,
+      )
+    self.stats.dropped_realtime_requests += 1
+    self.stats.dropped_realtime_bytes += size
+
+  def get_nowait(self) -> LiveRequest:
+    if not self._queue:
+      raise asyncio.QueueEmpty
+    item = self._queue.popleft()
+    if not self._queue:
+      self._not_empty.clear()
+    if item.blob is not None:
+      self.stats.queued_realtime_requests -= 1
+      self.stats.queued_realtime_bytes -= _blob_size(item)
+    return item
+
+  async def get(self) -> LiveRequest:
+    while not self._queue:
+      await self._not_empty.wait()
+    return self.get_nowait()
+
+
 class LiveRequestQueue:
-  """Queue used to send LiveRequest in a live(bidirectional streaming) way."""
+  """Queue used to send LiveRequest in a live(bidirectional streaming) way.
 
-  def __init__(self):
+  The realtime blobs it holds are bounded, as a slow model connection must not
+  grow the memory without limit. Blobs sent to a full queue are handled by the
+  overflow policy.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_realtime_requests: Optional[int] = DEFAULT_MAX_REALTIME_REQUESTS,
+      max_realtime_bytes: Optional[int] = DEFAULT_MAX_REALTIME_BYTES,
+      overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+  ):
+    """Initializes the LiveRequestQueue.
+
+    Args:
+      max_realtime_requests: The maximum number of queued realtime blobs, or
+        None for no limit.
+      max_realtime_bytes: The maximum size of the queued realtime blobs, or
+        None for no limit.
+      overflow_policy: What to do with the realtime blobs sent to a full queue.
+    """
     # Ensure there's an event loop available in this thread
     try:
       asyncio.get_running_loop()
@@ -47,7 +235,11 @@ class LiveRequestQueue:
       asyncio.set_event_loop(loop)
 
     # Now create the queue (it will use the event loop we just ensured exists)
-    self._queue = asyncio.Queue()
+    self._queue = _BoundedRealtimeQueue(
+        max_realtime_requests=max_realtime_requests,
+        max_realtime_bytes=max_realtime_bytes,
+        overflow_policy=overflow_policy,
+    )
 
   def close(self):
     self._queue.put_nowait(LiveRequest(close=True))
@@ -63,3 +255,9 @@ class LiveRequestQueue:
 
   async def get(self) -> LiveRequest:
     return await self._queue.get()
+
+  def get_stats(self) -> LiveRequestQueueStats:
+    """Returns the buffer gauges of the queue."""
+    return self._queue.stats.model_copy(
+        update={'queued_requests': self._queue.qsize()}
+    )
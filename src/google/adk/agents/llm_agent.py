@@ -29,6 +29,7 @@ from pydantic import BaseModel
 from pydantic import Field
 from pydantic import field_validator
 from pydantic import model_validator
+from pydantic import PrivateAttr
 from typing_extensions import override
 from typing_extensions import TypeAlias
 
@@ -104,12 +105,29 @@ ExamplesUnion = Union[list[Example], BaseExampleProvider]
 
 
 async def _convert_tool_union_to_tools(
-    tool_union: ToolUnion, ctx: ReadonlyContext
+    tool_union: ToolUnion,
+    ctx: ReadonlyContext,
+    function_tools: Optional[dict[int, tuple[Callable, FunctionTool]]] = None,
 ) -> list[BaseTool]:
+  """Resolves a tool union to tools.
+
+  Args:
+    tool_union: The tool, toolset or callable to resolve.
+    ctx: The readonly context used to resolve toolsets.
+    function_tools: Optional cache of FunctionTools wrapping plain callables,
+      keyed by the id of the callable. A cached FunctionTool is reused so that
+      its function declaration is only built once.
+  """
   if isinstance(tool_union, BaseTool):
     return [tool_union]
   if isinstance(tool_union, Callable):
-    return [FunctionTool(func=tool_union)]
+    if function_tools is None:
+      return [FunctionTool(func=tool_union)]
+    cached = function_tools.get(id(tool_union))
+    if cached is None or cached[0] is not tool_union:
+      cached = (tool_union, FunctionTool(func=tool_union))
+      function_tools[id(tool_union)] = cached
+    return [cached[1]]
 
   return await tool_union.get_tools(ctx)
 
@@ -148,6 +166,15 @@ class LlmAgent(BaseAgent):
   settings, etc.
   """
 
+  _function_tools: dict[int, tuple[Callable, FunctionTool]] = PrivateAttr(
+      default_factory=dict
+  )
+  """FunctionTools created for the plain callables in `tools`.
+
+  Keyed by the id of the callable, the callable itself is kept in the value so
+  the id cannot be reused while the entry exists.
+  """
+
   # LLM-based agent transfer configs - Start
   disallow_transfer_to_parent: bool = False
   """Disallows LLM-controlled transferring to the parent agent.
@@ -360,8 +387,21 @@ class LlmAgent(BaseAgent):
     This method is only for use by Agent Development Kit.
     """
     resolved_tools = []
+    # Only keep the FunctionTools of callables still in `tools`, so replacing
+    # or removing a callable invalidates its cached tool.
+    previous_function_tools = self._function_tools
+    function_tools = {}
     for tool_union in self.tools:
-      resolved_tools.extend(await _convert_tool_union_to_tools(tool_union, ctx))
+      if not isinstance(tool_union, BaseTool) and isinstance(
+          tool_union, Callable
+      ):
+        cached = previous_function_tools.get(id(tool_union))
+        if cached is not None:
+          function_tools[id(tool_union)] = cached
+      resolved_tools.extend(
+          await _convert_tool_union_to_tools(tool_union, ctx, function_tools)
+      )
+    self._function_tools = function_tools
     return resolved_tools
 
   @property
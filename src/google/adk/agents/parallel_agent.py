@@ -17,13 +17,20 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import AsyncGenerator
+from typing import Optional
 
+from pydantic import Field
 from typing_extensions import override
 
 from ..agents.invocation_context import InvocationContext
 from ..events.event import Event
 from .base_agent import BaseAgent
+from .live_request_queue import LiveRequest
+from .live_request_queue import LiveRequestQueue
+
+logger = logging.getLogger("google_adk." + __name__)
 
 
 def _create_branch_ctx_for_sub_agent(
@@ -44,42 +51,168 @@ def _create_branch_ctx_for_sub_agent(
 
 async def _merge_agent_run(
     agent_runs: list[AsyncGenerator[Event, None]],
+    *,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    required_completions: Optional[int] = None,
 ) -> AsyncGenerator[Event, None]:
   """Merges the agent run event generator.
 
   This implementation guarantees for each agent, it won't move on until the
   generated event is processed by upstream runner.
 
+  The agent runs which are still running when the merge stops, e.g. because
+  one of them raised, are cancelled.
+
   Args:
       agent_runs: A list of async generators that yield events from each agent.
+      max_concurrency: The maximum number of agent runs to run at the same
+        time. The next agent run starts once a running one finishes.
+      timeout: The seconds after which a running agent run is cancelled.
+      required_completions: The number of agent runs to complete, after which
+        the others are cancelled.
 
   Yields:
       Event: The next event from the merged generator.
   """
-  tasks = [
-      asyncio.create_task(events_for_one_agent.__anext__())
-      for events_for_one_agent in agent_runs
-  ]
-  pending_tasks = set(tasks)
-
-  while pending_tasks:
-    done, pending_tasks = await asyncio.wait(
-        pending_tasks, return_when=asyncio.FIRST_COMPLETED
-    )
-    for task in done:
-      try:
-        yield task.result()
-
-        # Find the generator that produced this event and move it on.
-        for i, original_task in enumerate(tasks):
-          if task == original_task:
-            new_task = asyncio.create_task(agent_runs[i].__anext__())
-            tasks[i] = new_task
-            pending_tasks.add(new_task)
-            break  # stop iterating once found
-
-      except StopAsyncIteration:
-        continue
+  loop = asyncio.get_running_loop()
+  # The task of each running agent run, in the order they started.
+  running: dict[int, asyncio.Task[Event]] = {}
+  # The index of the agent run of each task.
+  task_indexes: dict[asyncio.Task[Event], int] = {}
+  started_at: dict[int, float] = {}
+  next_index = 0
+  completions = 0
+
+  def move_on(index: int):
+    task = asyncio.create_task(agent_runs[index].__anext__())
+    running[index] = task
+    task_indexes[task] = index
+
+  def start_agent_runs():
+    nonlocal next_index
+    while next_index < len(agent_runs) and (
+        max_concurrency is None or len(running) < max_concurrency
+    ):
+      started_at[next_index] = loop.time()
+      move_on(next_index)
+      next_index += 1
+
+  def stop_agent_run(index: int) -> asyncio.Task[Event]:
+    task = running.pop(index)
+    del task_indexes[task]
+    del started_at[index]
+    return task
+
+  try:
+    start_agent_runs()
+    while running:
+      wait_timeout = None
+      if timeout is not None:
+        # The agent run which started first is the first to time out.
+        first_started_at = next(iter(started_at.values()))
+        wait_timeout = max(0.0, first_started_at + timeout - loop.time())
+      done, _ = await asyncio.wait(
+          task_indexes,
+          timeout=wait_timeout,
+          return_when=asyncio.FIRST_COMPLETED,
+      )
+      for task in sorted(done, key=task_indexes.__getitem__):
+        index = task_indexes[task]
+        try:
+          event = task.result()
+        except StopAsyncIteration:
+          stop_agent_run(index)
+          completions += 1
+          if required_completions and completions >= required_completions:
+            return
+          continue
+        except BaseException:
+          stop_agent_run(index)
+          raise
+        yield event
+        del task_indexes[task]
+        move_on(index)
+
+      if timeout is not None:
+        now = loop.time()
+        for index, index_started_at in list(started_at.items()):
+          if index_started_at + timeout > now:
+            break
+          logger.warning(
+              "Cancelling sub-agent run %d, which ran for more than %s"
+              " seconds.",
+              index,
+              timeout,
+          )
+          await _cancel_agent_runs([stop_agent_run(index)], [agent_runs[index]])
+      start_agent_runs()
+  finally:
+    await _cancel_agent_runs(list(task_indexes), agent_runs)
+
+
+async def _cancel_agent_runs(
+    tasks: list[asyncio.Task[Event]],
+    agent_runs: list[AsyncGenerator[Event, None]],
+):
+  """Cancels the pending steps of agent runs, then closes the agent runs."""
+  for task in tasks:
+    task.cancel()
+  await asyncio.gather(*tasks, return_exceptions=True)
+  for agent_run in agent_runs:
+    await agent_run.aclose()
+
+
+class _LiveRequestFanOut:
+  """Copies the live requests of an invocation to the running sub-agents.
+
+  A sub-agent gets its own live request queue when it starts, and gets the
+  requests sent from then on until it finishes. The queues of the sub-agents
+  bound their realtime blobs as any LiveRequestQueue does.
+  """
+
+  def __init__(self, live_request_queue: LiveRequestQueue):
+    self._live_request_queue = live_request_queue
+    self._sub_agent_queues: list[LiveRequestQueue] = []
+    self._close_request: Optional[LiveRequest] = None
+    self._forward_task: Optional[asyncio.Task[None]] = None
+
+  async def run_live(
+      self, sub_agent: BaseAgent, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    """Runs a sub-agent live, with the requests sent while it runs."""
+    sub_agent_queue = LiveRequestQueue()
+    if self._close_request:
+      sub_agent_queue.send(self._close_request)
+    ctx.live_request_queue = sub_agent_queue
+    self._sub_agent_queues.append(sub_agent_queue)
+    if self._forward_task is None:
+      # The sub-agents which start together all register their queue before
+      # this task runs, so that they all get the requests sent before.
+      self._forward_task = asyncio.create_task(self._forward())
+    agent_run = sub_agent.run_live(ctx)
+    try:
+      async for event in agent_run:
+        yield event
+    finally:
+      self._sub_agent_queues.remove(sub_agent_queue)
+      await agent_run.aclose()
+
+  async def close(self):
+    """Stops copying the live requests."""
+    if self._forward_task:
+      self._forward_task.cancel()
+      await asyncio.gather(self._forward_task, return_exceptions=True)
+
+  async def _forward(self):
+    while True:
+      live_request = await self._live_request_queue.get()
+      for sub_agent_queue in self._sub_agent_queues:
+        sub_agent_queue.send(live_request)
+      if live_request.close:
+        # The sub-agents which start later are closed right away.
+        self._close_request = live_request
+        return
 
 
 class ParallelAgent(BaseAgent):
@@ -90,6 +223,32 @@ class ParallelAgent(BaseAgent):
 
   - Running different algorithms simultaneously.
   - Generating multiple responses for review by a subsequent evaluation agent.
+
+  For large fan-outs, `max_concurrency` bounds the number of sub-agents running
+  at once, and `required_completions` stops the fan-out once enough sub-agents
+  have completed, e.g. the first one of a race, or a majority for a quorum. If
+  a sub-agent raises, the other sub-agents are cancelled and the error is
+  propagated.
+  """
+
+  max_concurrency: Optional[int] = Field(default=None, ge=1)
+  """The maximum number of sub-agents to run at the same time.
+
+  The next sub-agent starts once a running one finishes. If not set, all the
+  sub-agents start at once.
+  """
+
+  sub_agent_timeout: Optional[float] = Field(default=None, gt=0)
+  """The seconds after which a running sub-agent is cancelled.
+
+  The other sub-agents keep running. If not set, the sub-agents run until they
+  finish.
+  """
+
+  required_completions: Optional[int] = Field(default=None, ge=1)
+  """The number of sub-agents to complete before the others are cancelled.
+
+  If not set, all the sub-agents run until they finish.
   """
 
   @override
@@ -102,12 +261,54 @@ class ParallelAgent(BaseAgent):
         )
         for sub_agent in self.sub_agents
     ]
-    async for event in _merge_agent_run(agent_runs):
+    async for event in _merge_agent_run(
+        agent_runs,
+        max_concurrency=self.max_concurrency,
+        timeout=self.sub_agent_timeout,
+        required_completions=self.required_completions,
+    ):
       yield event
 
   @override
   async def _run_live_impl(
       self, ctx: InvocationContext
   ) -> AsyncGenerator[Event, None]:
-    raise NotImplementedError("This is not supported yet for ParallelAgent.")
-    yield  # AsyncGenerator requires having at least one yield statement
+    """Implementation for live ParallelAgent.
+
+    The sub-agents run on isolated branches as in the non-live case. Each
+    running sub-agent gets its own live request queue, to which the requests
+    sent to the live request queue of the invocation are copied, so that every
+    sub-agent which consumes it, e.g. an LlmAgent with its own live
+    connection, gets them. A sub-agent which waits for `max_concurrency` only
+    gets the requests sent once it started.
+
+    Args:
+      ctx: The invocation context of the agent.
+    """
+    sub_agent_ctxs = [
+        _create_branch_ctx_for_sub_agent(self, sub_agent, ctx)
+        for sub_agent in self.sub_agents
+    ]
+    fan_out = None
+    if ctx.live_request_queue:
+      fan_out = _LiveRequestFanOut(ctx.live_request_queue)
+      agent_runs = [
+          fan_out.run_live(sub_agent, sub_agent_ctx)
+          for sub_agent, sub_agent_ctx in zip(self.sub_agents, sub_agent_ctxs)
+      ]
+    else:
+      agent_runs = [
+          sub_agent.run_live(sub_agent_ctx)
+          for sub_agent, sub_agent_ctx in zip(self.sub_agents, sub_agent_ctxs)
+      ]
+    try:
+      async for event in _merge_agent_run(
+          agent_runs,
+          max_concurrency=self.max_concurrency,
+          timeout=self.sub_agent_timeout,
+          required_completions=self.required_completions,
+      ):
+        yield event
+    finally:
+      if fan_out:
+        await fan_out.close()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+from typing import Iterator
 from typing import Optional
 from typing import Union
 
@@ -35,3 +37,63 @@ class TranscriptionEntry(BaseModel):
 
   data: Union[types.Blob, types.Content]
   """The data that can be used for transcription"""
+
+
+DEFAULT_MAX_ENTRIES = 50000
+"""The default maximum number of entries of a TranscriptionCache."""
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+"""The default maximum size of a TranscriptionCache, e.g. 10 minutes of 16kHz
+16-bit audio."""
+
+
+def _entry_size(entry: TranscriptionEntry) -> int:
+  if isinstance(entry.data, types.Blob):
+    return len(entry.data.data or b'')
+  return sum(len(part.text or '') for part in entry.data.parts or [])
+
+
+class TranscriptionCache:
+  """A ring buffer of the entries needed by transcription.
+
+  The oldest entries are dropped once there are more than `max_entries` of
+  them, or once their size exceeds `max_bytes`, so that a long live call does
+  not grow the memory without limit.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_entries: int = DEFAULT_MAX_ENTRIES,
+      max_bytes: int = DEFAULT_MAX_BYTES,
+  ):
+    self._entries: collections.deque[tuple[TranscriptionEntry, int]] = (
+        collections.deque()
+    )
+    self._max_entries = max_entries
+    self._max_bytes = max_bytes
+    self.size_bytes = 0
+    """The size of the cached audio data and texts."""
+    self.dropped_entries = 0
+    """The number of entries dropped so far."""
+
+  def append(self, entry: TranscriptionEntry) -> None:
+    size = _entry_size(entry)
+    self._entries.append((entry, size))
+    self.size_bytes += size
+    while len(self._entries) > 1 and (
+        len(self._entries) > self._max_entries
+        or self.size_bytes > self._max_bytes
+    ):
+      _, dropped_size = self._entries.popleft()
+      self.size_bytes -= dropped_size
+      self.dropped_entries += 1
+
+  def clear(self) -> None:
+    self._entries.clear()
+    self.size_bytes = 0
+
+  def __iter__(self) -> Iterator[TranscriptionEntry]:
+    return (entry for entry, _ in self._entries)
+
+  def __len__(self) -> int:
+    return len(self._entries)
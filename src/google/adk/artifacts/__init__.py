@@ -12,12 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .base_artifact_service import BaseArtifactService
-from .gcs_artifact_service import GcsArtifactService
-from .in_memory_artifact_service import InMemoryArtifactService
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+  from .base_artifact_service import BaseArtifactService
+  from .file_artifact_service import FileArtifactService
+  from .gcs_artifact_service import GcsArtifactService
+  from .in_memory_artifact_service import InMemoryArtifactService
+
+# The artifact services are imported on first access, as the GCS one depends
+# on the Cloud Storage client.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'BaseArtifactService': '.base_artifact_service',
+        'FileArtifactService': '.file_artifact_service',
+        'GcsArtifactService': '.gcs_artifact_service',
+        'InMemoryArtifactService': '.in_memory_artifact_service',
+    },
+)
 
 __all__ = [
     'BaseArtifactService',
+    'FileArtifactService',
     'GcsArtifactService',
     'InMemoryArtifactService',
 ]
@@ -13,12 +13,172 @@
 # limitations under the License.
 
 
+from __future__ import annotations
+
 from abc import ABC
 from abc import abstractmethod
+from typing import AsyncIterator
+from typing import Callable
 from typing import Optional
 
 from google.genai import types
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+"""The default size of the chunks yielded by artifact readers."""
+
+
+class ArtifactReader:
+  """Reads the contents of an artifact version in chunks.
+
+  Iterating over the reader yields the whole contents. Use `iter_range` to read
+  a byte range.
+
+  Attributes:
+    version: The version of the artifact.
+    mime_type: The MIME type of the artifact.
+    size: The size of the artifact in bytes.
+  """
+
+  def __init__(
+      self,
+      *,
+      version: int,
+      mime_type: str,
+      size: int,
+      read_range: Callable[[int, int, int], AsyncIterator[bytes]],
+      chunk_size: int = DEFAULT_CHUNK_SIZE,
+  ):
+    """Initializes the ArtifactReader.
+
+    Args:
+      version: The version of the artifact.
+      mime_type: The MIME type of the artifact.
+      size: The size of the artifact in bytes.
+      read_range: Yields the chunks of the contents from a start offset to an
+        end offset (exclusive), given a chunk size.
+      chunk_size: The maximum size of the yielded chunks.
+    """
+    self.version = version
+    self.mime_type = mime_type
+    self.size = size
+    self._read_range = read_range
+    self._chunk_size = chunk_size
+
+  def iter_range(
+      self, start: int = 0, end: Optional[int] = None
+  ) -> AsyncIterator[bytes]:
+    """Yields the contents from the start offset to the end offset (exclusive).
+
+    Args:
+      start: The offset of the first byte to read.
+      end: The offset after the last byte to read. Reads to the end of the
+        contents if not set.
+
+    Returns:
+      An async iterator over the chunks of the range.
+    """
+    end = self.size if end is None else min(end, self.size)
+    start = max(0, min(start, end))
+    return self._read_range(start, end, self._chunk_size)
+
+  def __aiter__(self) -> AsyncIterator[bytes]:
+    return self.iter_range()
+
+
+class ArtifactWriter(ABC):
+  """Writes the contents of a new artifact version in chunks.
+
+  The version is only saved when the writer is closed. Used as an async context
+  manager, the writer is closed on success and aborted on error.
+
+  Attributes:
+    version: The version of the saved artifact, once the writer is closed.
+  """
+
+  def __init__(self):
+    self.version: Optional[int] = None
+
+  @abstractmethod
+  async def write(self, data: bytes) -> None:
+    """Appends a chunk to the contents of the artifact."""
+
+  @abstractmethod
+  async def close(self) -> int:
+    """Saves the artifact version.
+
+    Returns:
+      The version of the saved artifact.
+    """
+
+  async def abort(self) -> None:
+    """Discards the written contents."""
+
+  async def __aenter__(self) -> ArtifactWriter:
+    return self
+
+  async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+    if exc_type is None:
+      await self.close()
+    else:
+      await self.abort()
+
+
+def read_bytes_range(
+    data: bytes,
+) -> Callable[[int, int, int], AsyncIterator[bytes]]:
+  """Returns a `read_range` function over in-memory contents."""
+  view = memoryview(data)
+
+  async def read_range(
+      start: int, end: int, chunk_size: int
+  ) -> AsyncIterator[bytes]:
+    for offset in range(start, end, chunk_size):
+      yield bytes(view[offset : min(offset + chunk_size, end)])
+
+  return read_range
+
+
+class _BufferedArtifactWriter(ArtifactWriter):
+  """Buffers the contents in memory, and saves them with save_artifact."""
+
+  def __init__(
+      self,
+      artifact_service: BaseArtifactService,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      mime_type: str,
+  ):
+    super().__init__()
+    self._artifact_service = artifact_service
+    self._key = dict(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+    self._mime_type = mime_type
+    self._buffer = bytearray()
+
+  async def write(self, data: bytes) -> None:
+    self._buffer += data
+
+  async def close(self) -> int:
+    if self.version is None:
+      self.version = await self._artifact_service.save_artifact(
+          **self._key,
+          artifact=types.Part.from_bytes(
+              data=bytes(self._buffer), mime_type=self._mime_type
+          ),
+      )
+      self._buffer = bytearray()
+    return self.version
+
+  async def abort(self) -> None:
+    self._buffer = bytearray()
+
 
 class BaseArtifactService(ABC):
   """Abstract base class for artifact services."""
@@ -121,3 +281,89 @@ class BaseArtifactService(ABC):
     Returns:
         A list of all available versions of the artifact.
     """
+
+  async def open_artifact_reader(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    """Opens an artifact version for reading in chunks.
+
+    The default implementation loads the whole artifact with `load_artifact`.
+    Services override it to read ranges from their storage.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      session_id: The session ID.
+      filename: The filename of the artifact.
+      version: The version of the artifact. If None, the latest version will be
+        read.
+
+    Returns:
+      A reader of the artifact or None if not found.
+    """
+    if version is None:
+      versions = await self.list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+      )
+      if not versions:
+        return None
+      version = max(versions)
+    artifact = await self.load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        version=version,
+    )
+    if not artifact or not artifact.inline_data:
+      return None
+    data = artifact.inline_data.data or b""
+    return ArtifactReader(
+        version=version,
+        mime_type=artifact.inline_data.mime_type,
+        size=len(data),
+        read_range=read_bytes_range(data),
+    )
+
+  async def open_artifact_writer(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      mime_type: str,
+  ) -> ArtifactWriter:
+    """Opens a new artifact version for writing in chunks.
+
+    The default implementation buffers the contents in memory, and saves them
+    with `save_artifact` when the writer is closed. Services override it to
+    write the chunks to their storage as they come.
+
+    Args:
+      app_name: The app name.
+      user_id: The user ID.
+      session_id: The session ID.
+      filename: The filename of the artifact.
+      mime_type: The MIME type of the artifact.
+
+    Returns:
+      A writer of the new artifact version.
+    """
+    return _BufferedArtifactWriter(
+        self,
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        mime_type=mime_type,
+    )
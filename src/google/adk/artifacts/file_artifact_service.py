@@ -0,0 +1,488 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An artifact service implementation using the local filesystem."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+from typing import Any
+from typing import AsyncIterator
+from typing import BinaryIO
+from typing import Optional
+
+from google.genai import types
+from typing_extensions import override
+
+from .base_artifact_service import ArtifactReader
+from .base_artifact_service import ArtifactWriter
+from .base_artifact_service import BaseArtifactService
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_BLOBS_DIR = "blobs"
+_TMP_DIR = "tmp"
+_INDEX_FILE = "index.jsonl"
+
+
+class FileArtifactService(BaseArtifactService):
+  """An artifact service implementation using the local filesystem.
+
+  Artifact versions are stored content-addressed by their SHA-256 digest, so
+  identical contents saved in several sessions or versions are stored once.
+  Files are written to a temporary file and renamed into place, so that a
+  crash never leaves partial contents behind.
+
+  The versions of all artifacts are recorded in an append-only index file,
+  which is loaded in memory once, so listing versions and keys does not touch
+  the filesystem.
+
+  The root directory must only be used by one service instance at a time.
+  """
+
+  def __init__(self, root_dir: str):
+    """Initializes the FileArtifactService.
+
+    Args:
+        root_dir: The directory to store the artifacts in.
+    """
+    self.root_dir = root_dir
+    os.makedirs(os.path.join(root_dir, _BLOBS_DIR), exist_ok=True)
+    os.makedirs(os.path.join(root_dir, _TMP_DIR), exist_ok=True)
+    self._index: dict[str, dict[str, list[dict[str, Any]]]] = (
+        collections.defaultdict(dict)
+    )
+    """Keys are the scopes of the artifacts (app_name/user_id/session_id or
+    app_name/user_id/user). Values map filenames to their versions."""
+    self._blob_references: collections.Counter[str] = collections.Counter()
+    """The number of versions referencing each content digest."""
+    self._lock = asyncio.Lock()
+    self._load_index()
+
+  def _file_has_user_namespace(self, filename: str) -> bool:
+    """Checks if the filename has a user namespace.
+
+    Args:
+        filename: The filename to check.
+
+    Returns:
+        True if the filename has a user namespace (starts with "user:"),
+        False otherwise.
+    """
+    return filename.startswith("user:")
+
+  def _scope(
+      self, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> str:
+    if self._file_has_user_namespace(filename):
+      return f"{app_name}/{user_id}/user"
+    return f"{app_name}/{user_id}/{session_id}"
+
+  def _blob_path(self, digest: str) -> str:
+    return os.path.join(self.root_dir, _BLOBS_DIR, digest[:2], digest)
+
+  def _index_path(self) -> str:
+    return os.path.join(self.root_dir, _INDEX_FILE)
+
+  def _load_index(self) -> None:
+    if not os.path.exists(self._index_path()):
+      return
+    num_records = 0
+    index_size = 0
+    unreferenced = set()
+    with open(self._index_path(), "rb") as f:
+      for line in f:
+        try:
+          record = json.loads(line)
+        except json.JSONDecodeError:
+          # A partially written last line, left by an interrupted write.
+          break
+        num_records += 1
+        index_size += len(line)
+        unreferenced.update(self._apply_record(record))
+    num_versions = sum(self._blob_references.values())
+    if num_records > num_versions:
+      self._compact_index()
+    elif index_size < os.path.getsize(self._index_path()):
+      os.truncate(self._index_path(), index_size)
+    # Removes the contents left behind by deletes interrupted by a crash.
+    for digest in unreferenced - set(self._blob_references):
+      try:
+        os.remove(self._blob_path(digest))
+      except FileNotFoundError:
+        pass
+
+  def _apply_record(self, record: dict[str, Any]) -> list[str]:
+    """Applies an index record, and returns the digests no longer referenced."""
+    files = self._index[record["scope"]]
+    filename = record["filename"]
+    if record["op"] == "save":
+      files.setdefault(filename, []).append(record["version"])
+      self._blob_references[record["version"]["sha256"]] += 1
+      return []
+
+    unreferenced = []
+    for version in files.pop(filename, []):
+      digest = version["sha256"]
+      self._blob_references[digest] -= 1
+      if not self._blob_references[digest]:
+        del self._blob_references[digest]
+        unreferenced.append(digest)
+    if not files:
+      del self._index[record["scope"]]
+    return unreferenced
+
+  def _compact_index(self) -> None:
+    """Rewrites the index file with only the live versions."""
+    with tempfile.NamedTemporaryFile(
+        "w",
+        dir=os.path.join(self.root_dir, _TMP_DIR),
+        delete=False,
+        encoding="utf-8",
+    ) as f:
+      for scope, files in self._index.items():
+        for filename, versions in files.items():
+          for version in versions:
+            f.write(
+                json.dumps({
+                    "op": "save",
+                    "scope": scope,
+                    "filename": filename,
+                    "version": version,
+                })
+                + "\n"
+            )
+    os.replace(f.name, self._index_path())
+
+  def _append_index_record(self, record: dict[str, Any]) -> None:
+    with open(self._index_path(), "a", encoding="utf-8") as f:
+      f.write(json.dumps(record) + "\n")
+
+  def _write_blob(self, data: bytes) -> str:
+    """Writes the data content-addressed, and returns its digest."""
+    digest = hashlib.sha256(data).hexdigest()
+    path = self._blob_path(digest)
+    if os.path.exists(path):
+      return digest
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=os.path.join(self.root_dir, _TMP_DIR), delete=False
+    ) as f:
+      f.write(data)
+    os.replace(f.name, path)
+    return digest
+
+  def _read_blob(self, digest: str) -> bytes:
+    mapped = self._map_blob(digest)
+    if mapped is None:
+      return b""
+    with mapped:
+      return mapped[:]
+
+  def _get_version(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int],
+  ) -> Optional[tuple[int, dict[str, Any]]]:
+    """Returns the version number and index entry of an artifact version."""
+    files = self._index.get(
+        self._scope(app_name, user_id, session_id, filename)
+    )
+    versions = files.get(filename) if files else None
+    if not versions:
+      return None
+    if version is None:
+      version = len(versions) - 1
+    if not 0 <= version < len(versions):
+      return None
+    return version, versions[version]
+
+  def _map_blob(self, digest: str) -> Optional[mmap.mmap]:
+    """Memory-maps the contents with the digest, or returns None if empty."""
+    with open(self._blob_path(digest), "rb") as f:
+      if not os.fstat(f.fileno()).st_size:
+        return None
+      return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+  async def _commit_version(
+      self, scope: str, filename: str, digest: str, mime_type: str, size: int
+  ) -> int:
+    """Records a new version of an artifact. Must be called with the lock."""
+    record = {
+        "op": "save",
+        "scope": scope,
+        "filename": filename,
+        "version": {
+            "sha256": digest,
+            "mime_type": mime_type,
+            "size": size,
+        },
+    }
+    await asyncio.to_thread(self._append_index_record, record)
+    self._apply_record(record)
+    return len(self._index[scope][filename]) - 1
+
+  def map_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[tuple[memoryview, str]]:
+    """Memory-maps an artifact, without copying its contents.
+
+    The caller should release the returned buffer when done with it.
+
+    Args:
+        app_name: The name of the application.
+        user_id: The ID of the user.
+        session_id: The ID of the session.
+        filename: The name of the artifact file.
+        version: The version of the artifact. If None, the latest version will
+          be mapped.
+
+    Returns:
+        A read-only buffer of the artifact contents and their MIME type, or None
+        if not found.
+    """
+    found = self._get_version(app_name, user_id, session_id, filename, version)
+    if found is None:
+      return None
+    _, entry = found
+    try:
+      mapped = self._map_blob(entry["sha256"])
+    except FileNotFoundError:
+      return None
+    return memoryview(mapped if mapped else b""), entry["mime_type"]
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      artifact: types.Part,
+  ) -> int:
+    data = artifact.inline_data.data
+    scope = self._scope(app_name, user_id, session_id, filename)
+    async with self._lock:
+      digest = await asyncio.to_thread(self._write_blob, data)
+      return await self._commit_version(
+          scope,
+          filename,
+          digest,
+          artifact.inline_data.mime_type,
+          len(data),
+      )
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    found = self._get_version(app_name, user_id, session_id, filename, version)
+    if found is None:
+      return None
+    _, entry = found
+    try:
+      data = await asyncio.to_thread(self._read_blob, entry["sha256"])
+    except FileNotFoundError:
+      return None
+    return types.Part.from_bytes(data=data, mime_type=entry["mime_type"])
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> list[str]:
+    filenames = []
+    for scope in (
+        f"{app_name}/{user_id}/{session_id}",
+        f"{app_name}/{user_id}/user",
+    ):
+      filenames.extend(self._index.get(scope, {}))
+    return sorted(filenames)
+
+  @override
+  async def delete_artifact(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> None:
+    scope = self._scope(app_name, user_id, session_id, filename)
+    async with self._lock:
+      if filename not in self._index.get(scope, {}):
+        return None
+      record = {"op": "delete", "scope": scope, "filename": filename}
+      await asyncio.to_thread(self._append_index_record, record)
+      for digest in self._apply_record(record):
+        try:
+          await asyncio.to_thread(os.remove, self._blob_path(digest))
+        except FileNotFoundError:
+          pass
+
+  @override
+  async def list_versions(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> list[int]:
+    files = self._index.get(
+        self._scope(app_name, user_id, session_id, filename)
+    )
+    versions = files.get(filename) if files else None
+    if not versions:
+      return []
+    return list(range(len(versions)))
+
+  @override
+  async def open_artifact_reader(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    found = self._get_version(app_name, user_id, session_id, filename, version)
+    if found is None:
+      return None
+    version, entry = found
+    digest = entry["sha256"]
+
+    async def read_range(
+        start: int, end: int, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+      if start >= end:
+        return
+      mapped = await asyncio.to_thread(self._map_blob, digest)
+      if mapped is None:
+        return
+      try:
+        for offset in range(start, end, chunk_size):
+          yield await asyncio.to_thread(
+              mapped.__getitem__, slice(offset, min(offset + chunk_size, end))
+          )
+      finally:
+        mapped.close()
+
+    return ArtifactReader(
+        version=version,
+        mime_type=entry["mime_type"],
+        size=entry["size"],
+        read_range=read_range,
+    )
+
+  @override
+  async def open_artifact_writer(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      mime_type: str,
+  ) -> ArtifactWriter:
+    return _FileArtifactWriter(
+        self,
+        scope=self._scope(app_name, user_id, session_id, filename),
+        filename=filename,
+        mime_type=mime_type,
+    )
+
+
+class _FileArtifactWriter(ArtifactWriter):
+  """Streams the contents to a temp file, which is renamed on close."""
+
+  def __init__(
+      self,
+      artifact_service: FileArtifactService,
+      *,
+      scope: str,
+      filename: str,
+      mime_type: str,
+  ):
+    super().__init__()
+    self._artifact_service = artifact_service
+    self._scope = scope
+    self._filename = filename
+    self._mime_type = mime_type
+    self._hash = hashlib.sha256()
+    self._size = 0
+    self._file: Optional[BinaryIO] = None
+
+  async def _open(self) -> BinaryIO:
+    if self._file is None:
+      self._file = await asyncio.to_thread(
+          tempfile.NamedTemporaryFile,
+          "wb",
+          dir=os.path.join(self._artifact_service.root_dir, _TMP_DIR),
+          delete=False,
+      )
+    return self._file
+
+  async def write(self, data: bytes) -> None:
+    if self.version is not None:
+      raise ValueError("The artifact writer is closed.")
+    file = await self._open()
+    self._hash.update(data)
+    self._size += len(data)
+    await asyncio.to_thread(file.write, data)
+
+  async def close(self) -> int:
+    if self.version is not None:
+      return self.version
+    file = await self._open()
+    await asyncio.to_thread(file.close)
+    digest = self._hash.hexdigest()
+    service = self._artifact_service
+    async with service._lock:
+      blob_path = service._blob_path(digest)
+      if os.path.exists(blob_path):
+        await asyncio.to_thread(os.remove, file.name)
+      else:
+        await asyncio.to_thread(
+            os.makedirs, os.path.dirname(blob_path), exist_ok=True
+        )
+        await asyncio.to_thread(os.replace, file.name, blob_path)
+      self.version = await service._commit_version(
+          self._scope,
+          self._filename,
+          digest,
+          self._mime_type,
+          self._size,
+      )
+    return self.version
+
+  async def abort(self) -> None:
+    if self._file is None or self.version is not None:
+      return
+    file, self._file = self._file, None
+    await asyncio.to_thread(file.close)
+    await asyncio.to_thread(os.remove, file.name)
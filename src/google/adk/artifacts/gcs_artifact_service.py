@@ -13,22 +13,45 @@
 # limitations under the License.
 
 """An artifact service implementation using Google Cloud Storage (GCS)."""
+
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import AsyncIterator
+from typing import Callable
 from typing import Optional
+import uuid
 
+from google.api_core import exceptions
 from google.cloud import storage
 from google.genai import types
 from typing_extensions import override
 
+from .base_artifact_service import ArtifactReader
+from .base_artifact_service import ArtifactWriter
 from .base_artifact_service import BaseArtifactService
 
 logger = logging.getLogger("google_adk." + __name__)
 
+MAX_SAVE_ATTEMPTS = 5
+"""The maximum number of attempts to save an artifact version.
+
+Attempts only fail when concurrent writers take the same version."""
+
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+"""The size of the chunks of resumable uploads. Must be a multiple of 256KB."""
+
+UPLOADS_PREFIX = "_adk_uploads/"
+"""The prefix of the temporary blobs of streamed uploads."""
+
 
 class GcsArtifactService(BaseArtifactService):
-  """An artifact service implementation using Google Cloud Storage (GCS)."""
+  """An artifact service implementation using Google Cloud Storage (GCS).
+
+  Blob operations run in worker threads, so that they do not block the event
+  loop.
+  """
 
   def __init__(self, bucket_name: str, **kwargs):
     """Initializes the GcsArtifactService.
@@ -40,6 +63,12 @@ class GcsArtifactService(BaseArtifactService):
     self.bucket_name = bucket_name
     self.storage_client = storage.Client(**kwargs)
     self.bucket = self.storage_client.bucket(self.bucket_name)
+    self._latest_versions: dict[str, int] = {}
+    """Keys are the blob name prefixes of the artifacts. Values are the latest
+    versions saved by this service.
+
+    The cache may be stale when other processes write to the bucket, which is
+    detected by the generation precondition of the writes."""
 
   def _file_has_user_namespace(self, filename: str) -> bool:
     """Checks if the filename has a user namespace.
@@ -77,6 +106,11 @@ class GcsArtifactService(BaseArtifactService):
       return f"{app_name}/{user_id}/user/{filename}/{version}"
     return f"{app_name}/{user_id}/{session_id}/{filename}/{version}"
 
+  def _get_version_prefix(
+      self, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> str:
+    return self._get_blob_name(app_name, user_id, session_id, filename, "")
+
   @override
   async def save_artifact(
       self,
@@ -87,25 +121,76 @@ class GcsArtifactService(BaseArtifactService):
       filename: str,
       artifact: types.Part,
   ) -> int:
-    versions = await self.list_versions(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
+    return await self._write_next_version(
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        lambda blob: blob.upload_from_string(
+            data=artifact.inline_data.data,
+            content_type=artifact.inline_data.mime_type,
+            if_generation_match=0,
+        ),
     )
-    version = 0 if not versions else max(versions) + 1
 
-    blob_name = self._get_blob_name(
-        app_name, user_id, session_id, filename, version
-    )
-    blob = self.bucket.blob(blob_name)
+  async def _write_next_version(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      write: Callable[[storage.Blob], None],
+  ) -> int:
+    """Writes the next version of an artifact.
 
-    blob.upload_from_string(
-        data=artifact.inline_data.data,
-        content_type=artifact.inline_data.mime_type,
-    )
+    Args:
+        app_name: The name of the application.
+        user_id: The ID of the user.
+        session_id: The ID of the session.
+        filename: The name of the artifact file.
+        write: Writes the blob of a version, only if it does not exist.
+          Called in a worker thread.
+
+    Returns:
+        The written version.
+    """
+    prefix = self._get_version_prefix(app_name, user_id, session_id, filename)
+    is_cache_stale = False
+    for _ in range(MAX_SAVE_ATTEMPTS):
+      latest_version = self._latest_versions.get(prefix)
+      if latest_version is None or is_cache_stale:
+        versions = await self.list_versions(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id,
+            filename=filename,
+        )
+        # Saves of this service may have reserved newer versions meanwhile.
+        latest_version = max(versions + [self._latest_versions.get(prefix, -1)])
+      version = latest_version + 1
+      # Reserves the version for concurrent saves of this service.
+      self._latest_versions[prefix] = version
 
-    return version
+      try:
+        # Only creates the blob if it does not exist, so that concurrent
+        # writers never overwrite each other's versions.
+        await asyncio.to_thread(write, self.bucket.blob(prefix + str(version)))
+      except exceptions.PreconditionFailed:
+        # The version was taken by another writer, so the cache is stale.
+        is_cache_stale = True
+        continue
+      except BaseException:
+        # Releases the reservation, so that the next save does not skip the
+        # version, unless a concurrent save reserved a newer one meanwhile.
+        if self._latest_versions.get(prefix) == version:
+          self._latest_versions[prefix] = latest_version
+        raise
+      return version
+
+    raise RuntimeError(
+        f"Failed to save artifact {filename} after {MAX_SAVE_ATTEMPTS}"
+        " attempts, due to concurrent writes."
+    )
 
   @override
   async def load_artifact(
@@ -133,7 +218,7 @@ class GcsArtifactService(BaseArtifactService):
     )
     blob = self.bucket.blob(blob_name)
 
-    artifact_bytes = blob.download_as_bytes()
+    artifact_bytes = await asyncio.to_thread(blob.download_as_bytes)
     if not artifact_bytes:
       return None
     artifact = types.Part.from_bytes(
@@ -141,28 +226,27 @@ class GcsArtifactService(BaseArtifactService):
     )
     return artifact
 
+  def _list_blob_names(self, prefix: str) -> list[str]:
+    return [
+        blob.name
+        for blob in self.storage_client.list_blobs(self.bucket, prefix=prefix)
+    ]
+
   @override
   async def list_artifact_keys(
       self, *, app_name: str, user_id: str, session_id: str
   ) -> list[str]:
-    filenames = set()
-
     session_prefix = f"{app_name}/{user_id}/{session_id}/"
-    session_blobs = self.storage_client.list_blobs(
-        self.bucket, prefix=session_prefix
-    )
-    for blob in session_blobs:
-      *_, filename, _ = blob.name.split("/")
-      filenames.add(filename)
-
     user_namespace_prefix = f"{app_name}/{user_id}/user/"
-    user_namespace_blobs = self.storage_client.list_blobs(
-        self.bucket, prefix=user_namespace_prefix
+    session_blob_names, user_namespace_blob_names = await asyncio.gather(
+        asyncio.to_thread(self._list_blob_names, session_prefix),
+        asyncio.to_thread(self._list_blob_names, user_namespace_prefix),
     )
-    for blob in user_namespace_blobs:
-      *_, filename, _ = blob.name.split("/")
-      filenames.add(filename)
 
+    filenames = set()
+    for blob_name in session_blob_names + user_namespace_blob_names:
+      *_, filename, _ = blob_name.split("/")
+      filenames.add(filename)
     return sorted(list(filenames))
 
   @override
@@ -175,22 +259,168 @@ class GcsArtifactService(BaseArtifactService):
         session_id=session_id,
         filename=filename,
     )
-    for version in versions:
-      blob_name = self._get_blob_name(
-          app_name, user_id, session_id, filename, version
-      )
-      blob = self.bucket.blob(blob_name)
-      blob.delete()
+    await asyncio.gather(*(
+        asyncio.to_thread(
+            self.bucket.blob(
+                self._get_blob_name(
+                    app_name, user_id, session_id, filename, version
+                )
+            ).delete
+        )
+        for version in versions
+    ))
+    self._latest_versions.pop(
+        self._get_version_prefix(app_name, user_id, session_id, filename),
+        None,
+    )
     return
 
   @override
   async def list_versions(
       self, *, app_name: str, user_id: str, session_id: str, filename: str
   ) -> list[int]:
-    prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
-    blobs = self.storage_client.list_blobs(self.bucket, prefix=prefix)
+    prefix = self._get_version_prefix(app_name, user_id, session_id, filename)
+    blob_names = await asyncio.to_thread(self._list_blob_names, prefix)
     versions = []
-    for blob in blobs:
-      *_, version = blob.name.split("/")
+    for blob_name in blob_names:
+      *_, version = blob_name.split("/")
       versions.append(int(version))
     return versions
+
+  @override
+  async def open_artifact_reader(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    if version is None:
+      versions = await self.list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+      )
+      if not versions:
+        return None
+      version = max(versions)
+
+    blob = self.bucket.blob(
+        self._get_blob_name(app_name, user_id, session_id, filename, version)
+    )
+    try:
+      await asyncio.to_thread(blob.reload)
+    except exceptions.NotFound:
+      return None
+    generation = blob.generation
+
+    async def read_range(
+        start: int, end: int, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+      for offset in range(start, end, chunk_size):
+        # Ranged downloads of the reloaded generation, with inclusive ends.
+        yield await asyncio.to_thread(
+            blob.download_as_bytes,
+            start=offset,
+            end=min(offset + chunk_size, end) - 1,
+            if_generation_match=generation,
+        )
+
+    return ArtifactReader(
+        version=version,
+        mime_type=blob.content_type,
+        size=blob.size or 0,
+        read_range=read_range,
+    )
+
+  @override
+  async def open_artifact_writer(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      mime_type: str,
+  ) -> ArtifactWriter:
+    return _GcsArtifactWriter(
+        self,
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        mime_type=mime_type,
+    )
+
+
+class _GcsArtifactWriter(ArtifactWriter):
+  """Streams the contents to a temporary blob with a resumable upload.
+
+  The temporary blob is copied to the next version on close, which lets the
+  version be retried on concurrent writes without uploading the contents again.
+  """
+
+  def __init__(
+      self,
+      artifact_service: GcsArtifactService,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      mime_type: str,
+  ):
+    super().__init__()
+    self._artifact_service = artifact_service
+    self._key = (app_name, user_id, session_id, filename)
+    self._mime_type = mime_type
+    self._upload_blob = artifact_service.bucket.blob(
+        f"{UPLOADS_PREFIX}{uuid.uuid4().hex}"
+    )
+    self._file = None
+
+  async def _open(self):
+    if self._file is None:
+      self._file = await asyncio.to_thread(
+          self._upload_blob.open,
+          "wb",
+          chunk_size=UPLOAD_CHUNK_SIZE,
+          content_type=self._mime_type,
+      )
+    return self._file
+
+  async def write(self, data: bytes) -> None:
+    if self.version is not None:
+      raise ValueError("The artifact writer is closed.")
+    file = await self._open()
+    await asyncio.to_thread(file.write, data)
+
+  async def close(self) -> int:
+    if self.version is not None:
+      return self.version
+    file = await self._open()
+    await asyncio.to_thread(file.close)
+    bucket = self._artifact_service.bucket
+    try:
+      self.version = await self._artifact_service._write_next_version(
+          *self._key,
+          lambda blob: bucket.copy_blob(
+              self._upload_blob, bucket, blob.name, if_generation_match=0
+          ),
+      )
+    finally:
+      await asyncio.to_thread(self._delete_upload_blob)
+    return self.version
+
+  async def abort(self) -> None:
+    # An unfinished resumable upload never creates the blob.
+    self._file = None
+
+  def _delete_upload_blob(self) -> None:
+    try:
+      self._upload_blob.delete()
+    except exceptions.NotFound:
+      pass
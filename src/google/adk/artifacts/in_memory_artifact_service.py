@@ -13,27 +13,155 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
+import collections
 import logging
+import os
+from typing import AsyncIterator
+from typing import NamedTuple
 from typing import Optional
+import uuid
 
 from google.genai import types
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 from typing_extensions import override
 
+from .base_artifact_service import ArtifactReader
 from .base_artifact_service import BaseArtifactService
+from .base_artifact_service import read_bytes_range
 
 logger = logging.getLogger("google_adk." + __name__)
 
 
+class InMemoryArtifactStats(BaseModel):
+  """Memory usage and eviction statistics of an InMemoryArtifactService."""
+
+  resident_versions: int = 0
+  """The number of artifact versions kept in memory."""
+  resident_bytes: int = 0
+  """The size of the artifact versions kept in memory."""
+  spilled_versions: int = 0
+  """The number of artifact versions spilled to disk."""
+  spilled_bytes: int = 0
+  """The size of the artifact versions spilled to disk."""
+  evicted_versions: int = 0
+  """The number of artifact versions evicted from memory so far."""
+  evicted_bytes: int = 0
+  """The size of the artifact versions evicted from memory so far."""
+  dropped_versions: int = 0
+  """The number of artifact versions discarded so far, either beyond
+  `max_versions_per_artifact` or evicted without a spill directory."""
+
+
+class _SpilledVersion(NamedTuple):
+  file_path: str
+  size: int
+  inline: bool
+  """Whether the file holds the inline data, or else the Part as JSON."""
+  mime_type: Optional[str]
+
+
+def _part_size(part: types.Part) -> int:
+  size = 0
+  if part.inline_data and part.inline_data.data:
+    size += len(part.inline_data.data)
+  if part.text:
+    size += len(part.text.encode("utf-8"))
+  return size
+
+
+def _write_spill_file(spill_dir: str, part: types.Part) -> _SpilledVersion:
+  os.makedirs(spill_dir, exist_ok=True)
+  file_path = os.path.join(spill_dir, uuid.uuid4().hex)
+  inline = part.inline_data is not None
+  with open(file_path, "wb") as f:
+    if inline:
+      f.write(part.inline_data.data or b"")
+    else:
+      f.write(part.model_dump_json(exclude_none=True).encode("utf-8"))
+  return _SpilledVersion(
+      file_path=file_path,
+      size=_part_size(part),
+      inline=inline,
+      mime_type=part.inline_data.mime_type if inline else None,
+  )
+
+
+def _read_spill_file(spilled: _SpilledVersion) -> types.Part:
+  with open(spilled.file_path, "rb") as f:
+    data = f.read()
+  if spilled.inline:
+    return types.Part.from_bytes(data=data, mime_type=spilled.mime_type)
+  return types.Part.model_validate_json(data)
+
+
+def _read_spill_file_range(file_path: str, start: int, end: int) -> bytes:
+  with open(file_path, "rb") as f:
+    f.seek(start)
+    return f.read(end - start)
+
+
+def _remove_files(file_paths: list[str]) -> None:
+  for file_path in file_paths:
+    try:
+      os.remove(file_path)
+    except FileNotFoundError:
+      pass
+
+
 class InMemoryArtifactService(BaseArtifactService, BaseModel):
   """An in-memory implementation of the artifact service.
 
   It is not suitable for multi-threaded production environments. Use it for
   testing and development only.
+
+  The memory usage can be bounded with `max_bytes`, beyond which the least
+  recently used artifact versions across all sessions are evicted, and with
+  `max_versions_per_artifact`. Evicted versions are written to `spill_dir` and
+  loaded from there when it is set, and discarded otherwise. Version numbers
+  are never reused, so an evicted version leaves a None in `artifacts`.
   """
 
-  artifacts: dict[str, list[types.Part]] = Field(default_factory=dict)
+  artifacts: dict[str, list[Optional[types.Part]]] = Field(default_factory=dict)
+  max_bytes: Optional[int] = None
+  """The maximum size of the artifact versions kept in memory. The most
+  recently used version is kept even if it is larger."""
+  max_versions_per_artifact: Optional[int] = None
+  """The maximum number of versions kept per artifact. Older versions are
+  discarded."""
+  spill_dir: Optional[str] = None
+  """The directory that versions evicted from memory are written to."""
+
+  _lru: collections.OrderedDict[tuple[str, int], int] = PrivateAttr(
+      default_factory=collections.OrderedDict
+  )
+  """The sizes of the versions kept in memory, least recently used first."""
+  _spilled: dict[tuple[str, int], _SpilledVersion] = PrivateAttr(
+      default_factory=dict
+  )
+  _first_versions: dict[str, int] = PrivateAttr(default_factory=dict)
+  """The first version of each artifact not discarded for exceeding
+  `max_versions_per_artifact`."""
+  _stats: InMemoryArtifactStats = PrivateAttr(
+      default_factory=InMemoryArtifactStats
+  )
+
+  def model_post_init(self, __context) -> None:
+    for path, versions in self.artifacts.items():
+      for version, artifact in enumerate(versions):
+        if artifact is not None:
+          self._track(path, version, artifact)
+
+  def get_stats(self) -> InMemoryArtifactStats:
+    """Returns the memory usage and eviction statistics."""
+    return self._stats.model_copy(
+        update={
+            "resident_versions": len(self._lru),
+            "spilled_versions": len(self._spilled),
+        }
+    )
 
   def _file_has_user_namespace(self, filename: str) -> bool:
     """Checks if the filename has a user namespace.
@@ -65,6 +193,101 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
       return f"{app_name}/{user_id}/user/{filename}"
     return f"{app_name}/{user_id}/{session_id}/{filename}"
 
+  def _track(self, path: str, version: int, artifact: types.Part) -> None:
+    size = _part_size(artifact)
+    self._lru[(path, version)] = size
+    self._stats.resident_bytes += size
+
+  def _untrack(self, path: str, version: int) -> Optional[str]:
+    """Forgets a version, and returns its spill file to remove, if any."""
+    size = self._lru.pop((path, version), None)
+    if size is not None:
+      self._stats.resident_bytes -= size
+    spilled = self._spilled.pop((path, version), None)
+    if spilled is None:
+      return None
+    self._stats.spilled_bytes -= spilled.size
+    return spilled.file_path
+
+  def _is_available(self, path: str, version: int) -> bool:
+    return (
+        self.artifacts[path][version] is not None
+        or (path, version) in self._spilled
+    )
+
+  def _latest_version(self, path: str) -> Optional[int]:
+    versions = self.artifacts.get(path) or []
+    for version in range(len(versions) - 1, -1, -1):
+      if self._is_available(path, version):
+        return version
+    return None
+
+  def _drop_old_versions(self, path: str) -> list[str]:
+    """Discards the versions beyond `max_versions_per_artifact`.
+
+    Returns:
+        The spill files of the discarded versions to remove.
+    """
+    if self.max_versions_per_artifact is None:
+      return []
+    first_version = len(self.artifacts[path]) - self.max_versions_per_artifact
+    file_paths = []
+    for version in range(self._first_versions.get(path, 0), first_version):
+      if self._is_available(path, version):
+        self._stats.dropped_versions += 1
+      file_path = self._untrack(path, version)
+      if file_path:
+        file_paths.append(file_path)
+      self.artifacts[path][version] = None
+    self._first_versions[path] = max(
+        first_version, self._first_versions.get(path, 0)
+    )
+    return file_paths
+
+  async def _evict(self) -> None:
+    """Evicts the least recently used versions beyond `max_bytes`."""
+    if self.max_bytes is None:
+      return
+    evicted = []
+    while self._stats.resident_bytes > self.max_bytes and len(self._lru) > 1:
+      (path, version), size = self._lru.popitem(last=False)
+      self._stats.resident_bytes -= size
+      self._stats.evicted_versions += 1
+      self._stats.evicted_bytes += size
+      evicted.append((path, version, self.artifacts[path][version]))
+    if not evicted:
+      return
+    logger.debug("Evicting %d artifact versions from memory.", len(evicted))
+    if self.spill_dir is None:
+      for path, version, _ in evicted:
+        self.artifacts[path][version] = None
+      self._stats.dropped_versions += len(evicted)
+      return
+
+    # The versions stay readable from memory while they are being written.
+    spilled_versions = await asyncio.to_thread(
+        lambda: [
+            _write_spill_file(self.spill_dir, artifact)
+            for _, _, artifact in evicted
+        ]
+    )
+    stale_files = []
+    for (path, version, artifact), spilled in zip(evicted, spilled_versions):
+      versions = self.artifacts.get(path)
+      if (
+          versions is None
+          or version >= len(versions)
+          or versions[version] is not artifact
+      ):
+        # Deleted, saved again or discarded while it was being written.
+        stale_files.append(spilled.file_path)
+        continue
+      versions[version] = None
+      self._spilled[(path, version)] = spilled
+      self._stats.spilled_bytes += spilled.size
+    if stale_files:
+      await asyncio.to_thread(_remove_files, stale_files)
+
   @override
   async def save_artifact(
       self,
@@ -80,6 +303,11 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
       self.artifacts[path] = []
     version = len(self.artifacts[path])
     self.artifacts[path].append(artifact)
+    self._track(path, version, artifact)
+    stale_files = self._drop_old_versions(path)
+    if stale_files:
+      await asyncio.to_thread(_remove_files, stale_files)
+    await self._evict()
     return version
 
   @override
@@ -97,8 +325,20 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
     if not versions:
       return None
     if version is None:
-      version = -1
-    return versions[version]
+      version = self._latest_version(path)
+      if version is None:
+        return None
+    elif version < 0:
+      version += len(versions)
+    artifact = versions[version]
+    if artifact is not None:
+      if (path, version) in self._lru:
+        self._lru.move_to_end((path, version))
+      return artifact
+    spilled = self._spilled.get((path, version))
+    if spilled is None:
+      return None
+    return await asyncio.to_thread(_read_spill_file, spilled)
 
   @override
   async def list_artifact_keys(
@@ -108,6 +348,8 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
     usernamespace_prefix = f"{app_name}/{user_id}/user/"
     filenames = []
     for path in self.artifacts:
+      if self._latest_version(path) is None:
+        continue
       if path.startswith(session_prefix):
         filename = path.removeprefix(session_prefix)
         filenames.append(filename)
@@ -123,7 +365,15 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
     path = self._artifact_path(app_name, user_id, session_id, filename)
     if not self.artifacts.get(path):
       return None
-    self.artifacts.pop(path, None)
+    versions = self.artifacts.pop(path)
+    self._first_versions.pop(path, None)
+    stale_files = []
+    for version in range(len(versions)):
+      file_path = self._untrack(path, version)
+      if file_path:
+        stale_files.append(file_path)
+    if stale_files:
+      await asyncio.to_thread(_remove_files, stale_files)
 
   @override
   async def list_versions(
@@ -133,4 +383,59 @@ class InMemoryArtifactService(BaseArtifactService, BaseModel):
     versions = self.artifacts.get(path)
     if not versions:
       return []
-    return list(range(len(versions)))
+    return [
+        version
+        for version in range(len(versions))
+        if self._is_available(path, version)
+    ]
+
+  @override
+  async def open_artifact_reader(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactReader]:
+    path = self._artifact_path(app_name, user_id, session_id, filename)
+    versions = self.artifacts.get(path)
+    if not versions:
+      return None
+    if version is None:
+      version = self._latest_version(path)
+    if version is None or not 0 <= version < len(versions):
+      return None
+    spilled = self._spilled.get((path, version))
+    if spilled is not None and spilled.inline:
+
+      async def read_range(
+          start: int, end: int, chunk_size: int
+      ) -> AsyncIterator[bytes]:
+        for offset in range(start, end, chunk_size):
+          yield await asyncio.to_thread(
+              _read_spill_file_range,
+              spilled.file_path,
+              offset,
+              min(offset + chunk_size, end),
+          )
+
+      return ArtifactReader(
+          version=version,
+          mime_type=spilled.mime_type,
+          size=spilled.size,
+          read_range=read_range,
+      )
+    artifact = versions[version]
+    if artifact is None or not artifact.inline_data:
+      return None
+    if (path, version) in self._lru:
+      self._lru.move_to_end((path, version))
+    data = artifact.inline_data.data or b""
+    return ArtifactReader(
+        version=version,
+        mime_type=artifact.inline_data.mime_type,
+        size=len(data),
+        read_range=read_bytes_range(data),
+    )
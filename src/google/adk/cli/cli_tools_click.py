@@ -41,6 +41,7 @@ from .fast_api import get_fast_api_app
 from .utils import envs
 from .utils import evals
 from .utils import logs
+from .utils import worker_pool
 
 LOG_LEVELS = click.Choice(
     ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
@@ -600,6 +601,27 @@ def fast_api_common_options():
     default="127.0.0.1",
     show_default=True,
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help=(
+        "Optional. The number of worker processes. More than one worker"
+        " requires gunicorn and a shared --session_service_uri, and disables"
+        " auto reload."
+    ),
+    default=1,
+    show_default=True,
+)
+@click.option(
+    "--preload",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help=(
+        "Optional. Whether to load all the agents, and resolve their tools and"
+        " models, before serving requests."
+    ),
+)
 @fast_api_common_options()
 @adk_services_options()
 @deprecated_adk_services_options()
@@ -619,6 +641,8 @@ def cli_web(
     port: int = 8000,
     trace_to_cloud: bool = False,
     reload: bool = True,
+    workers: int = 1,
+    preload: bool = False,
     session_service_uri: Optional[str] = None,
     artifact_service_uri: Optional[str] = None,
     memory_service_uri: Optional[str] = None,
@@ -661,20 +685,33 @@ def cli_web(
 
   session_service_uri = session_service_uri or session_db_url
   artifact_service_uri = artifact_service_uri or artifact_storage_uri
-  app = get_fast_api_app(
-      agents_dir=agents_dir,
-      session_service_uri=session_service_uri,
-      artifact_service_uri=artifact_service_uri,
-      memory_service_uri=memory_service_uri,
-      eval_storage_uri=eval_storage_uri,
-      allow_origins=allow_origins,
-      web=True,
-      trace_to_cloud=trace_to_cloud,
-      lifespan=_lifespan,
-      a2a=a2a,
-      host=host,
-      port=port,
-  )
+  try:
+    app = get_fast_api_app(
+        agents_dir=agents_dir,
+        session_service_uri=session_service_uri,
+        artifact_service_uri=artifact_service_uri,
+        memory_service_uri=memory_service_uri,
+        eval_storage_uri=eval_storage_uri,
+        allow_origins=allow_origins,
+        web=True,
+        trace_to_cloud=trace_to_cloud,
+        lifespan=_lifespan,
+        a2a=a2a,
+        host=host,
+        port=port,
+        workers=workers,
+        preload=preload,
+    )
+  except ValueError as e:
+    raise click.ClickException(str(e)) from e
+  if workers > 1:
+    try:
+      worker_pool.run_worker_pool(
+          app, host=host, port=port, workers=workers, log_level=log_level
+      )
+    except ImportError as e:
+      raise click.ClickException(str(e)) from e
+    return
   config = uvicorn.Config(
       app,
       host=host,
@@ -694,6 +731,27 @@ def cli_web(
     default="127.0.0.1",
     show_default=True,
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help=(
+        "Optional. The number of worker processes. More than one worker"
+        " requires gunicorn and a shared --session_service_uri, and disables"
+        " auto reload."
+    ),
+    default=1,
+    show_default=True,
+)
+@click.option(
+    "--preload",
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help=(
+        "Optional. Whether to load all the agents, and resolve their tools and"
+        " models, before serving requests."
+    ),
+)
 @fast_api_common_options()
 @adk_services_options()
 @deprecated_adk_services_options()
@@ -715,6 +773,8 @@ def cli_api_server(
     port: int = 8000,
     trace_to_cloud: bool = False,
     reload: bool = True,
+    workers: int = 1,
+    preload: bool = False,
     session_service_uri: Optional[str] = None,
     artifact_service_uri: Optional[str] = None,
     memory_service_uri: Optional[str] = None,
@@ -735,20 +795,34 @@ def cli_api_server(
 
   session_service_uri = session_service_uri or session_db_url
   artifact_service_uri = artifact_service_uri or artifact_storage_uri
+  try:
+    app = get_fast_api_app(
+        agents_dir=agents_dir,
+        session_service_uri=session_service_uri,
+        artifact_service_uri=artifact_service_uri,
+        memory_service_uri=memory_service_uri,
+        eval_storage_uri=eval_storage_uri,
+        allow_origins=allow_origins,
+        web=False,
+        trace_to_cloud=trace_to_cloud,
+        a2a=a2a,
+        host=host,
+        port=port,
+        workers=workers,
+        preload=preload,
+    )
+  except ValueError as e:
+    raise click.ClickException(str(e)) from e
+  if workers > 1:
+    try:
+      worker_pool.run_worker_pool(
+          app, host=host, port=port, workers=workers, log_level=log_level
+      )
+    except ImportError as e:
+      raise click.ClickException(str(e)) from e
+    return
   config = uvicorn.Config(
-      get_fast_api_app(
-          agents_dir=agents_dir,
-          session_service_uri=session_service_uri,
-          artifact_service_uri=artifact_service_uri,
-          memory_service_uri=memory_service_uri,
-          eval_storage_uri=eval_storage_uri,
-          allow_origins=allow_origins,
-          web=False,
-          trace_to_cloud=trace_to_cloud,
-          a2a=a2a,
-          host=host,
-          port=port,
-      ),
+      app,
       host=host,
       port=port,
       reload=reload,
@@ -30,10 +30,13 @@ from typing import Optional
 
 import click
 from fastapi import FastAPI
+from fastapi import Header
 from fastapi import HTTPException
 from fastapi import Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.responses import RedirectResponse
+from fastapi.responses import Response
 from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.websockets import WebSocket
@@ -44,8 +47,10 @@ from opentelemetry import trace
 from opentelemetry.exporter.cloud_trace import CloudTraceSpanExporter
 from opentelemetry.sdk.trace import export
 from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace import SynchronousMultiSpanProcessor
 from opentelemetry.sdk.trace import TracerProvider
 from pydantic import Field
+from pydantic import TypeAdapter
 from pydantic import ValidationError
 from starlette.types import Lifespan
 from typing_extensions import override
@@ -75,6 +80,7 @@ from ..sessions.database_session_service import DatabaseSessionService
 from ..sessions.in_memory_session_service import InMemorySessionService
 from ..sessions.session import Session
 from ..sessions.vertex_ai_session_service import VertexAiSessionService
+from ..telemetry import DeferredPayloadSpanProcessor
 from .cli_eval import EVAL_SESSION_ID_PREFIX
 from .cli_eval import EvalStatus
 from .utils import cleanup
@@ -83,59 +89,29 @@ from .utils import create_empty_state
 from .utils import envs
 from .utils import evals
 from .utils.agent_loader import AgentLoader
+from .utils.agent_warmup import AgentWarmupTiming
+from .utils.agent_warmup import warm_up_agent
+from .utils.span_store import SpanStore
+from .utils.worker_pool import validate_shared_services
 
 logger = logging.getLogger("google_adk." + __name__)
 
 _EVAL_SET_FILE_EXTENSION = ".evalset.json"
 
 
-class ApiServerSpanExporter(export.SpanExporter):
-
-  def __init__(self, trace_dict):
-    self.trace_dict = trace_dict
-
-  def export(
-      self, spans: typing.Sequence[ReadableSpan]
-  ) -> export.SpanExportResult:
-    for span in spans:
-      if (
-          span.name == "call_llm"
-          or span.name == "send_data"
-          or span.name.startswith("execute_tool")
-      ):
-        attributes = dict(span.attributes)
-        attributes["trace_id"] = span.get_span_context().trace_id
-        attributes["span_id"] = span.get_span_context().span_id
-        if attributes.get("gcp.vertex.agent.event_id", None):
-          self.trace_dict[attributes["gcp.vertex.agent.event_id"]] = attributes
-    return export.SpanExportResult.SUCCESS
-
-  def force_flush(self, timeout_millis: int = 30000) -> bool:
-    return True
-
-
 class InMemoryExporter(export.SpanExporter):
+  """Exports the spans to a SpanStore for the /debug/trace endpoints."""
 
-  def __init__(self, trace_dict):
+  def __init__(self, span_store: SpanStore):
     super().__init__()
-    self._spans = []
-    self.trace_dict = trace_dict
+    self.span_store = span_store
 
   @override
   def export(
       self, spans: typing.Sequence[ReadableSpan]
   ) -> export.SpanExportResult:
     for span in spans:
-      trace_id = span.context.trace_id
-      if span.name == "call_llm":
-        attributes = dict(span.attributes)
-        session_id = attributes.get("gcp.vertex.agent.session_id", None)
-        if session_id:
-          if session_id not in self.trace_dict:
-            self.trace_dict[session_id] = [trace_id]
-          else:
-            self.trace_dict[session_id] += [trace_id]
-    self._spans.extend(spans)
+      self.span_store.add(span)
     return export.SpanExportResult.SUCCESS
 
   @override
@@ -143,13 +119,164 @@ class InMemoryExporter(export.SpanExporter):
     return True
 
   def get_finished_spans(self, session_id: str):
-    trace_ids = self.trace_dict.get(session_id, None)
-    if trace_ids is None or not trace_ids:
-      return []
-    return [x for x in self._spans if x.context.trace_id in trace_ids]
+    return self.span_store.get_session_spans(session_id)
 
   def clear(self):
-    self._spans.clear()
+    self.span_store.clear()
+
+
+_DEFAULT_LIVE_INPUT_MIME_TYPE = "audio/pcm;rate=16000"
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Keeps proxies from buffering the streamed events.
+_STREAMING_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+# The maximum length of the serialized events logged at INFO.
+_MAX_LOGGED_EVENTS_LENGTH = 1000
+_EVENT_LIST_ADAPTER = TypeAdapter(list[Event])
+
+
+def _truncate_for_log(text: str) -> str:
+  if len(text) <= _MAX_LOGGED_EVENTS_LENGTH:
+    return text
+  return (
+      f"{text[:_MAX_LOGGED_EVENTS_LENGTH]}...<truncated"
+      f" {len(text) - _MAX_LOGGED_EVENTS_LENGTH} chars>"
+  )
+
+
+def _encode_event(event: Event, text_deltas: bool = False) -> str:
+  """Encodes an event as compact JSON.
+
+  Args:
+    event: The event to encode.
+    text_deltas: Whether to encode a partial event that only carries text as
+      its new text, in the `textDelta` field, without the rest of the event.
+
+  Returns:
+    The JSON of the event.
+  """
+  parts = event.content.parts if event.content else None
+  if (
+      text_deltas
+      and event.partial
+      and parts
+      and not event.error_code
+      and all(part.text is not None and not part.thought for part in parts)
+  ):
+    return json.dumps(
+        {
+            "id": event.id,
+            "invocationId": event.invocation_id,
+            "author": event.author,
+            "partial": True,
+            "textDelta": "".join(part.text for part in parts),
+        },
+        separators=(",", ":"),
+    )
+  return event.model_dump_json(exclude_none=True, by_alias=True)
+
+
+def _binary_header(event: Event, part_index: int) -> str:
+  """Returns the JSON header of the binary message of an inline data part."""
+  header = {
+      "eventId": event.id,
+      "invocationId": event.invocation_id,
+      "author": event.author,
+      "branch": event.branch,
+      "partIndex": part_index,
+      "mimeType": event.content.parts[part_index].inline_data.mime_type,
+  }
+  return json.dumps(
+      {"binaryHeader": {k: v for k, v in header.items() if v is not None}}
+  )
+
+
+def _split_inline_data(
+    event: Event,
+) -> tuple[Optional[str], list[tuple[str, bytes]]]:
+  """Splits the inline data out of an event, to send it in binary messages.
+
+  Each binary message is preceded by a JSON header, which tells the event, the
+  part and the MIME type of its data.
+
+  Args:
+    event: The event to send.
+
+  Returns:
+    The JSON of the event without the data of its inline data parts, or None if
+    the event only carries inline data, and the header and data of those parts,
+    in order.
+  """
+  parts = event.content.parts if event.content else None
+  inline_data_indexes = [
+      i
+      for i, part in enumerate(parts or [])
+      if part.inline_data and part.inline_data.data is not None
+  ]
+  if not inline_data_indexes:
+    return event.model_dump_json(exclude_none=True, by_alias=True), []
+  inline_data = [
+      (_binary_header(event, i), parts[i].inline_data.data)
+      for i in inline_data_indexes
+  ]
+  if (
+      len(inline_data_indexes) == len(parts)
+      and not any(part.text for part in parts)
+      and not event.turn_complete
+      and not event.interrupted
+      and not event.error_code
+  ):
+    return None, inline_data
+  event_json = event.model_dump_json(
+      exclude_none=True,
+      by_alias=True,
+      exclude={
+          "content": {
+              "parts": {
+                  i: {"inline_data": {"data"}} for i in inline_data_indexes
+              }
+          }
+      },
+  )
+  return event_json, inline_data
+
+
+def _parse_range_header(range_header: str, size: int) -> Optional[range]:
+  """Parses a single byte range of an HTTP Range header.
+
+  Args:
+    range_header: The value of the Range header, e.g. ``bytes=0-99``,
+      ``bytes=100-`` or ``bytes=-100``.
+    size: The size of the contents.
+
+  Returns:
+    The requested byte range, or None if the header is not a single byte range,
+    in which case the whole contents should be served.
+
+  Raises:
+    HTTPException: If the range is not satisfiable.
+  """
+  unit, _, ranges = range_header.partition("=")
+  if unit.strip().lower() != "bytes" or "," in ranges:
+    return None
+  first, sep, last = ranges.strip().partition("-")
+  if not sep:
+    return None
+  try:
+    if not first:
+      # A suffix range, with the number of bytes to serve from the end.
+      start, end = max(0, size - int(last)), size
+    else:
+      start = int(first)
+      end = min(int(last) + 1, size) if last else size
+  except ValueError:
+    return None
+  if start >= size or start >= end:
+    raise HTTPException(
+        status_code=416,
+        detail="Requested range not satisfiable",
+        headers={"Content-Range": f"bytes */{size}"},
+    )
+  return range(start, end)
 
 
 class AgentRunRequest(common.BaseModel):
@@ -158,6 +285,8 @@ class AgentRunRequest(common.BaseModel):
   session_id: str
   new_message: types.Content
   streaming: bool = False
+  text_deltas: bool = False
+  """Whether streamed partial text events only carry their new text."""
 
 
 class AddSessionToEvalSetRequest(common.BaseModel):
@@ -206,25 +335,34 @@ def get_fast_api_app(
     port: int = 8000,
     trace_to_cloud: bool = False,
     lifespan: Optional[Lifespan[FastAPI]] = None,
+    workers: int = 1,
+    preload: bool = False,
 ) -> FastAPI:
-  # InMemory tracing dict.
-  trace_dict: dict[str, Any] = {}
-  session_trace_dict: dict[str, Any] = {}
+  validate_shared_services(
+      workers=workers,
+      session_service_uri=session_service_uri,
+      artifact_service_uri=artifact_service_uri,
+      memory_service_uri=memory_service_uri,
+  )
 
   # Set up tracing in the FastAPI server.
+  span_store = SpanStore()
   provider = TracerProvider()
-  provider.add_span_processor(
-      export.SimpleSpanProcessor(ApiServerSpanExporter(trace_dict))
-  )
-  memory_exporter = InMemoryExporter(session_trace_dict)
-  provider.add_span_processor(export.SimpleSpanProcessor(memory_exporter))
+  # The processors share one DeferredPayloadSpanProcessor. The payloads of each
+  # span are serialized once, when first read: by the /debug/trace endpoints
+  # for the SpanStore, which does not read them when a span is added, or on
+  # the thread of the BatchSpanProcessor for Cloud Trace.
+  span_processor = SynchronousMultiSpanProcessor()
+  provider.add_span_processor(DeferredPayloadSpanProcessor(span_processor))
+  memory_exporter = InMemoryExporter(span_store)
+  span_processor.add_span_processor(export.SimpleSpanProcessor(memory_exporter))
   if trace_to_cloud:
     envs.load_dotenv_for_agent("", agents_dir)
     if project_id := os.environ.get("GOOGLE_CLOUD_PROJECT", None):
       processor = export.BatchSpanProcessor(
           CloudTraceSpanExporter(project_id=project_id)
       )
-      provider.add_span_processor(processor)
+      span_processor.add_span_processor(processor)
     else:
       logger.warning(
           "GOOGLE_CLOUD_PROJECT environment variable is not set. Tracing will"
@@ -233,10 +371,31 @@ def get_fast_api_app(
 
   trace.set_tracer_provider(provider)
 
+  # The timings of the preloaded apps, and the errors of the apps which failed
+  # to load.
+  preload_timings: dict[str, AgentWarmupTiming] = {}
+  preload_errors: dict[str, str] = {}
+  ready = not preload
+
   @asynccontextmanager
   async def internal_lifespan(app: FastAPI):
+    nonlocal ready
 
     try:
+      if preload:
+        # Each worker resolves the tools and models on its own event loop.
+        for app_name, timing in preload_timings.items():
+          await warm_up_agent(runner_dict[app_name].agent, timing)
+          logger.info(
+              "Preloaded %s in %.0f ms: load %.0f ms, tools %.0f ms, models"
+              " %.0f ms",
+              app_name,
+              timing.total_seconds * 1000,
+              timing.load_seconds * 1000,
+              timing.tools_seconds * 1000,
+              timing.models_seconds * 1000,
+          )
+        ready = True
       if lifespan:
         async with lifespan(app) as lifespan_context:
           yield lifespan_context
@@ -336,13 +495,8 @@ def get_fast_api_app(
   # initialize Agent Loader
   agent_loader = AgentLoader(agents_dir)
 
-  @app.get("/list-apps")
-  def list_apps() -> list[str]:
+  def _list_app_names() -> list[str]:
     base_path = Path.cwd() / agents_dir
-    if not base_path.exists():
-      raise HTTPException(status_code=404, detail="Path not found")
-    if not base_path.is_dir():
-      raise HTTPException(status_code=400, detail="Not a directory")
     agent_names = [
         x
         for x in os.listdir(base_path)
@@ -353,9 +507,46 @@ def get_fast_api_app(
     agent_names.sort()
     return agent_names
 
+  @app.get("/list-apps")
+  def list_apps() -> list[str]:
+    base_path = Path.cwd() / agents_dir
+    if not base_path.exists():
+      raise HTTPException(status_code=404, detail="Path not found")
+    if not base_path.is_dir():
+      raise HTTPException(status_code=400, detail="Not a directory")
+    return _list_app_names()
+
+  @app.get("/ready")
+  def get_readiness(app_name: Optional[str] = None) -> JSONResponse:
+    """Reports whether the preloaded apps are ready to serve requests.
+
+    The server is ready once the preloaded apps are warmed up, even if some of
+    them failed to load, and reports the status of each app. With `app_name`,
+    it is ready only if that app is.
+    """
+    app_statuses: dict[str, dict[str, str]] = {
+        name: {"status": "ready" if ready else "loading"}
+        for name in preload_timings
+    }
+    for name, error in preload_errors.items():
+      app_statuses[name] = {"status": "failed", "error": error}
+
+    if app_name in app_statuses:
+      is_ready = app_statuses[app_name]["status"] == "ready"
+    else:
+      # The apps which are not preloaded are loaded by their first request.
+      is_ready = ready
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "status": "ready" if is_ready else "not ready",
+            "apps": app_statuses,
+        },
+    )
+
   @app.get("/debug/trace/{event_id}")
   def get_trace_dict(event_id: str) -> Any:
-    event_dict = trace_dict.get(event_id, None)
+    event_dict = span_store.get_event_attributes(event_id)
     if event_dict is None:
       raise HTTPException(status_code=404, detail="Trace not found")
     return event_dict
@@ -691,6 +882,42 @@ def get_fast_api_app(
         app_name=app_name, user_id=user_id, session_id=session_id
     )
 
+  async def _stream_artifact(
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      artifact_name: str,
+      version: Optional[int],
+      range_header: str,
+  ) -> StreamingResponse:
+    """Streams the raw bytes of an artifact, or of the requested byte range."""
+    reader = await artifact_service.open_artifact_reader(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=artifact_name,
+        version=version,
+    )
+    if not reader:
+      raise HTTPException(status_code=404, detail="Artifact not found")
+    byte_range = _parse_range_header(range_header, reader.size)
+    headers = {"Accept-Ranges": "bytes"}
+    if byte_range is None:
+      headers["Content-Length"] = str(reader.size)
+      return StreamingResponse(
+          reader.iter_range(), media_type=reader.mime_type, headers=headers
+      )
+    headers["Content-Length"] = str(len(byte_range))
+    headers["Content-Range"] = (
+        f"bytes {byte_range.start}-{byte_range.stop - 1}/{reader.size}"
+    )
+    return StreamingResponse(
+        reader.iter_range(byte_range.start, byte_range.stop),
+        status_code=206,
+        media_type=reader.mime_type,
+        headers=headers,
+    )
+
   @app.get(
       "/apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts/{artifact_name}",
       response_model_exclude_none=True,
@@ -701,7 +928,14 @@ def get_fast_api_app(
       session_id: str,
       artifact_name: str,
       version: Optional[int] = Query(None),
+      range_header: Optional[str] = Header(None, alias="Range"),
   ) -> Optional[types.Part]:
+    # Range requests get the raw bytes of the artifact, streamed from the
+    # artifact service, instead of the JSON encoded part.
+    if range_header is not None:
+      return await _stream_artifact(
+          app_name, user_id, session_id, artifact_name, version, range_header
+      )
     artifact = await artifact_service.load_artifact(
         app_name=app_name,
         user_id=user_id,
@@ -723,7 +957,12 @@ def get_fast_api_app(
       session_id: str,
       artifact_name: str,
       version_id: int,
+      range_header: Optional[str] = Header(None, alias="Range"),
   ) -> Optional[types.Part]:
+    if range_header is not None:
+      return await _stream_artifact(
+          app_name, user_id, session_id, artifact_name, version_id, range_header
+      )
     artifact = await artifact_service.load_artifact(
         app_name=app_name,
         user_id=user_id,
@@ -773,14 +1012,45 @@ def get_fast_api_app(
         filename=artifact_name,
     )
 
-  @app.post("/run", response_model_exclude_none=True)
-  async def agent_run(req: AgentRunRequest) -> list[Event]:
+  @app.post(
+      "/run", response_model=list[Event], response_model_exclude_none=True
+  )
+  async def agent_run(
+      req: AgentRunRequest, accept: Optional[str] = Header(default=None)
+  ) -> Response:
     session = await session_service.get_session(
         app_name=req.app_name, user_id=req.user_id, session_id=req.session_id
     )
     if not session:
       raise HTTPException(status_code=404, detail="Session not found")
     runner = await _get_runner_async(req.app_name)
+
+    if accept and _NDJSON_MEDIA_TYPE in accept:
+      # Streams the events as newline delimited JSON, as they are generated.
+      async def ndjson_generator():
+        try:
+          stream_mode = (
+              StreamingMode.SSE if req.streaming else StreamingMode.NONE
+          )
+          async for event in runner.run_async(
+              user_id=req.user_id,
+              session_id=req.session_id,
+              new_message=req.new_message,
+              run_config=RunConfig(streaming_mode=stream_mode),
+          ):
+            event_json = _encode_event(event, req.text_deltas)
+            logger.debug("Generated event in agent run: %s", event_json)
+            yield event_json + "\n"
+        except Exception as e:
+          logger.exception("Error in ndjson_generator: %s", e)
+          yield json.dumps({"error": str(e)}) + "\n"
+
+      return StreamingResponse(
+          ndjson_generator(),
+          media_type=_NDJSON_MEDIA_TYPE,
+          headers=_STREAMING_HEADERS,
+      )
+
     events = [
         event
         async for event in runner.run_async(
@@ -789,8 +1059,18 @@ def get_fast_api_app(
             new_message=req.new_message,
         )
     ]
-    logger.info("Generated %s events in agent run: %s", len(events), events)
-    return events
+    # Serializes the events once, rather than having FastAPI validate them
+    # against the response model before serializing them.
+    events_json = _EVENT_LIST_ADAPTER.dump_json(
+        events, exclude_none=True, by_alias=True
+    )
+    if logger.isEnabledFor(logging.INFO):
+      logger.info(
+          "Generated %s events in agent run: %s",
+          len(events),
+          _truncate_for_log(events_json.decode()),
+      )
+    return Response(content=events_json, media_type="application/json")
 
   @app.post("/run_sse")
   async def agent_run_sse(req: AgentRunRequest) -> StreamingResponse:
@@ -813,8 +1093,11 @@ def get_fast_api_app(
             run_config=RunConfig(streaming_mode=stream_mode),
         ):
           # Format as SSE data
-          sse_event = event.model_dump_json(exclude_none=True, by_alias=True)
-          logger.info("Generated event in agent run streaming: %s", sse_event)
+          sse_event = _encode_event(event, req.text_deltas)
+          logger.info(
+              "Generated event in agent run streaming: %s",
+              _truncate_for_log(sse_event),
+          )
           yield f"data: {sse_event}\n\n"
       except Exception as e:
         logger.exception("Error in event_generator: %s", e)
@@ -825,6 +1108,7 @@ def get_fast_api_app(
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
+        headers=_STREAMING_HEADERS,
     )
 
   @app.get(
@@ -886,7 +1170,23 @@ def get_fast_api_app(
       modalities: List[Literal["TEXT", "AUDIO"]] = Query(
           default=["TEXT", "AUDIO"]
       ),  # Only allows "TEXT" or "AUDIO"
+      binary: bool = Query(default=False),
+      input_mime_type: str = Query(default=_DEFAULT_LIVE_INPUT_MIME_TYPE),
   ) -> None:
+    """Runs an agent in live mode over a WebSocket.
+
+    Text messages are JSON LiveRequests from the client, and JSON events to the
+    client. Binary messages from the client are realtime blobs of
+    `input_mime_type`, e.g. raw PCM audio frames.
+
+    If `binary` is set, the inline data of the events is sent to the client as
+    binary messages instead, one per inline data part, in order. Each binary
+    message follows a JSON header, `{"binaryHeader": {...}}`, with the id,
+    invocation id, author and branch of its event, the index of its part and
+    its MIME type. Events that only carry inline data, like the audio chunks
+    of the model, are sent as headers and binary messages alone. Other events
+    are first sent as JSON without the data of their inline data parts.
+    """
     await websocket.accept()
 
     session = await session_service.get_session(
@@ -905,16 +1205,35 @@ def get_fast_api_app(
       async for event in runner.run_live(
           session=session, live_request_queue=live_request_queue
       ):
-        await websocket.send_text(
-            event.model_dump_json(exclude_none=True, by_alias=True)
-        )
+        if not binary:
+          await websocket.send_text(
+              event.model_dump_json(exclude_none=True, by_alias=True)
+          )
+          continue
+        event_json, inline_data = _split_inline_data(event)
+        if event_json is not None:
+          await websocket.send_text(event_json)
+        for header, data in inline_data:
+          await websocket.send_text(header)
+          await websocket.send_bytes(data)
 
     async def process_messages():
       try:
         while True:
-          data = await websocket.receive_text()
+          message = await websocket.receive()
+          if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(
+                message.get("code", 1000), message.get("reason")
+            )
+          if message.get("bytes") is not None:
+            live_request_queue.send_realtime(
+                types.Blob(data=message["bytes"], mime_type=input_mime_type)
+            )
+            continue
           # Validate and send the received message to the live queue.
-          live_request_queue.send(LiveRequest.model_validate_json(data))
+          live_request_queue.send(
+              LiveRequest.model_validate_json(message["text"])
+          )
       except ValidationError as ve:
         logger.error("Validation error in process_messages: %s", ve)
 
@@ -947,6 +1266,9 @@ def get_fast_api_app(
 
   async def _get_runner_async(app_name: str) -> Runner:
     """Returns the runner for the given app."""
+    return _get_runner(app_name)
+
+  def _get_runner(app_name: str) -> Runner:
     envs.load_dotenv_for_agent(os.path.basename(app_name), agents_dir)
     if app_name in runner_dict:
       return runner_dict[app_name]
@@ -1064,4 +1386,19 @@ def get_fast_api_app(
         StaticFiles(directory=ANGULAR_DIST_PATH, html=True),
         name="static",
     )
+
+  if preload or workers > 1:
+    # Loads the agents before the server starts, and before the workers are
+    # forked, so that every worker starts with the agents imported.
+    for app_name in _list_app_names():
+      start = time.perf_counter()
+      try:
+        _get_runner(app_name)
+      except Exception as e:
+        logger.warning("Failed to preload agent %s: %s", app_name, e)
+        preload_errors[app_name] = str(e)
+        continue
+      preload_timings[app_name] = AgentWarmupTiming(
+          load_seconds=time.perf_counter() - start
+      )
   return app
@@ -0,0 +1,82 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Warms up the agents before they serve their first request."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Iterator
+
+from pydantic import BaseModel
+
+from ...agents.base_agent import BaseAgent
+from ...agents.llm_agent import LlmAgent
+
+logger = logging.getLogger("google_adk." + __name__)
+
+
+class AgentWarmupTiming(BaseModel):
+  """The time spent warming up an agent, in seconds."""
+
+  load_seconds: float = 0.0
+  """Importing the agent module and creating its runner."""
+  tools_seconds: float = 0.0
+  """Resolving the tools and toolsets of the agents."""
+  models_seconds: float = 0.0
+  """Resolving the models of the agents and creating their clients."""
+
+  @property
+  def total_seconds(self) -> float:
+    return self.load_seconds + self.tools_seconds + self.models_seconds
+
+
+def _walk_agents(agent: BaseAgent) -> Iterator[BaseAgent]:
+  yield agent
+  for sub_agent in agent.sub_agents:
+    yield from _walk_agents(sub_agent)
+
+
+async def warm_up_agent(root_agent: BaseAgent, timing: AgentWarmupTiming):
+  """Resolves the tools and models of all the LLM agents of an agent tree.
+
+  Toolsets fetch and parse their specs, and model clients are created, so that
+  the first request does not pay for it and errors show up at startup. A
+  failure is logged, and leaves the resolution to the first request.
+
+  Args:
+    root_agent: The root agent of the tree.
+    timing: The timing to record the time spent into.
+  """
+  for agent in _walk_agents(root_agent):
+    if not isinstance(agent, LlmAgent):
+      continue
+
+    start = time.perf_counter()
+    try:
+      await agent.canonical_tools()
+    except Exception as e:
+      logger.warning("Failed to resolve the tools of %s: %s", agent.name, e)
+    timing.tools_seconds += time.perf_counter() - start
+
+    start = time.perf_counter()
+    try:
+      model = agent.canonical_model
+      # Creating a client pays for the lazy imports of the model SDK, and
+      # checks its credentials.
+      getattr(model, "api_client", None)
+    except Exception as e:
+      logger.warning("Failed to resolve the model of %s: %s", agent.name, e)
+    timing.models_seconds += time.perf_counter() - start
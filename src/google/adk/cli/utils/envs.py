@@ -14,11 +14,15 @@
 
 import logging
 import os
+from typing import Optional
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 logger = logging.getLogger(__file__)
 
+# The parsed .env files, with the modification time they were parsed at.
+_dotenv_cache: dict[str, tuple[int, dict[str, Optional[str]]]] = {}
+
 
 def _walk_to_root_until_found(folder, filename) -> str:
   checkpath = os.path.join(folder, filename)
@@ -32,6 +36,16 @@ def _walk_to_root_until_found(folder, filename) -> str:
   return _walk_to_root_until_found(parent_folder, filename)
 
 
+def _read_dotenv(dotenv_file_path: str) -> dict[str, Optional[str]]:
+  """Returns the variables of a .env file, parsing it again once it changed."""
+  mtime = os.stat(dotenv_file_path).st_mtime_ns
+  cached = _dotenv_cache.get(dotenv_file_path)
+  if cached is None or cached[0] != mtime:
+    cached = (mtime, dotenv_values(dotenv_file_path, verbose=True))
+    _dotenv_cache[dotenv_file_path] = cached
+  return cached[1]
+
+
 def load_dotenv_for_agent(
     agent_name: str, agent_parent_folder: str, filename: str = '.env'
 ):
@@ -43,7 +57,10 @@ def load_dotenv_for_agent(
   )
   dotenv_file_path = _walk_to_root_until_found(starting_folder, filename)
   if dotenv_file_path:
-    load_dotenv(dotenv_file_path, override=True, verbose=True)
+    # Overrides the variables of the app loaded before, as load_dotenv does.
+    for key, value in _read_dotenv(dotenv_file_path).items():
+      if value is not None:
+        os.environ[key] = value
     logger.info(
         'Loaded %s file for %s at %s',
         filename,
@@ -0,0 +1,213 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+from typing import Optional
+
+from opentelemetry.sdk.trace import ReadableSpan
+
+from ...telemetry import DeferredPayloadSpan
+
+DEFAULT_MAX_SPANS = 10000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SESSION_ID_ATTRIBUTE = "gcp.vertex.agent.session_id"
+_EVENT_ID_ATTRIBUTE = "gcp.vertex.agent.event_id"
+# The estimated overhead of a span, besides its attributes.
+_SPAN_OVERHEAD_BYTES = 256
+
+
+def _is_event_span(span: ReadableSpan) -> bool:
+  return (
+      span.name == "call_llm"
+      or span.name == "send_data"
+      or span.name.startswith("execute_tool")
+  )
+
+
+def _attributes_without_payloads(span: ReadableSpan):
+  """Returns the attributes of a span, without serializing its payloads."""
+  if isinstance(span, DeferredPayloadSpan):
+    return span.attributes_without_payloads or {}
+  return span.attributes or {}
+
+
+def _estimate_size(span: ReadableSpan) -> int:
+  size = _SPAN_OVERHEAD_BYTES
+  if isinstance(span, DeferredPayloadSpan):
+    size += span.estimate_payloads_size()
+  for key, value in _attributes_without_payloads(span).items():
+    size += len(key)
+    if isinstance(value, (str, bytes)):
+      size += len(value)
+    elif isinstance(value, (list, tuple)):
+      size += sum(len(v) if isinstance(v, str) else 8 for v in value)
+    else:
+      size += 8
+  return size
+
+
+class _Entry(NamedTuple):
+  span: ReadableSpan
+  size: int
+  added_at: float
+
+
+class SpanStore:
+  """Keeps the most recent finished spans, indexed by trace, session and event.
+
+  The oldest spans are evicted once there are more than `max_spans` of them,
+  once their estimated size exceeds `max_bytes`, or once they are older than
+  `ttl_seconds`. Lookups take time proportional to the number of results.
+
+  The store is thread-safe, as spans end on any thread. The deferred payloads
+  of the spans are not serialized when the spans are added, but when their
+  attributes are first read.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_spans: int = DEFAULT_MAX_SPANS,
+      max_bytes: int = DEFAULT_MAX_BYTES,
+      ttl_seconds: Optional[float] = None,
+      clock: Callable[[], float] = time.monotonic,
+  ):
+    """Initializes the SpanStore.
+
+    Args:
+      max_spans: The maximum number of spans to keep.
+      max_bytes: The maximum estimated size of the spans to keep.
+      ttl_seconds: How long spans are kept. Spans are kept until evicted by
+        the other limits if not set.
+      clock: Returns the current time in seconds.
+    """
+    self._max_spans = max_spans
+    self._max_bytes = max_bytes
+    self._ttl_seconds = ttl_seconds
+    self._clock = clock
+    self._lock = threading.Lock()
+    self._next_key = 0
+    self._total_bytes = 0
+    # Spans by insertion key, oldest first.
+    self._entries: collections.OrderedDict[int, _Entry] = (
+        collections.OrderedDict()
+    )
+    # Dicts are used as insertion-ordered sets.
+    self._trace_keys: dict[int, dict[int, None]] = {}
+    self._session_traces: dict[str, dict[int, None]] = {}
+    self._trace_sessions: dict[int, dict[str, None]] = {}
+    self._event_keys: dict[str, int] = {}
+
+  def __len__(self) -> int:
+    with self._lock:
+      return len(self._entries)
+
+  def add(self, span: ReadableSpan) -> None:
+    """Adds a finished span, and evicts the spans beyond the limits."""
+    with self._lock:
+      key = self._next_key
+      self._next_key += 1
+      entry = _Entry(span, _estimate_size(span), self._clock())
+      self._entries[key] = entry
+      self._total_bytes += entry.size
+
+      trace_id = span.context.trace_id
+      self._trace_keys.setdefault(trace_id, {})[key] = None
+      attributes = _attributes_without_payloads(span)
+      session_id = attributes.get(_SESSION_ID_ATTRIBUTE)
+      if span.name == "call_llm" and session_id:
+        self._session_traces.setdefault(session_id, {})[trace_id] = None
+        self._trace_sessions.setdefault(trace_id, {})[session_id] = None
+      event_id = attributes.get(_EVENT_ID_ATTRIBUTE)
+      if event_id and _is_event_span(span):
+        self._event_keys[event_id] = key
+
+      self._evict()
+
+  def get_session_spans(self, session_id: str) -> list[ReadableSpan]:
+    """Returns the spans of the traces of a session, in the order added."""
+    with self._lock:
+      self._evict()
+      keys = []
+      for trace_id in self._session_traces.get(session_id, ()):
+        keys.extend(self._trace_keys.get(trace_id, ()))
+      keys.sort()
+      return [self._entries[key].span for key in keys]
+
+  def get_event_attributes(self, event_id: str) -> Optional[dict[str, Any]]:
+    """Returns the attributes of the latest span of an event, if any."""
+    with self._lock:
+      self._evict()
+      key = self._event_keys.get(event_id)
+      if key is None:
+        return None
+      span = self._entries[key].span
+    attributes = dict(span.attributes)
+    attributes["trace_id"] = span.get_span_context().trace_id
+    attributes["span_id"] = span.get_span_context().span_id
+    return attributes
+
+  def clear(self) -> None:
+    """Removes all the spans."""
+    with self._lock:
+      self._entries.clear()
+      self._trace_keys.clear()
+      self._session_traces.clear()
+      self._trace_sessions.clear()
+      self._event_keys.clear()
+      self._total_bytes = 0
+
+  def _evict(self) -> None:
+    expires_before = (
+        self._clock() - self._ttl_seconds
+        if self._ttl_seconds is not None
+        else None
+    )
+    while self._entries:
+      key, entry = next(iter(self._entries.items()))
+      if (
+          len(self._entries) <= self._max_spans
+          and self._total_bytes <= self._max_bytes
+          and (expires_before is None or entry.added_at >= expires_before)
+      ):
+        return
+      self._remove(key, entry)
+
+  def _remove(self, key: int, entry: _Entry) -> None:
+    del self._entries[key]
+    self._total_bytes -= entry.size
+    span = entry.span
+
+    trace_id = span.context.trace_id
+    trace_keys = self._trace_keys[trace_id]
+    del trace_keys[key]
+    if not trace_keys:
+      del self._trace_keys[trace_id]
+      for session_id in self._trace_sessions.pop(trace_id, ()):
+        session_traces = self._session_traces[session_id]
+        del session_traces[trace_id]
+        if not session_traces:
+          del self._session_traces[session_id]
+
+    event_id = _attributes_without_payloads(span).get(_EVENT_ID_ATTRIBUTE)
+    if event_id and self._event_keys.get(event_id) == key:
+      del self._event_keys[event_id]
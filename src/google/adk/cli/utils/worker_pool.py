@@ -0,0 +1,138 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Serves the FastAPI app from a pool of worker processes."""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from fastapi import FastAPI
+
+logger = logging.getLogger("google_adk." + __name__)
+
+# The seconds given to the workers to finish their requests, e.g. live
+# sessions, when the server shuts down.
+_GRACEFUL_TIMEOUT_SECONDS = 30
+
+
+def _is_shared_session_service_uri(session_service_uri: Optional[str]) -> bool:
+  if not session_service_uri:
+    return False
+  # An SQLite database without a file path lives in the memory of a process.
+  return session_service_uri.rstrip("/") not in (
+      "sqlite:",
+      "sqlite+aiosqlite:",
+  ) and not session_service_uri.endswith(":memory:")
+
+
+def validate_shared_services(
+    *,
+    workers: int,
+    session_service_uri: Optional[str],
+    artifact_service_uri: Optional[str],
+    memory_service_uri: Optional[str],
+) -> None:
+  """Validates that the services are shared by the workers of a pool.
+
+  Each worker builds its own services, so the in-memory services are not
+  shared, and a session created by a request would not be found by the next
+  request if it is routed to another worker.
+
+  Args:
+    workers: The number of worker processes.
+    session_service_uri: The URI of the session service.
+    artifact_service_uri: The URI of the artifact service.
+    memory_service_uri: The URI of the memory service.
+
+  Raises:
+    ValueError: If the session service is not shared.
+  """
+  if workers <= 1:
+    return
+  if not _is_shared_session_service_uri(session_service_uri):
+    raise ValueError(
+        f"Serving with {workers} workers requires a session service shared"
+        " by the workers, e.g. --session_service_uri=sqlite:///sessions.db or"
+        " agentengine://<agent_engine_resource_id>."
+    )
+  if not artifact_service_uri:
+    logger.warning(
+        "Each of the %s workers uses its own in-memory artifact service. Set"
+        " --artifact_service_uri for agents that save artifacts.",
+        workers,
+    )
+  if not memory_service_uri:
+    logger.warning(
+        "Each of the %s workers uses its own in-memory memory service. Set"
+        " --memory_service_uri for agents that use memory.",
+        workers,
+    )
+  logger.warning(
+      "Each of the %s workers only serves the traces of its own requests"
+      " from the /debug/trace endpoints.",
+      workers,
+  )
+
+
+def run_worker_pool(
+    app: FastAPI,
+    *,
+    host: str,
+    port: int,
+    workers: int,
+    log_level: str = "info",
+) -> None:
+  """Serves the app from a pool of uvicorn workers managed by gunicorn.
+
+  The app is built before the workers are forked, so the agents it preloads
+  are imported once and shared by the workers. The workers accept the
+  connections from a shared socket, and a WebSocket stays on the worker that
+  accepted it for its lifetime, so a live session is never split across
+  workers. The pooled database connections of the services built before the
+  fork are dropped by each worker, see `DatabaseSessionService`.
+
+  Args:
+    app: The app to serve.
+    host: The binding host of the server.
+    port: The port of the server.
+    workers: The number of worker processes.
+    log_level: The log level of the server.
+
+  Raises:
+    ImportError: If gunicorn is not installed.
+  """
+  try:
+    from gunicorn.app.base import BaseApplication
+  except ImportError as e:
+    raise ImportError(
+        "Serving with more than one worker requires gunicorn. Please install"
+        " it with `pip install gunicorn`."
+    ) from e
+
+  class _Application(BaseApplication):
+
+    def load_config(self):
+      self.cfg.set("bind", f"{host}:{port}")
+      self.cfg.set("workers", workers)
+      self.cfg.set("worker_class", "uvicorn.workers.UvicornWorker")
+      self.cfg.set("preload_app", True)
+      self.cfg.set("graceful_timeout", _GRACEFUL_TIMEOUT_SECONDS)
+      self.cfg.set("loglevel", log_level.lower())
+
+    def load(self):
+      return app
+
+  _Application().run()
@@ -12,40 +12,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging
+import importlib.util
+from typing import TYPE_CHECKING
 
-from .base_code_executor import BaseCodeExecutor
-from .built_in_code_executor import BuiltInCodeExecutor
-from .code_executor_context import CodeExecutorContext
-from .unsafe_local_code_executor import UnsafeLocalCodeExecutor
+from ..utils.lazy_imports import lazy_getattr
 
-logger = logging.getLogger('google_adk.' + __name__)
+if TYPE_CHECKING:
+  from .base_code_executor import BaseCodeExecutor
+  from .built_in_code_executor import BuiltInCodeExecutor
+  from .code_executor_context import CodeExecutorContext
+  from .container_code_executor import ContainerCodeExecutor
+  from .unsafe_local_code_executor import UnsafeLocalCodeExecutor
+  from .vertex_ai_code_executor import VertexAiCodeExecutor
+
+# The code executors are imported on first access, as the Vertex AI and
+# container ones depend on heavy libraries.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'BaseCodeExecutor': '.base_code_executor',
+        'BuiltInCodeExecutor': '.built_in_code_executor',
+        'CodeExecutorContext': '.code_executor_context',
+        'ContainerCodeExecutor': '.container_code_executor',
+        'UnsafeLocalCodeExecutor': '.unsafe_local_code_executor',
+        'VertexAiCodeExecutor': '.vertex_ai_code_executor',
+    },
+)
 
 __all__ = [
     'BaseCodeExecutor',
     'BuiltInCodeExecutor',
     'CodeExecutorContext',
     'UnsafeLocalCodeExecutor',
+    'VertexAiCodeExecutor',
 ]
 
-try:
-  from .vertex_ai_code_executor import VertexAiCodeExecutor
-
-  __all__.append('VertexAiCodeExecutor')
-except ImportError:
-  logger.debug(
-      'The Vertex sdk is not installed. If you want to use the Vertex Code'
-      ' Interpreter with agents, please install it. If not, you can ignore this'
-      ' warning.'
-  )
-
-try:
-  from .container_code_executor import ContainerCodeExecutor
-
+# ContainerCodeExecutor requires docker, which is an optional dependency.
+if importlib.util.find_spec('docker') is not None:
   __all__.append('ContainerCodeExecutor')
-except ImportError:
-  logger.debug(
-      'The docker sdk is not installed. If you want to use the Container Code'
-      ' Executor with agents, please install it. If not, you can ignore this'
-      ' warning.'
-  )
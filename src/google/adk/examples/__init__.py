@@ -12,17 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .base_example_provider import BaseExampleProvider
-from .example import Example
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+  from .base_example_provider import BaseExampleProvider
+  from .example import Example
+  from .vertex_ai_example_store import VertexAiExampleStore
+
+# VertexAiExampleStore is imported on first access, as the Vertex AI SDK is a
+# heavy library.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'BaseExampleProvider': '.base_example_provider',
+        'Example': '.example',
+        'VertexAiExampleStore': '.vertex_ai_example_store',
+    },
+)
 
 __all__ = [
     'BaseExampleProvider',
     'Example',
+    'VertexAiExampleStore',
 ]
-
-try:
-  from .vertex_ai_example_store import VertexAiExampleStore
-
-  __all__.append('VertexAiExampleStore')
-except ImportError:
-  pass
@@ -81,7 +81,8 @@ class AudioTranscriber:
       bundled_audio.append((current_speaker, current_audio_data))
 
     # reset cache
-    invocation_context.transcription_cache = []
+    if invocation_context.transcription_cache is not None:
+      invocation_context.transcription_cache.clear()
 
     # Step2: transcription
     for speaker, data in bundled_audio:
@@ -34,6 +34,7 @@ from ...agents.invocation_context import InvocationContext
 from ...agents.live_request_queue import LiveRequestQueue
 from ...agents.readonly_context import ReadonlyContext
 from ...agents.run_config import StreamingMode
+from ...agents.transcription_entry import TranscriptionCache
 from ...agents.transcription_entry import TranscriptionEntry
 from ...events.event import Event
 from ...models.base_llm_connection import BaseLlmConnection
@@ -42,6 +43,7 @@ from ...models.llm_response import LlmResponse
 from ...telemetry import trace_call_llm
 from ...telemetry import trace_send_data
 from ...telemetry import tracer
+from ...tools.preload_memory_tool import PreloadMemoryTool
 from ...tools.tool_context import ToolContext
 
 if TYPE_CHECKING:
@@ -55,6 +57,15 @@ logger = logging.getLogger('google_adk.' + __name__)
 _ADK_AGENT_NAME_LABEL_KEY = 'adk_agent_name'
 
 
+def _cache_transcription_entry(
+    invocation_context: InvocationContext, entry: TranscriptionEntry
+) -> None:
+  """Caches an entry for transcription in the ring buffer of the invocation."""
+  if invocation_context.transcription_cache is None:
+    invocation_context.transcription_cache = TranscriptionCache()
+  invocation_context.transcription_cache.append(entry)
+
+
 class BaseLlmFlow(ABC):
   """A basic flow that calls the LLM in a loop until a final response is generated.
 
@@ -168,41 +179,31 @@ class BaseLlmFlow(ABC):
     """Sends data to model."""
     while True:
       live_request_queue = invocation_context.live_request_queue
-      try:
-        # Streamlit's execution model doesn't preemptively yield to the event
-        # loop. Therefore, we must explicitly introduce timeouts to allow the
-        # event loop to process events.
-        # TODO: revert back(remove timeout) once we move off streamlit.
-        live_request = await asyncio.wait_for(
-            live_request_queue.get(), timeout=0.25
-        )
-        # duplicate the live_request to all the active streams
-        logger.debug(
-            'Sending live request %s to active streams: %s',
-            live_request,
-            invocation_context.active_streaming_tools,
-        )
-        if invocation_context.active_streaming_tools:
-          for active_streaming_tool in (
-              invocation_context.active_streaming_tools
-          ).values():
-            if active_streaming_tool.stream:
-              active_streaming_tool.stream.send(live_request)
-        await asyncio.sleep(0)
-      except asyncio.TimeoutError:
-        continue
+      # Waits for the next request without polling, so an idle connection
+      # costs no wakeups.
+      live_request = await live_request_queue.get()
+      # duplicate the live_request to all the active streams
+      logger.debug(
+          'Sending live request %s to active streams: %s',
+          live_request,
+          invocation_context.active_streaming_tools,
+      )
+      if invocation_context.active_streaming_tools:
+        for active_streaming_tool in (
+            invocation_context.active_streaming_tools
+        ).values():
+          if active_streaming_tool.stream:
+            active_streaming_tool.stream.send(live_request)
       if live_request.close:
         await llm_connection.close()
         return
       if live_request.blob:
-        # Cache audio data here for transcription
-        if not invocation_context.transcription_cache:
-          invocation_context.transcription_cache = []
         if not invocation_context.run_config.input_audio_transcription:
           # if the live model's input transcription is not enabled, then
           # we use our onwn audio transcriber to achieve that.
-          invocation_context.transcription_cache.append(
-              TranscriptionEntry(role='user', data=live_request.blob)
+          _cache_transcription_entry(
+              invocation_context,
+              TranscriptionEntry(role='user', data=live_request.blob),
           )
         await llm_connection.send_realtime(live_request.blob)
       if live_request.content:
@@ -243,6 +244,7 @@ class BaseLlmFlow(ABC):
               id=Event.new_id(),
               invocation_id=invocation_context.invocation_id,
               author=get_author_for_event(llm_response),
+              branch=invocation_context.branch,
           )
           async for event in self._postprocess_live(
               invocation_context,
@@ -261,12 +263,11 @@ class BaseLlmFlow(ABC):
               # transcription.
               # when input transcription enabled, it will contain user
               # transcription.
-              if not invocation_context.transcription_cache:
-                invocation_context.transcription_cache = []
-              invocation_context.transcription_cache.append(
+              _cache_transcription_entry(
+                  invocation_context,
                   TranscriptionEntry(
                       role=event.content.role, data=event.content
-                  )
+                  ),
               )
             yield event
         # Give opportunity for other tasks to run.
@@ -333,15 +334,20 @@ class BaseLlmFlow(ABC):
     if not isinstance(agent, LlmAgent):
       return
 
+    tools = await agent.canonical_tools(ReadonlyContext(invocation_context))
+
+    # Starts memory preloading early, so that it overlaps with the processors.
+    for tool in tools:
+      if isinstance(tool, PreloadMemoryTool) and tool.prefetch:
+        tool.start_memory_search(invocation_context)
+
     # Runs processors.
     for processor in self.request_processors:
       async for event in processor.run_async(invocation_context, llm_request):
         yield event
 
     # Run processors for tools.
-    for tool in await agent.canonical_tools(
-        ReadonlyContext(invocation_context)
-    ):
+    for tool in tools:
       tool_context = ToolContext(invocation_context)
       await tool.process_llm_request(
           tool_context=tool_context, llm_request=llm_request
@@ -11,13 +11,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import logging
+import importlib.util
+from typing import TYPE_CHECKING
 
-from .base_memory_service import BaseMemoryService
-from .in_memory_memory_service import InMemoryMemoryService
-from .vertex_ai_memory_bank_service import VertexAiMemoryBankService
+from ..utils.lazy_imports import lazy_getattr
 
-logger = logging.getLogger('google_adk.' + __name__)
+if TYPE_CHECKING:
+  from .base_memory_service import BaseMemoryService
+  from .in_memory_memory_service import InMemoryMemoryService
+  from .local_vector_memory_service import LocalVectorMemoryService
+  from .vertex_ai_memory_bank_service import VertexAiMemoryBankService
+  from .vertex_ai_rag_memory_service import VertexAiRagMemoryService
+
+# The memory services are imported on first access, as the Vertex AI ones
+# depend on heavy libraries.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'BaseMemoryService': '.base_memory_service',
+        'InMemoryMemoryService': '.in_memory_memory_service',
+        'LocalVectorMemoryService': '.local_vector_memory_service',
+        'VertexAiMemoryBankService': '.vertex_ai_memory_bank_service',
+        'VertexAiRagMemoryService': '.vertex_ai_rag_memory_service',
+    },
+)
 
 __all__ = [
     'BaseMemoryService',
@@ -25,13 +42,11 @@ __all__ = [
     'VertexAiMemoryBankService',
 ]
 
-try:
-  from .vertex_ai_rag_memory_service import VertexAiRagMemoryService
+# LocalVectorMemoryService requires numpy, which is an optional dependency.
+if importlib.util.find_spec('numpy') is not None:
+  __all__.append('LocalVectorMemoryService')
 
+# VertexAiRagMemoryService requires the Vertex SDK, which is an optional
+# dependency.
+if importlib.util.find_spec('vertexai') is not None:
   __all__.append('VertexAiRagMemoryService')
-except ImportError:
-  logger.debug(
-      'The Vertex SDK is not installed. If you want to use the'
-      ' VertexAiRagMemoryService please install it. If not, you can ignore this'
-      ' warning.'
-  )
@@ -16,8 +16,62 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Optional
+from typing import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from ..events.event import Event
 
 
 def format_timestamp(timestamp: float) -> str:
   """Formats the timestamp of the memory entry."""
   return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def find_last_event_index(events: Sequence[Event], event_id: str) -> int:
+  """Returns the index of the last event with the given id, or -1."""
+  for index in range(len(events) - 1, -1, -1):
+    if events[index].id == event_id:
+      return index
+  return -1
+
+
+def events_after_watermark(
+    events: Sequence[Event], watermark: Optional[tuple[str, float]]
+) -> list[Event]:
+  """Returns the events added after the watermark.
+
+  Args:
+    events: The events of the session, in order.
+    watermark: The id and timestamp of the last event already ingested, or None
+      if no event was ingested.
+
+  Returns:
+    The events after the watermark event. If the watermark event is no longer
+    in the session, the events not older than the watermark timestamp, so that
+    no event is missed.
+  """
+  if watermark is None:
+    return list(events)
+  event_id, timestamp = watermark
+  index = find_last_event_index(events, event_id)
+  if index >= 0:
+    return list(events[index + 1 :])
+  return [event for event in events if event.timestamp >= timestamp]
+
+
+def advance_watermark(
+    watermarks: dict[tuple[str, str, str], tuple[str, float]],
+    session_key: tuple[str, str, str],
+    events: Sequence[Event],
+) -> None:
+  """Moves the watermark of a session to the last of the ingested events.
+
+  The watermark is never moved back to an older event.
+  """
+  if not events:
+    return
+  watermark = watermarks.get(session_key)
+  if watermark is None or events[-1].timestamp >= watermark[1]:
+    watermarks[session_key] = (events[-1].id, events[-1].timestamp)
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -25,6 +26,7 @@ from pydantic import Field
 from .memory_entry import MemoryEntry
 
 if TYPE_CHECKING:
+  from ..events.event import Event
   from ..sessions.session import Session
 
 
@@ -52,12 +54,46 @@ class BaseMemoryService(ABC):
   ):
     """Adds a session to the memory service.
 
-    A session may be added multiple times during its lifetime.
+    A session may be added multiple times during its lifetime. The built-in
+    services keep a watermark per session, and only ingest the events added
+    since the session was last added.
 
     Args:
         session: The session to add.
     """
 
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ):
+    """Adds events of a session to the memory service.
+
+    Use this to ingest the new events of a session, e.g. after each turn,
+    without passing the whole session.
+
+    The default implementation adds a session holding only the given events.
+
+    Args:
+        app_name: The name of the application.
+        user_id: The id of the user.
+        session_id: The id of the session the events belong to.
+        events: The events to add, in order.
+    """
+    from ..sessions.session import Session
+
+    await self.add_session_to_memory(
+        Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id,
+            events=list(events),
+        )
+    )
+
   @abstractmethod
   async def search_memory(
       self,
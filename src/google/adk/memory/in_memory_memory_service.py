@@ -13,7 +13,12 @@
 # limitations under the License.
 from __future__ import annotations
 
+import collections
+import heapq
+import math
 import re
+from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
@@ -32,64 +37,183 @@ def _user_key(app_name: str, user_id: str):
   return f'{app_name}/{user_id}'
 
 
-def _extract_words_lower(text: str) -> set[str]:
+def _extract_words_lower(text: str) -> list[str]:
   """Extracts words from a string and converts them to lowercase."""
-  return set([word.lower() for word in re.findall(r'[A-Za-z]+', text)])
+  return [word.lower() for word in re.findall(r'[A-Za-z]+', text)]
+
+
+class _UserIndex:
+  """An inverted index over the events of one user, scored with BM25."""
+
+  def __init__(self):
+    self.events: dict[int, Event] = {}
+    """Keys are document ids, values are the indexed events."""
+    self.doc_lengths: dict[int, int] = {}
+    """Keys are document ids, values are the number of words in the event."""
+    self.postings: dict[str, dict[int, int]] = collections.defaultdict(dict)
+    """Keys are words, values map document ids to the word frequency."""
+    self.session_docs: dict[str, dict[str, int]] = {}
+    """Keys are session ids, values map event ids to document ids."""
+    self.total_length = 0
+    self._next_doc_id = 0
+
+  def add_event(self, session_id: str, event: Event) -> None:
+    if not event.content or not event.content.parts:
+      return
+    words = _extract_words_lower(
+        ' '.join([part.text for part in event.content.parts if part.text])
+    )
+    if not words:
+      return
+    doc_id = self._next_doc_id
+    self._next_doc_id += 1
+    self.events[doc_id] = event
+    self.doc_lengths[doc_id] = len(words)
+    self.total_length += len(words)
+    for word, frequency in collections.Counter(words).items():
+      self.postings[word][doc_id] = frequency
+    self.session_docs.setdefault(session_id, {})[event.id] = doc_id
+
+  def remove_doc(self, doc_id: int) -> None:
+    event = self.events.pop(doc_id)
+    self.total_length -= self.doc_lengths.pop(doc_id)
+    for word in set(
+        _extract_words_lower(
+            ' '.join([part.text for part in event.content.parts if part.text])
+        )
+    ):
+      postings = self.postings[word]
+      postings.pop(doc_id, None)
+      if not postings:
+        del self.postings[word]
+
+  def search(
+      self, words: set[str], k1: float, b: float, top_k: Optional[int]
+  ) -> list[Event]:
+    num_docs = len(self.events)
+    if not num_docs:
+      return []
+    avg_length = self.total_length / num_docs
+    scores: dict[int, float] = collections.defaultdict(float)
+    for word in words:
+      postings = self.postings.get(word)
+      if not postings:
+        continue
+      doc_frequency = len(postings)
+      idf = math.log(
+          1 + (num_docs - doc_frequency + 0.5) / (doc_frequency + 0.5)
+      )
+      for doc_id, frequency in postings.items():
+        length_norm = k1 * (1 - b + b * self.doc_lengths[doc_id] / avg_length)
+        scores[doc_id] += idf * frequency * (k1 + 1) / (frequency + length_norm)
+
+    # Ties are broken by insertion order, so older events come first.
+    def sort_key(doc_id):
+      return (-scores[doc_id], doc_id)
+
+    if top_k is None:
+      ranked = sorted(scores, key=sort_key)
+    else:
+      ranked = heapq.nsmallest(top_k, scores, key=sort_key)
+    return [self.events[doc_id] for doc_id in ranked]
 
 
 class InMemoryMemoryService(BaseMemoryService):
   """An in-memory memory service for prototyping purpose only.
 
-  Uses keyword matching instead of semantic search.
+  Uses keyword matching instead of semantic search. Events are indexed in an
+  inverted index when sessions are added, and matches are ranked with BM25.
 
   It is not suitable for multi-threaded production environments. Use it for
   testing and development only.
   """
 
-  def __init__(self):
-    self._session_events: dict[str, dict[str, list[Event]]] = {}
-    """Keys are app_name/user_id, session_id. Values are session event lists."""
+  def __init__(
+      self, *, top_k: Optional[int] = None, k1: float = 1.2, b: float = 0.75
+  ):
+    """Initializes the InMemoryMemoryService.
+
+    Args:
+      top_k: The maximum number of memories returned by a search. Returns all
+        matching memories if not set.
+      k1: The BM25 term frequency saturation parameter.
+      b: The BM25 document length normalization parameter.
+    """
+    self.top_k = top_k
+    self.k1 = k1
+    self.b = b
+    self._indexes: dict[str, _UserIndex] = {}
+    """Keys are app_name/user_id. Values are the indexes of the user events."""
+    self._watermarks: dict[tuple[str, str, str], tuple[str, int]] = {}
+    """Keys are (app_name, user_id, session_id). Values are the id of the last
+    ingested event of the session and the number of events up to it."""
 
   @override
   async def add_session_to_memory(self, session: Session):
     user_key = _user_key(session.app_name, session.user_id)
-    self._session_events[user_key] = self._session_events.get(
-        _user_key(session.app_name, session.user_id), {}
-    )
-    self._session_events[user_key][session.id] = [
-        event
-        for event in session.events
-        if event.content and event.content.parts
-    ]
+    index = self._indexes.setdefault(user_key, _UserIndex())
+    indexed_docs = index.session_docs.setdefault(session.id, {})
+
+    # Only the events after the watermark are indexed, as long as the events up
+    # to the watermark are unchanged. Otherwise the session is re-indexed,
+    # dropping the events that are no longer in it.
+    session_key = (session.app_name, session.user_id, session.id)
+    watermark = self._watermarks.get(session_key)
+    start = 0
+    if watermark is not None:
+      event_id, num_events = watermark
+      if (
+          len(session.events) >= num_events
+          and session.events[num_events - 1].id == event_id
+      ):
+        start = num_events
+      else:
+        event_ids = {event.id for event in session.events}
+        for removed_id in [
+            event_id for event_id in indexed_docs if event_id not in event_ids
+        ]:
+          index.remove_doc(indexed_docs.pop(removed_id))
+
+    for event in session.events[start:]:
+      if event.id not in indexed_docs:
+        index.add_event(session.id, event)
+    if session.events:
+      self._watermarks[session_key] = (
+          session.events[-1].id,
+          len(session.events),
+      )
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ):
+    index = self._indexes.setdefault(_user_key(app_name, user_id), _UserIndex())
+    indexed_docs = index.session_docs.setdefault(session_id, {})
+    for event in events:
+      if event.id not in indexed_docs:
+        index.add_event(session_id, event)
 
   @override
   async def search_memory(
       self, *, app_name: str, user_id: str, query: str
   ) -> SearchMemoryResponse:
-    user_key = _user_key(app_name, user_id)
-    if user_key not in self._session_events:
+    index = self._indexes.get(_user_key(app_name, user_id))
+    if index is None:
       return SearchMemoryResponse()
 
-    words_in_query = set(query.lower().split())
+    words_in_query = set(_extract_words_lower(query))
     response = SearchMemoryResponse()
-
-    for session_events in self._session_events[user_key].values():
-      for event in session_events:
-        if not event.content or not event.content.parts:
-          continue
-        words_in_event = _extract_words_lower(
-            ' '.join([part.text for part in event.content.parts if part.text])
-        )
-        if not words_in_event:
-          continue
-
-        if any(query_word in words_in_event for query_word in words_in_query):
-          response.memories.append(
-              MemoryEntry(
-                  content=event.content,
-                  author=event.author,
-                  timestamp=_utils.format_timestamp(event.timestamp),
-              )
+    for event in index.search(words_in_query, self.k1, self.b, self.top_k):
+      response.memories.append(
+          MemoryEntry(
+              content=event.content,
+              author=event.author,
+              timestamp=_utils.format_timestamp(event.timestamp),
           )
-
+      )
     return response
@@ -0,0 +1,458 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Literal
+from typing import Optional
+from typing import Sequence
+from typing import TYPE_CHECKING
+from typing import Union
+
+from google.genai import types
+from typing_extensions import override
+
+from . import _utils
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+from .memory_entry import MemoryEntry
+
+try:
+  import numpy as np
+except ImportError as e:
+  raise ImportError(
+      'LocalVectorMemoryService requires numpy. Please install it with'
+      ' `pip install numpy`.'
+  ) from e
+
+if TYPE_CHECKING:
+  from ..events.event import Event
+  from ..sessions.session import Session
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+EmbeddingFunction = Callable[
+    [list[str]],
+    Union[Sequence[Sequence[float]], Awaitable[Sequence[Sequence[float]]]],
+]
+"""Embeds a batch of texts. Can be a sync or an async function."""
+
+_VECTORS_FILE = 'vectors.f32'
+_ENTRIES_FILE = 'entries.jsonl'
+_INDEX_FILE = 'index.json'
+
+
+def _user_key(app_name: str, user_id: str):
+  return f'{app_name}/{user_id}'
+
+
+def _event_text(event: Event) -> str:
+  if not event.content or not event.content.parts:
+    return ''
+  return ' '.join([part.text for part in event.content.parts if part.text])
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+  norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+  norms[norms == 0] = 1
+  return vectors / norms
+
+
+class _FlatIndex:
+  """Exact search over the rows of one user.
+
+  The vectors of the user are kept contiguous, in buffers whose capacity
+  doubles when they are full, so that a search scores them without copying.
+  """
+
+  def __init__(self):
+    self._rows = np.empty(0, dtype=np.int64)
+    self._vectors: Optional[np.ndarray] = None
+    self._count = 0
+
+  def add(self, rows: list[int], vectors: np.ndarray) -> None:
+    count = self._count + len(rows)
+    if self._vectors is None or count > len(self._vectors):
+      capacity = max(count, 2 * len(self._rows), 16)
+      new_rows = np.empty(capacity, dtype=np.int64)
+      new_vectors = np.empty((capacity, vectors.shape[1]), dtype=np.float32)
+      if self._vectors is not None:
+        new_rows[: self._count] = self._rows[: self._count]
+        new_vectors[: self._count] = self._vectors[: self._count]
+      self._rows = new_rows
+      self._vectors = new_vectors
+    self._rows[self._count : count] = rows
+    self._vectors[self._count : count] = vectors
+    self._count = count
+
+  def search(self, query: np.ndarray, top_k: int) -> list[tuple[int, float]]:
+    if not self._count:
+      return []
+    scores = self._vectors[: self._count] @ query
+    if top_k < len(scores):
+      best = np.argpartition(-scores, top_k)[:top_k]
+    else:
+      best = np.arange(len(scores))
+    best = best[np.argsort(-scores[best], kind='stable')]
+    return [(int(self._rows[i]), float(scores[i])) for i in best]
+
+
+class _HnswIndex:
+  """Approximate search over the rows of one user, backed by hnswlib."""
+
+  def __init__(self, dimension: int, m: int, ef_construction: int, ef: int):
+    try:
+      import hnswlib
+    except ImportError as e:
+      raise ImportError(
+          'The HNSW index requires hnswlib. Please install it with'
+          ' `pip install hnswlib`.'
+      ) from e
+
+    self._index = hnswlib.Index(space='ip', dim=dimension)
+    self._index.init_index(
+        max_elements=1024, ef_construction=ef_construction, M=m
+    )
+    self._index.set_ef(ef)
+    self._ef = ef
+
+  def add(self, rows: list[int], vectors: np.ndarray) -> None:
+    count = self._index.get_current_count() + len(rows)
+    max_elements = self._index.get_max_elements()
+    if count > max_elements:
+      while max_elements < count:
+        max_elements *= 2
+      self._index.resize_index(max_elements)
+    self._index.add_items(vectors, rows)
+
+  def search(self, query: np.ndarray, top_k: int) -> list[tuple[int, float]]:
+    top_k = min(top_k, self._index.get_current_count())
+    if not top_k:
+      return []
+    self._index.set_ef(max(self._ef, top_k))
+    labels, distances = self._index.knn_query(query, k=top_k)
+    # hnswlib returns 1 - inner product as the distance.
+    return [
+        (int(label), 1 - float(distance))
+        for label, distance in zip(labels[0], distances[0])
+    ]
+
+
+class LocalVectorMemoryService(BaseMemoryService):
+  """A memory service that does semantic search with local embeddings.
+
+  Events are embedded in batches with the given embedding function when a
+  session is added to memory, and their vectors are searched by cosine
+  similarity. Searches are scoped to the app and user of the session.
+
+  The default flat index computes exact scores, which is fast enough up to
+  around a million events per user. The HNSW index (requires ``hnswlib``) does
+  approximate search for larger corpora.
+
+  The indexes keep the vectors of each user in memory. When ``persist_dir`` is
+  set, vectors are also appended to a file, so the memories survive restarts.
+  The indexes are rebuilt from this file on first use, without embedding again.
+  """
+
+  def __init__(
+      self,
+      embedding_function: EmbeddingFunction,
+      *,
+      top_k: int = 10,
+      batch_size: int = 64,
+      index_type: Literal['flat', 'hnsw'] = 'flat',
+      persist_dir: Optional[str] = None,
+      hnsw_m: int = 16,
+      hnsw_ef_construction: int = 200,
+      hnsw_ef: int = 50,
+  ):
+    """Initializes a LocalVectorMemoryService.
+
+    Args:
+      embedding_function: Embeds a batch of texts into vectors of the same
+        dimension. Sync functions are run in a worker thread.
+      top_k: The maximum number of memories returned by a search.
+      batch_size: The maximum number of texts embedded in one call.
+      index_type: ``flat`` for exact search, or ``hnsw`` for approximate
+        search.
+      persist_dir: The directory to persist the memories to. Memories are only
+        kept in memory if not set.
+      hnsw_m: The number of links per node of the HNSW graph.
+      hnsw_ef_construction: The size of the candidate list used when building
+        the HNSW graph.
+      hnsw_ef: The size of the candidate list used when searching the HNSW
+        graph.
+    """
+    if index_type not in ('flat', 'hnsw'):
+      raise ValueError(f'Unsupported index type: {index_type}')
+    self._embedding_function = embedding_function
+    self.top_k = top_k
+    self.batch_size = batch_size
+    self._index_type = index_type
+    self._persist_dir = persist_dir
+    self._hnsw_params = (hnsw_m, hnsw_ef_construction, hnsw_ef)
+
+    self._dimension: Optional[int] = None
+    self._num_vectors = 0
+    self._entries: list[dict[str, Any]] = []
+    """The metadata of the events, in the same order as the vectors."""
+    self._indexed_events: set[tuple[str, str, str]] = set()
+    """The (user key, session id, event id) of the indexed events."""
+    self._watermarks: dict[tuple[str, str, str], tuple[str, float]] = {}
+    """Keys are (app_name, user_id, session_id). Values are the id and
+    timestamp of the last ingested event of the session."""
+    self._indexes: dict[str, Union[_FlatIndex, _HnswIndex]] = {}
+    """Keys are app_name/user_id. Values are the indexes of the user rows."""
+    self._loaded = persist_dir is None
+    self._lock = asyncio.Lock()
+    """Serializes the file writes, which are run in worker threads."""
+
+  def _new_index(self) -> Union[_FlatIndex, _HnswIndex]:
+    if self._index_type == 'hnsw':
+      return _HnswIndex(self._dimension, *self._hnsw_params)
+    return _FlatIndex()
+
+  async def _ensure_loaded(self) -> None:
+    if self._loaded:
+      return
+    async with self._lock:
+      if not self._loaded:
+        await asyncio.to_thread(self._load)
+        self._loaded = True
+
+  def _load(self) -> None:
+    os.makedirs(self._persist_dir, exist_ok=True)
+    index_path = os.path.join(self._persist_dir, _INDEX_FILE)
+    if not os.path.exists(index_path):
+      return
+    with open(index_path, 'r', encoding='utf-8') as f:
+      self._dimension = json.load(f)['dimension']
+
+    entries_path = os.path.join(self._persist_dir, _ENTRIES_FILE)
+    vectors_path = os.path.join(self._persist_dir, _VECTORS_FILE)
+    entries = []
+    entries_size = 0
+    if os.path.exists(entries_path):
+      with open(entries_path, 'rb') as f:
+        for line in f:
+          try:
+            entries.append(json.loads(line))
+          except json.JSONDecodeError:
+            # A partially written last line, left by an interrupted write.
+            break
+          entries_size += len(line)
+    num_vectors = 0
+    if os.path.exists(vectors_path):
+      num_vectors = os.path.getsize(vectors_path) // (4 * self._dimension)
+
+    # Drops the leftovers of an interrupted write, so that new vectors are
+    # appended in line with their entries.
+    self._num_vectors = min(num_vectors, len(entries))
+    if num_vectors != len(entries):
+      logger.warning(
+          'Found %d vectors and %d entries in %s, dropping the extra ones.',
+          num_vectors,
+          len(entries),
+          self._persist_dir,
+      )
+    if os.path.exists(vectors_path):
+      os.truncate(vectors_path, self._num_vectors * 4 * self._dimension)
+    if os.path.exists(entries_path):
+      if len(entries) > self._num_vectors:
+        with open(entries_path, 'w', encoding='utf-8') as f:
+          f.writelines(
+              json.dumps(entry) + '\n' for entry in entries[: self._num_vectors]
+          )
+      else:
+        os.truncate(entries_path, entries_size)
+    self._entries = entries[: self._num_vectors]
+    if not self._num_vectors:
+      return
+    vectors = np.memmap(
+        vectors_path,
+        dtype=np.float32,
+        mode='r',
+        shape=(self._num_vectors, self._dimension),
+    )
+
+    rows_by_user: dict[str, list[int]] = {}
+    for row, entry in enumerate(self._entries):
+      user_key = _user_key(entry['app_name'], entry['user_id'])
+      rows_by_user.setdefault(user_key, []).append(row)
+      self._indexed_events.add(
+          (user_key, entry['session_id'], entry['event_id'])
+      )
+      session_key = (entry['app_name'], entry['user_id'], entry['session_id'])
+      watermark = self._watermarks.get(session_key)
+      if watermark is None or entry['timestamp'] >= watermark[1]:
+        self._watermarks[session_key] = (entry['event_id'], entry['timestamp'])
+    for user_key, rows in rows_by_user.items():
+      index = self._new_index()
+      index.add(rows, vectors[rows])
+      self._indexes[user_key] = index
+
+  async def _embed(self, texts: list[str]) -> np.ndarray:
+    batches = []
+    for start in range(0, len(texts), self.batch_size):
+      batch = texts[start : start + self.batch_size]
+      if inspect.iscoroutinefunction(self._embedding_function):
+        embeddings = await self._embedding_function(batch)
+      else:
+        embeddings = await asyncio.to_thread(self._embedding_function, batch)
+      embeddings = np.asarray(embeddings, dtype=np.float32)
+      if embeddings.ndim != 2 or len(embeddings) != len(batch):
+        raise ValueError(
+            f'Expected {len(batch)} embeddings, got an array of shape'
+            f' {embeddings.shape}.'
+        )
+      batches.append(embeddings)
+    return _normalize(np.concatenate(batches))
+
+  def _append(self, vectors: np.ndarray, entries: list[dict[str, Any]]) -> None:
+    if self._dimension is None:
+      self._dimension = vectors.shape[1]
+      if self._persist_dir is not None:
+        with open(
+            os.path.join(self._persist_dir, _INDEX_FILE), 'w', encoding='utf-8'
+        ) as f:
+          json.dump({'dimension': self._dimension}, f)
+    elif vectors.shape[1] != self._dimension:
+      raise ValueError(
+          f'Expected embeddings of dimension {self._dimension}, got'
+          f' {vectors.shape[1]}.'
+      )
+
+    if self._persist_dir is not None:
+      # Vectors are written before their entries, so that an interrupted write
+      # leaves extra vectors, which are ignored on load.
+      with open(os.path.join(self._persist_dir, _VECTORS_FILE), 'ab') as f:
+        f.write(vectors.tobytes())
+      with open(
+          os.path.join(self._persist_dir, _ENTRIES_FILE), 'a', encoding='utf-8'
+      ) as f:
+        f.writelines(json.dumps(entry) + '\n' for entry in entries)
+    self._num_vectors += len(entries)
+    self._entries.extend(entries)
+
+  @override
+  async def add_session_to_memory(self, session: Session):
+    await self._ensure_loaded()
+    # Only the events added since the session was last added are embedded.
+    session_key = (session.app_name, session.user_id, session.id)
+    await self._add_events(
+        session_key,
+        _utils.events_after_watermark(
+            session.events, self._watermarks.get(session_key)
+        ),
+    )
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ):
+    await self._add_events((app_name, user_id, session_id), events)
+
+  async def _add_events(
+      self, session_key: tuple[str, str, str], events: Sequence[Event]
+  ):
+    await self._ensure_loaded()
+    app_name, user_id, session_id = session_key
+    user_key = _user_key(app_name, user_id)
+    all_events = events
+    events = [
+        event
+        for event in events
+        if (user_key, session_id, event.id) not in self._indexed_events
+        and _event_text(event)
+    ]
+    if not events:
+      _utils.advance_watermark(self._watermarks, session_key, all_events)
+      return
+
+    vectors = await self._embed([_event_text(event) for event in events])
+    async with self._lock:
+      # Skips the events indexed by a concurrent call while embedding.
+      is_new = [
+          (user_key, session_id, event.id) not in self._indexed_events
+          for event in events
+      ]
+      if not all(is_new):
+        events = [event for event, new in zip(events, is_new) if new]
+        vectors = vectors[is_new]
+        if not events:
+          _utils.advance_watermark(self._watermarks, session_key, all_events)
+          return
+      first_row = self._num_vectors
+      await asyncio.to_thread(
+          self._append,
+          vectors,
+          [
+              {
+                  'app_name': app_name,
+                  'user_id': user_id,
+                  'session_id': session_id,
+                  'event_id': event.id,
+                  'author': event.author,
+                  'timestamp': event.timestamp,
+                  'content': event.content.model_dump(
+                      exclude_none=True, mode='json'
+                  ),
+              }
+              for event in events
+          ],
+      )
+      self._indexed_events.update(
+          (user_key, session_id, event.id) for event in events
+      )
+      _utils.advance_watermark(self._watermarks, session_key, all_events)
+      if user_key not in self._indexes:
+        self._indexes[user_key] = self._new_index()
+      self._indexes[user_key].add(
+          list(range(first_row, first_row + len(events))), vectors
+      )
+
+  @override
+  async def search_memory(
+      self, *, app_name: str, user_id: str, query: str
+  ) -> SearchMemoryResponse:
+    await self._ensure_loaded()
+    index = self._indexes.get(_user_key(app_name, user_id))
+    if index is None or not query.strip():
+      return SearchMemoryResponse()
+
+    query_vector = (await self._embed([query]))[0]
+    response = SearchMemoryResponse()
+    for row, _ in index.search(query_vector, self.top_k):
+      entry = self._entries[row]
+      response.memories.append(
+          MemoryEntry(
+              content=types.Content.model_validate(entry['content']),
+              author=entry['author'],
+              timestamp=_utils.format_timestamp(entry['timestamp']),
+          )
+      )
+    return response
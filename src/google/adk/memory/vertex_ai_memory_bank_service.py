@@ -17,17 +17,20 @@ from __future__ import annotations
 import json
 import logging
 from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
 
 from google import genai
 
+from . import _utils
 from .base_memory_service import BaseMemoryService
 from .base_memory_service import SearchMemoryResponse
 from .memory_entry import MemoryEntry
 
 if TYPE_CHECKING:
+  from ..events.event import Event
   from ..sessions.session import Session
 
 logger = logging.getLogger('google_adk.' + __name__)
@@ -54,31 +57,58 @@ class VertexAiMemoryBankService(BaseMemoryService):
     self._project = project
     self._location = location
     self._agent_engine_id = agent_engine_id
+    self._watermarks: dict[tuple[str, str, str], tuple[str, float]] = {}
+    """Keys are (app_name, user_id, session_id). Values are the id and
+    timestamp of the last event sent for the session."""
 
   @override
   async def add_session_to_memory(self, session: Session):
+    # Only the events added since the session was last added are sent.
+    session_key = (session.app_name, session.user_id, session.id)
+    await self._generate_memories(
+        session_key,
+        _utils.events_after_watermark(
+            session.events, self._watermarks.get(session_key)
+        ),
+    )
+
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ):
+    await self._generate_memories((app_name, user_id, session_id), events)
+
+  async def _generate_memories(
+      self, session_key: tuple[str, str, str], events: Sequence[Event]
+  ):
     api_client = self._get_api_client()
 
     if not self._agent_engine_id:
       raise ValueError('Agent Engine ID is required for Memory Bank.')
 
-    events = []
-    for event in session.events:
+    app_name, user_id, _ = session_key
+    direct_events = []
+    for event in events:
       if event.content and event.content.parts:
-        events.append({
+        direct_events.append({
             'content': event.content.model_dump(exclude_none=True, mode='json')
         })
     request_dict = {
         'direct_contents_source': {
-            'events': events,
+            'events': direct_events,
         },
         'scope': {
-            'app_name': session.app_name,
-            'user_id': session.user_id,
+            'app_name': app_name,
+            'user_id': user_id,
         },
     }
 
-    if events:
+    if direct_events:
       api_response = await api_client.async_request(
           http_method='POST',
           path=f'reasoningEngines/{self._agent_engine_id}/memories:generate',
@@ -87,6 +117,7 @@ class VertexAiMemoryBankService(BaseMemoryService):
       logger.info(f'Generate memory response: {api_response}')
     else:
       logger.info('No events to add to memory.')
+    _utils.advance_watermark(self._watermarks, session_key, events)
 
   @override
   async def search_memory(self, *, app_name: str, user_id: str, query: str):
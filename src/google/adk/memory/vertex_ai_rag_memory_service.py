@@ -15,11 +15,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import OrderedDict
 import json
 import os
 import tempfile
 from typing import Optional
+from typing import Sequence
 from typing import TYPE_CHECKING
 
 from google.genai import types
@@ -62,47 +64,92 @@ class VertexAiRagMemoryService(BaseMemoryService):
         similarity_top_k=similarity_top_k,
         vector_distance_threshold=vector_distance_threshold,
     )
+    self._upload_watermarks: dict[tuple[str, str, str], tuple[str, float]] = {}
+    """Keys are (app_name, user_id, session_id). Values are the id and
+    timestamp of the last uploaded event of the session."""
 
   @override
   async def add_session_to_memory(self, session: Session):
-    with tempfile.NamedTemporaryFile(
-        mode="w", delete=False, suffix=".txt"
-    ) as temp_file:
-
-      output_lines = []
-      for event in session.events:
-        if not event.content or not event.content.parts:
-          continue
-        text_parts = [
-            part.text.replace("\n", " ")
-            for part in event.content.parts
-            if part.text
-        ]
-        if text_parts:
-          output_lines.append(
-              json.dumps({
-                  "author": event.author,
-                  "timestamp": event.timestamp,
-                  "text": ".".join(text_parts),
-              })
-          )
-      output_string = "\n".join(output_lines)
-      temp_file.write(output_string)
-      temp_file_path = temp_file.name
+    # Only the events added since the last upload of the session are uploaded.
+    # Overlapping uploads of a session are merged back at search time.
+    session_key = (session.app_name, session.user_id, session.id)
+    await self._upload_events(
+        session_key,
+        _utils.events_after_watermark(
+            session.events, self._upload_watermarks.get(session_key)
+        ),
+    )
 
+  @override
+  async def add_events_to_memory(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      events: Sequence[Event],
+  ):
+    await self._upload_events((app_name, user_id, session_id), events)
+
+  async def _upload_events(
+      self, session_key: tuple[str, str, str], events: Sequence[Event]
+  ):
     if not self._vertex_rag_store.rag_resources:
       raise ValueError("Rag resources must be set.")
 
-    for rag_resource in self._vertex_rag_store.rag_resources:
-      rag.upload_file(
-          corpus_name=rag_resource.rag_corpus,
-          path=temp_file_path,
-          # this is the temp workaround as upload file does not support
-          # adding metadata, thus use display_name to store the session info.
-          display_name=f"{session.app_name}.{session.user_id}.{session.id}",
-      )
+    output_lines = []
+    for event in events:
+      if not event.content or not event.content.parts:
+        continue
+      text_parts = [
+          part.text.replace("\n", " ")
+          for part in event.content.parts
+          if part.text
+      ]
+      if text_parts:
+        output_lines.append(
+            json.dumps({
+                "author": event.author,
+                "timestamp": event.timestamp,
+                "text": ".".join(text_parts),
+            })
+        )
+    if not output_lines:
+      return
 
-    os.remove(temp_file_path)
+    # The watermark is moved before uploading, so that concurrent calls for the
+    # same session do not upload the same events.
+    previous_watermark = self._upload_watermarks.get(session_key)
+    _utils.advance_watermark(self._upload_watermarks, session_key, events)
+    watermark = self._upload_watermarks.get(session_key)
+    temp_file_path = await asyncio.to_thread(
+        _write_temp_file, "\n".join(output_lines)
+    )
+    try:
+      await asyncio.gather(*(
+          asyncio.to_thread(
+              rag.upload_file,
+              corpus_name=rag_resource.rag_corpus,
+              path=temp_file_path,
+              # this is the temp workaround as upload file does not support
+              # adding metadata, thus use display_name to store the session
+              # info.
+              display_name=".".join(session_key),
+          )
+          for rag_resource in self._vertex_rag_store.rag_resources
+      ))
+    except Exception:
+      if (
+          watermark != previous_watermark
+          and self._upload_watermarks.get(session_key) == watermark
+      ):
+        if previous_watermark is None:
+          del self._upload_watermarks[session_key]
+        else:
+          self._upload_watermarks[session_key] = previous_watermark
+      raise
+    finally:
+      await asyncio.to_thread(os.remove, temp_file_path)
 
   @override
   async def search_memory(
@@ -111,7 +158,8 @@ class VertexAiRagMemoryService(BaseMemoryService):
     """Searches for sessions that match the query using rag.retrieval_query."""
     from ..events.event import Event
 
-    response = rag.retrieval_query(
+    response = await asyncio.to_thread(
+        rag.retrieval_query,
         text=query,
         rag_resources=self._vertex_rag_store.rag_resources,
         rag_corpora=self._vertex_rag_store.rag_corpora,
@@ -173,28 +221,48 @@ class VertexAiRagMemoryService(BaseMemoryService):
     return SearchMemoryResponse(memories=memory_results)
 
 
+def _write_temp_file(text: str) -> str:
+  with tempfile.NamedTemporaryFile(
+      mode="w", delete=False, suffix=".txt"
+  ) as temp_file:
+    temp_file.write(text)
+    return temp_file.name
+
+
 def _merge_event_lists(event_lists: list[list[Event]]) -> list[list[Event]]:
-  """Merge event lists that have overlapping timestamps."""
-  merged = []
-  while event_lists:
-    current = event_lists.pop(0)
-    current_ts = {event.timestamp for event in current}
-    merge_found = True
-
-    # Keep merging until no new overlap is found.
-    while merge_found:
-      merge_found = False
-      remaining = []
-      for other in event_lists:
-        other_ts = {event.timestamp for event in other}
-        # Overlap exists, so we merge and use the merged list to check again
-        if current_ts & other_ts:
-          new_events = [e for e in other if e.timestamp not in current_ts]
-          current.extend(new_events)
-          current_ts.update(e.timestamp for e in new_events)
-          merge_found = True
-        else:
-          remaining.append(other)
-      event_lists = remaining
-    merged.append(current)
-  return merged
+  """Merge event lists that have overlapping timestamps.
+
+  Lists sharing a timestamp, directly or through other lists, are merged with a
+  union-find keyed by timestamp, in linear time over the events.
+  """
+  parents = list(range(len(event_lists)))
+
+  def find(index: int) -> int:
+    while parents[index] != index:
+      parents[index] = parents[parents[index]]
+      index = parents[index]
+    return index
+
+  timestamp_owners: dict[float, int] = {}
+  for index, events in enumerate(event_lists):
+    for event in events:
+      owner = timestamp_owners.setdefault(event.timestamp, index)
+      root, owner_root = find(index), find(owner)
+      if root != owner_root:
+        # The earliest list is kept as the root, to preserve the list order.
+        parents[max(root, owner_root)] = min(root, owner_root)
+
+  merged: dict[int, list[Event]] = {}
+  merged_timestamps: dict[int, set[float]] = {}
+  for index, events in enumerate(event_lists):
+    root = find(index)
+    if root not in merged:
+      merged[root] = list(events)
+      merged_timestamps[root] = {event.timestamp for event in events}
+      continue
+    current_ts = merged_timestamps[root]
+    for event in events:
+      if event.timestamp not in current_ts:
+        merged[root].append(event)
+        current_ts.add(event.timestamp)
+  return list(merged.values())
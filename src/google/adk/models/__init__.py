@@ -14,12 +14,26 @@
 
 """Defines the interface to support a model."""
 
-from .base_llm import BaseLlm
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_getattr
 from .google_llm import Gemini
-from .llm_request import LlmRequest
-from .llm_response import LlmResponse
 from .registry import LLMRegistry
 
+if TYPE_CHECKING:
+  from .base_llm import BaseLlm
+  from .llm_request import LlmRequest
+  from .llm_response import LlmResponse
+
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'BaseLlm': '.base_llm',
+        'LlmRequest': '.llm_request',
+        'LlmResponse': '.llm_response',
+    },
+)
+
 __all__ = [
     'BaseLlm',
     'Gemini',
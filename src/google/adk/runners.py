@@ -15,12 +15,15 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 import logging
 import queue
+import threading
 from typing import AsyncGenerator
 from typing import Generator
 from typing import Optional
 import warnings
+import weakref
 
 from google.genai import types
 
@@ -48,6 +51,81 @@ from .tools.base_toolset import BaseToolset
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+# The number of sessions whose agent to resume is remembered by a runner.
+_MAX_RESUME_AGENT_CACHE_SIZE = 10000
+
+
+def _run_event_loop(loop: asyncio.AbstractEventLoop):
+  """Runs an event loop until stopped, then shuts it down as asyncio.run does."""
+  asyncio.set_event_loop(loop)
+  try:
+    loop.run_forever()
+  finally:
+    try:
+      tasks = asyncio.all_tasks(loop)
+      for task in tasks:
+        task.cancel()
+      loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+      loop.run_until_complete(loop.shutdown_asyncgens())
+      loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+      asyncio.set_event_loop(None)
+      loop.close()
+
+
+def _stop_event_loop(loop: asyncio.AbstractEventLoop):
+  try:
+    loop.call_soon_threadsafe(loop.stop)
+  except RuntimeError:
+    # The loop is already closed.
+    pass
+
+
+class _AgentTreeIndex:
+  """Indexes the agents of a tree by name and by id."""
+
+  def __init__(self, root_agent: BaseAgent):
+    self.root_agent = root_agent
+    self.agents_by_name: dict[str, BaseAgent] = {}
+    """The agents by name, first found first as `find_agent`."""
+    self._agents_by_id: dict[int, tuple[BaseAgent, list[BaseAgent], int]] = {}
+    """The agents by id, with their list of sub-agents and its length."""
+    agents = [root_agent]
+    while agents:
+      agent = agents.pop()
+      self.agents_by_name.setdefault(agent.name, agent)
+      self._agents_by_id[id(agent)] = (
+          agent,
+          agent.sub_agents,
+          len(agent.sub_agents),
+      )
+      agents.extend(reversed(agent.sub_agents))
+
+  def contains(self, agent: BaseAgent) -> bool:
+    """Whether an agent of the index is still in the tree.
+
+    Rather than searching the sub-agents of each ancestor of the agent, checks
+    that the ancestors still have the list of sub-agents they had when the tree
+    was indexed, with as many sub-agents.
+    """
+    if not self._is_indexed(agent):
+      return False
+    while agent is not self.root_agent:
+      agent = agent.parent_agent
+      if agent is None or not self._is_indexed(agent):
+        return False
+      _, sub_agents, num_sub_agents = self._agents_by_id[id(agent)]
+      if (
+          agent.sub_agents is not sub_agents
+          or len(sub_agents) != num_sub_agents
+      ):
+        return False
+    return True
+
+  def _is_indexed(self, agent: BaseAgent) -> bool:
+    entry = self._agents_by_id.get(id(agent))
+    return entry is not None and entry[0] is agent
+
 
 class Runner:
   """The Runner class is used to run agents.
@@ -102,6 +180,42 @@ class Runner:
     self.session_service = session_service
     self.memory_service = memory_service
     self.credential_service = credential_service
+    self._background_loop: Optional[asyncio.AbstractEventLoop] = None
+    """The event loop which runs the sync `run` calls, started on first use."""
+    self._background_thread: Optional[threading.Thread] = None
+    self._background_loop_finalizer: Optional[weakref.finalize] = None
+    self._background_loop_lock = threading.Lock()
+    self._agent_index: Optional[_AgentTreeIndex] = None
+    """The index of the agent tree last searched."""
+    self._resume_agent_cache: collections.OrderedDict[
+        tuple[str, str, str], tuple[str, BaseAgent]
+    ] = collections.OrderedDict()
+    """The agent to resume each session with, and the event it was found at.
+
+    Maps the app name, user ID and session ID of a session to the ID of its
+    last event and the agent which continues the session after that event, so
+    that the next invocation only looks at the events added since.
+    """
+
+  def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+    """Returns the event loop of the sync `run` calls, starting it if needed.
+
+    The loop runs in its own thread for the lifetime of the runner, so that the
+    clients, sessions and pools bound to it are reused across `run` calls. It
+    is stopped by `close`, or once the runner is garbage collected.
+    """
+    with self._background_loop_lock:
+      if self._background_loop is None:
+        loop = asyncio.new_event_loop()
+        thread = create_thread(_run_event_loop, loop)
+        thread.daemon = True
+        thread.start()
+        self._background_loop = loop
+        self._background_thread = thread
+        self._background_loop_finalizer = weakref.finalize(
+            self, _stop_event_loop, loop
+        )
+      return self._background_loop
 
   def run(
       self,
@@ -124,7 +238,17 @@ class Runner:
 
     Yields:
       The events generated by the agent.
+
+    Raises:
+      RuntimeError: If called from a coroutine run by `run` itself, which would
+        deadlock.
     """
+    loop = self._get_background_loop()
+    if threading.current_thread() is self._background_thread:
+      raise RuntimeError(
+          'Runner.run can not be called from a coroutine run by Runner.run.'
+          ' Use Runner.run_async instead.'
+      )
     event_queue = queue.Queue()
 
     async def _invoke_run_async():
@@ -139,24 +263,19 @@ class Runner:
       finally:
         event_queue.put(None)
 
-    def _asyncio_thread_main():
-      try:
-        asyncio.run(_invoke_run_async())
-      finally:
-        event_queue.put(None)
-
-    thread = create_thread(target=_asyncio_thread_main)
-    thread.start()
-
-    # consumes and re-yield the events from background thread.
-    while True:
-      event = event_queue.get()
-      if event is None:
-        break
-      else:
-        yield event
-
-    thread.join()
+    future = asyncio.run_coroutine_threadsafe(_invoke_run_async(), loop)
+    try:
+      # consumes and re-yield the events from background thread.
+      while True:
+        event = event_queue.get()
+        if event is None:
+          break
+        else:
+          yield event
+      future.result()
+    finally:
+      # Stops the run if the caller stopped consuming the events.
+      future.cancel()
 
   async def run_async(
       self,
@@ -361,6 +480,9 @@ class Runner:
     - An LlmAgent who replied last and is capable to transfer to any other agent
       in the agent hierarchy.
 
+    The agent found for a session is remembered along with its last event, so
+    the next invocation of the session only looks at the events added since.
+
     Args:
         session: The session to find the agent for.
         root_agent: The root agent of the runner.
@@ -374,12 +496,26 @@ class Runner:
     # request as a special long running function tool call.
     event = find_matching_function_call(session.events)
     if event and event.author:
-      return root_agent.find_agent(event.author)
-    for event in filter(lambda e: e.author != 'user', reversed(session.events)):
+      return self._find_agent(root_agent, event.author)
+
+    cache_key = (session.app_name, session.user_id, session.id)
+    cached = self._resume_agent_cache.get(cache_key)
+    agent_to_run = None
+    for event in reversed(session.events):
+      if cached and event.id == cached[0]:
+        # The events up to this one were already looked at.
+        if self._can_resume_with(cached[1], root_agent):
+          agent_to_run = cached[1]
+          break
+        # The agent tree has changed since, so look at all the events.
+        cached = None
+      if event.author == 'user':
+        continue
       if event.author == root_agent.name:
         # Found root agent.
-        return root_agent
-      if not (agent := root_agent.find_sub_agent(event.author)):
+        agent_to_run = root_agent
+        break
+      if not (agent := self._find_agent(root_agent, event.author)):
         # Agent not found, continue looking.
         logger.warning(
             'Event from an unknown agent: %s, event id: %s',
@@ -388,9 +524,60 @@ class Runner:
         )
         continue
       if self._is_transferable_across_agent_tree(agent):
-        return agent
+        agent_to_run = agent
+        break
     # Falls back to root agent if no suitable agents are found in the session.
-    return root_agent
+    agent_to_run = agent_to_run or root_agent
+
+    if session.events and session.events[-1].id:
+      self._resume_agent_cache[cache_key] = (
+          session.events[-1].id,
+          agent_to_run,
+      )
+      self._resume_agent_cache.move_to_end(cache_key)
+      if len(self._resume_agent_cache) > _MAX_RESUME_AGENT_CACHE_SIZE:
+        self._resume_agent_cache.popitem(last=False)
+    return agent_to_run
+
+  def _can_resume_with(self, agent: BaseAgent, root_agent: BaseAgent) -> bool:
+    """Whether a session can still continue with an agent found earlier."""
+    if agent is root_agent:
+      return True
+    return self._get_agent_index(root_agent).contains(
+        agent
+    ) and self._is_transferable_across_agent_tree(agent)
+
+  def _get_agent_index(self, root_agent: BaseAgent) -> _AgentTreeIndex:
+    if (
+        self._agent_index is None
+        or self._agent_index.root_agent is not root_agent
+    ):
+      self._agent_index = _AgentTreeIndex(root_agent)
+    return self._agent_index
+
+  def _find_agent(
+      self, root_agent: BaseAgent, name: str
+  ) -> Optional[BaseAgent]:
+    """Finds the agent with the name in the tree of the root agent.
+
+    The agents are looked up in an index of the tree, which is rebuilt when an
+    agent is not found in it, or has since been removed from the tree.
+
+    Args:
+        root_agent: The root agent of the tree.
+        name: The name of the agent.
+
+    Returns:
+      The agent, or None if no agent of the tree has the name.
+    """
+    agent_index = self._get_agent_index(root_agent)
+    agent = agent_index.agents_by_name.get(name)
+    if agent and agent_index.contains(agent):
+      return agent
+    agent = root_agent.find_agent(name)
+    if agent:
+      self._agent_index = _AgentTreeIndex(root_agent)
+    return agent
 
   def _is_transferable_across_agent_tree(self, agent_to_run: BaseAgent) -> bool:
     """Whether the agent to run can transfer to any other agent in the agent tree.
@@ -519,8 +706,30 @@ class Runner:
         logger.error('Error closing toolset %s: %s', type(toolset).__name__, e)
 
   async def close(self):
-    """Closes the runner."""
-    await self._cleanup_toolsets(self._collect_toolset(self.agent))
+    """Closes the runner.
+
+    The toolsets are closed on the event loop of the sync `run` calls if any,
+    as they were opened on it, and that loop is then stopped.
+    """
+    toolsets = self._collect_toolset(self.agent)
+    with self._background_loop_lock:
+      loop = self._background_loop
+      thread = self._background_thread
+      self._background_loop = None
+      self._background_thread = None
+    if loop is None:
+      await self._cleanup_toolsets(toolsets)
+      return
+    self._background_loop_finalizer.detach()
+    try:
+      await asyncio.wrap_future(
+          asyncio.run_coroutine_threadsafe(
+              self._cleanup_toolsets(toolsets), loop
+          )
+      )
+    finally:
+      _stop_event_loop(loop)
+      await asyncio.to_thread(thread.join)
 
 
 class InMemoryRunner(Runner):
@@ -11,31 +11,37 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import logging
+from typing import TYPE_CHECKING
 
-from .base_session_service import BaseSessionService
-from .in_memory_session_service import InMemorySessionService
-from .session import Session
-from .state import State
-from .vertex_ai_session_service import VertexAiSessionService
+from ..utils.lazy_imports import lazy_getattr
 
-logger = logging.getLogger('google_adk.' + __name__)
+if TYPE_CHECKING:
+  from .base_session_service import BaseSessionService
+  from .database_session_service import DatabaseSessionService
+  from .in_memory_session_service import InMemorySessionService
+  from .session import Session
+  from .state import State
+  from .vertex_ai_session_service import VertexAiSessionService
 
+# The session services are imported on first access, as the database and
+# Vertex AI ones depend on heavy libraries.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'BaseSessionService': '.base_session_service',
+        'DatabaseSessionService': '.database_session_service',
+        'InMemorySessionService': '.in_memory_session_service',
+        'Session': '.session',
+        'State': '.state',
+        'VertexAiSessionService': '.vertex_ai_session_service',
+    },
+)
 
 __all__ = [
     'BaseSessionService',
+    'DatabaseSessionService',
     'InMemorySessionService',
     'Session',
     'State',
     'VertexAiSessionService',
 ]
-
-try:
-  from .database_session_service import DatabaseSessionService
-
-  __all__.append('DatabaseSessionService')
-except ImportError:
-  logger.debug(
-      'DatabaseSessionService require sqlalchemy>=2.0, please ensure it is'
-      ' installed correctly.'
-  )
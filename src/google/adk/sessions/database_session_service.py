@@ -16,11 +16,14 @@ from __future__ import annotations
 import copy
 from datetime import datetime
 from datetime import timezone
+import functools
 import json
 import logging
+import os
 from typing import Any
 from typing import Optional
 import uuid
+import weakref
 
 from google.genai import types
 from sqlalchemy import Boolean
@@ -317,6 +320,16 @@ class StorageUserState(Base):
   )
 
 
+def _dispose_engine_after_fork(engine_ref: weakref.ref[Engine]) -> None:
+  """Drops the pooled connections a forked process inherited from its parent.
+
+  They are not closed, as the parent process still uses them.
+  """
+  engine = engine_ref()
+  if engine is not None:
+    engine.dispose(close=False)
+
+
 class DatabaseSessionService(BaseSessionService):
   """A session service that uses a database for storage."""
 
@@ -358,6 +371,15 @@ class DatabaseSessionService(BaseSessionService):
     # Base.metadata.drop_all(self.db_engine)
     Base.metadata.create_all(self.db_engine)
 
+    # The processes forked afterwards, e.g. the workers of
+    # `adk api_server --workers`, open their own connections.
+    if hasattr(os, "register_at_fork"):
+      os.register_at_fork(
+          after_in_child=functools.partial(
+              _dispose_engine_after_fork, weakref.ref(self.db_engine)
+          )
+      )
+
   @override
   async def create_session(
       self,
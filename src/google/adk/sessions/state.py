@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import ChainMap
 from typing import Any
 
 
@@ -69,3 +70,11 @@ class State:
     result.update(self._value)
     result.update(self._delta)
     return result
+
+  def to_chain_map(self) -> ChainMap[str, Any]:
+    """Returns a copy-on-write view of the state dict.
+
+    Reads fall through to the current value and delta of this state, while
+    writes to the view only go to its own first mapping.
+    """
+    return ChainMap({}, self._delta, self._value)
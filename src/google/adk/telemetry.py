@@ -23,11 +23,24 @@
 
 from __future__ import annotations
 
+import abc
+import enum
 import json
+import threading
 from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+import weakref
 
 from google.genai import types
+from opentelemetry import context as context_api
 from opentelemetry import trace
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace import Span
+from opentelemetry.sdk.trace import SpanProcessor
+from pydantic import BaseModel
+from pydantic import Field
 
 from .agents.invocation_context import InvocationContext
 from .events.event import Event
@@ -37,6 +50,413 @@ from .tools.base_tool import BaseTool
 
 tracer = trace.get_tracer('gcp.vertex.agent')
 
+# The value of payload attributes that are not captured, which the web UI
+# parses as an empty payload.
+_EMPTY_PAYLOAD = '{}'
+
+
+class PayloadCaptureMode(str, enum.Enum):
+  """How the payloads of LLM calls, tool calls and sent data are captured."""
+
+  FULL = 'full'
+  """Captures the whole payloads."""
+  TRUNCATED = 'truncated'
+  """Captures the payloads up to `max_length` characters."""
+  SAMPLED = 'sampled'
+  """Captures the whole payloads of a `sample_rate` fraction of the traces."""
+  OFF = 'off'
+  """Captures no payloads."""
+
+
+class PayloadCaptureConfig(BaseModel):
+  """The configuration of the payloads captured as span attributes.
+
+  Inline data is always captured as its MIME type and size only.
+  """
+
+  mode: PayloadCaptureMode = PayloadCaptureMode.FULL
+  max_length: int = Field(default=10000, ge=0)
+  """The maximum length of the payloads in the TRUNCATED mode."""
+  sample_rate: float = Field(default=0.1, ge=0.0, le=1.0)
+  """The fraction of the traces captured in the SAMPLED mode."""
+
+
+_payload_capture_config = PayloadCaptureConfig()
+
+
+def get_payload_capture_config() -> PayloadCaptureConfig:
+  """Returns the configuration of the captured payloads."""
+  return _payload_capture_config
+
+
+def set_payload_capture_config(config: PayloadCaptureConfig) -> None:
+  """Sets the configuration of the captured payloads."""
+  global _payload_capture_config
+  _payload_capture_config = config
+
+
+# The suffix of the truncated payloads.
+_TRUNCATED_SUFFIX = '...<truncated>'
+
+
+class _RawJson(str):
+  """A payload which is already serialized as JSON."""
+
+
+class _LazyJson(abc.ABC):
+  """A part of a payload snapshot, which is built into a JSON value when the
+  payload is serialized."""
+
+  __slots__ = ()
+
+  @abc.abstractmethod
+  def build(self) -> Any:
+    """Builds the JSON value."""
+
+  @abc.abstractmethod
+  def estimate_size(self) -> int:
+    """Estimates the size of the serialized JSON value, without building it."""
+
+
+class _ContentSnapshot(_LazyJson):
+  """A content, whose inline data is replaced by its MIME type and size."""
+
+  __slots__ = ('_role', '_parts')
+
+  def __init__(self, content: types.Content):
+    self._role = content.role
+    self._parts = tuple(content.parts or ())
+
+  def build(self) -> dict[str, Any]:
+    parts = []
+    for part in self._parts:
+      if part.inline_data:
+        parts.append({
+            'inline_data': {
+                'mime_type': part.inline_data.mime_type,
+                'size': len(part.inline_data.data or b''),
+            }
+        })
+      else:
+        parts.append(part.model_dump(exclude_none=True))
+    result = {'parts': parts}
+    if self._role is not None:
+      result['role'] = self._role
+    return result
+
+  def estimate_size(self) -> int:
+    size = 32
+    for part in self._parts:
+      if part.text is not None:
+        size += len(part.text) + 16
+      elif part.inline_data:
+        size += 64
+      else:
+        size += _estimate_json_size(part)
+    return size
+
+
+class _ModelSnapshot(_LazyJson):
+  """A shallow copy of a pydantic model, dumped without its None fields."""
+
+  __slots__ = ('_model', '_exclude')
+
+  def __init__(self, model: BaseModel, exclude: Optional[set[str]] = None):
+    self._model = model.model_copy()
+    self._exclude = exclude
+
+  def build(self) -> dict[str, Any]:
+    return self._model.model_dump(
+        mode='json', exclude_none=True, exclude=self._exclude
+    )
+
+  def estimate_size(self) -> int:
+    return _estimate_json_size(self._model)
+
+
+class _LlmResponseSnapshot(_LazyJson):
+  """An LLM response, whose inline data is replaced by its MIME type and
+  size."""
+
+  __slots__ = ('_llm_response', '_content')
+
+  def __init__(self, llm_response: LlmResponse):
+    self._llm_response = _ModelSnapshot(llm_response, exclude={'content'})
+    self._content = (
+        _ContentSnapshot(llm_response.content) if llm_response.content else None
+    )
+
+  def build(self) -> dict[str, Any]:
+    result = {}
+    if self._content:
+      result['content'] = self._content
+    result.update(self._llm_response.build())
+    return result
+
+  def estimate_size(self) -> int:
+    size = self._llm_response.estimate_size()
+    if self._content:
+      size += self._content.estimate_size()
+    return size
+
+
+def _snapshot_json(value: Any) -> Any:
+  """Copies the dicts and lists of a JSON-like value, which may still change."""
+  if isinstance(value, dict):
+    return {key: _snapshot_json(item) for key, item in value.items()}
+  if isinstance(value, (list, tuple)):
+    return [_snapshot_json(item) for item in value]
+  return value
+
+
+def _estimate_json_size(value: Any) -> int:
+  """Estimates the size of a value serialized as JSON, without serializing it."""
+  if isinstance(value, _LazyJson):
+    return value.estimate_size()
+  if isinstance(value, str):
+    return len(value) + 2
+  if isinstance(value, dict):
+    return 2 + sum(
+        len(str(key)) + 4 + _estimate_json_size(item)
+        for key, item in value.items()
+    )
+  if isinstance(value, (list, tuple)):
+    return 2 + sum(_estimate_json_size(item) + 2 for item in value)
+  if isinstance(value, BaseModel):
+    return _estimate_json_size(
+        {key: item for key, item in value.__dict__.items() if item is not None}
+    )
+  return 8
+
+
+def _json_default(value: Any) -> Any:
+  if isinstance(value, _LazyJson):
+    return value.build()
+  return '<not serializable>'
+
+
+def _iter_json(value: Any, max_length: int) -> Iterator[str]:
+  """Serializes a value as JSON in chunks, building its parts as it goes.
+
+  Strings are cut after `max_length` characters, as the serialized value is
+  then truncated anyway.
+  """
+  if isinstance(value, _LazyJson):
+    value = value.build()
+  if isinstance(value, _RawJson):
+    yield str(value)
+  elif isinstance(value, str):
+    yield json.dumps(value[: max_length + 1], ensure_ascii=False)
+  elif isinstance(value, dict):
+    yield '{'
+    for i, (key, item) in enumerate(value.items()):
+      yield f'{", " if i else ""}{json.dumps(str(key), ensure_ascii=False)}: '
+      yield from _iter_json(item, max_length)
+    yield '}'
+  elif isinstance(value, (list, tuple)):
+    yield '['
+    for i, item in enumerate(value):
+      if i:
+        yield ', '
+      yield from _iter_json(item, max_length)
+    yield ']'
+  else:
+    yield json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+class _Payload:
+  """A snapshot of a payload attribute, which is serialized when needed."""
+
+  __slots__ = ('_value', '_max_length')
+
+  def __init__(self, value: Any, max_length: Optional[int]):
+    """Initializes the payload.
+
+    Args:
+      value: A JSON-like value, which must not change afterwards, made of
+        dicts, lists, scalars and `_LazyJson` parts, or a `_RawJson`.
+      max_length: The length the payload is truncated to, if any.
+    """
+    self._value = value
+    self._max_length = max_length
+
+  def serialize(self) -> str:
+    try:
+      if self._max_length is None:
+        if isinstance(self._value, _RawJson):
+          return str(self._value)
+        return json.dumps(
+            self._value, ensure_ascii=False, default=_json_default
+        )
+      # Serializes the payload only up to the maximum length.
+      chunks = []
+      length = 0
+      for chunk in _iter_json(self._value, self._max_length):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length > self._max_length:
+          return ''.join(chunks)[: self._max_length] + _TRUNCATED_SUFFIX
+      return ''.join(chunks)
+    except Exception:  # pylint: disable=broad-exception-caught
+      return '<not serializable>'
+
+  def estimate_size(self) -> int:
+    if isinstance(self._value, _RawJson):
+      size = len(self._value)
+    else:
+      size = _estimate_json_size(self._value)
+    if self._max_length is not None:
+      size = min(size, self._max_length + len(_TRUNCATED_SUFFIX))
+    return size
+
+
+# The payloads of the spans handled by a DeferredPayloadSpanProcessor, by span
+# ID, which are serialized when the spans are exported, and the finalizers
+# which drop the payloads of the spans which never end.
+_deferred_payloads: dict[int, tuple[weakref.finalize, dict[str, _Payload]]] = {}
+_deferred_payloads_lock = threading.Lock()
+
+
+def _drop_deferred_payloads(span_id: int) -> None:
+  with _deferred_payloads_lock:
+    _deferred_payloads.pop(span_id, None)
+
+
+class DeferredPayloadSpan(ReadableSpan):
+  """A finished span that serializes its payload attributes on first access.
+
+  The payloads are snapshots taken when they were set, so they are not
+  affected by later changes of the objects they were taken from.
+  """
+
+  def __init__(self, span: ReadableSpan, payloads: dict[str, _Payload]):
+    super().__init__(
+        name=span.name,
+        context=span.context,
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+    self._payloads: Optional[dict[str, _Payload]] = payloads
+    self._payloads_lock = threading.Lock()
+
+  def _serialize_payloads(self) -> None:
+    with self._payloads_lock:
+      if self._payloads is None:
+        return
+      attributes = dict(self._attributes or {})
+      for key, payload in self._payloads.items():
+        attributes[key] = payload.serialize()
+      self._attributes = attributes
+      self._payloads = None
+
+  @property
+  def attributes(self):
+    self._serialize_payloads()
+    return super().attributes
+
+  @property
+  def attributes_without_payloads(self):
+    """The attributes, without the payloads which are not serialized yet."""
+    return super().attributes
+
+  def estimate_payloads_size(self) -> int:
+    """Estimates the size of the payloads which are not serialized yet."""
+    with self._payloads_lock:
+      if self._payloads is None:
+        return 0
+      return sum(payload.estimate_size() for payload in self._payloads.values())
+
+  def to_json(self, indent: Optional[int] = 4) -> str:
+    self._serialize_payloads()
+    return super().to_json(indent=indent)
+
+
+class DeferredPayloadSpanProcessor(SpanProcessor):
+  """Defers the serialization of payloads until the spans are exported.
+
+  The payload attributes of the spans started while this processor is
+  installed are snapshots on the hot path, which copy the containers of the
+  payloads but not their contents. They are serialized when the wrapped
+  processor, or its exporter, first reads the attributes of the finished span,
+  e.g. on the thread of a BatchSpanProcessor. Processors that are not wrapped
+  do not see the payload attributes.
+  """
+
+  def __init__(self, span_processor: SpanProcessor):
+    self._span_processor = span_processor
+
+  def on_start(
+      self, span: Span, parent_context: Optional[context_api.Context] = None
+  ) -> None:
+    span_id = span.context.span_id
+    finalizer = weakref.finalize(span, _drop_deferred_payloads, span_id)
+    with _deferred_payloads_lock:
+      _deferred_payloads[span_id] = (finalizer, {})
+    self._span_processor.on_start(span, parent_context=parent_context)
+
+  def on_end(self, span: ReadableSpan) -> None:
+    with _deferred_payloads_lock:
+      entry = _deferred_payloads.pop(span.context.span_id, None)
+    if entry is not None:
+      finalizer, payloads = entry
+      finalizer.detach()
+      if payloads:
+        span = DeferredPayloadSpan(span, payloads)
+    self._span_processor.on_end(span)
+
+  def shutdown(self) -> None:
+    self._span_processor.shutdown()
+
+  def force_flush(self, timeout_millis: int = 30000) -> bool:
+    return self._span_processor.force_flush(timeout_millis)
+
+
+def _is_sampled(span: trace.Span, sample_rate: float) -> bool:
+  # Samples whole traces, so that the payloads of a trace are all captured.
+  trace_id = span.get_span_context().trace_id
+  return (trace_id % 1000000) < sample_rate * 1000000
+
+
+def _set_payload_attribute(
+    span: trace.Span, key: str, snapshot: Callable[[], Any]
+) -> None:
+  """Sets a payload attribute according to the payload capture config.
+
+  Args:
+    span: The span to set the attribute of.
+    key: The key of the attribute.
+    snapshot: Takes the snapshot of the payload, see `_Payload`. It is only
+      called if the payload is captured.
+  """
+  config = _payload_capture_config
+  if config.mode == PayloadCaptureMode.OFF or (
+      config.mode == PayloadCaptureMode.SAMPLED
+      and not _is_sampled(span, config.sample_rate)
+  ):
+    span.set_attribute(key, _EMPTY_PAYLOAD)
+    return
+  payload = _Payload(
+      snapshot(),
+      config.max_length
+      if config.mode == PayloadCaptureMode.TRUNCATED
+      else None,
+  )
+
+  with _deferred_payloads_lock:
+    entry = _deferred_payloads.get(span.get_span_context().span_id)
+    if entry is not None:
+      entry[1][key] = payload
+      return
+  span.set_attribute(key, payload.serialize())
+
 
 def _safe_json_serialize(obj) -> str:
   """Convert any Python object to a JSON-serializable type or string.
@@ -70,6 +490,8 @@ def trace_tool_call(
     function_response_event: The event with the function response details.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
   span.set_attribute('gen_ai.operation.name', 'execute_tool')
   span.set_attribute('gen_ai.tool.name', tool.name)
@@ -88,14 +510,16 @@ def trace_tool_call(
 
   if not isinstance(tool_response, dict):
     tool_response = {'result': tool_response}
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.tool_call_args',
-      _safe_json_serialize(args),
+      lambda: _snapshot_json(args),
   )
   span.set_attribute('gcp.vertex.agent.event_id', function_response_event.id)
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.tool_response',
-      _safe_json_serialize(tool_response),
+      lambda: _snapshot_json(tool_response),
   )
   # Setting empty llm request and response (as UI expect these) while not
   # applicable for tool_response.
@@ -121,6 +545,8 @@ def trace_merged_tool_calls(
   """
 
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
   span.set_attribute('gen_ai.operation.name', 'execute_tool')
   span.set_attribute('gen_ai.tool.name', '(merged tools)')
@@ -129,16 +555,19 @@ def trace_merged_tool_calls(
 
   span.set_attribute('gcp.vertex.agent.tool_call_args', 'N/A')
   span.set_attribute('gcp.vertex.agent.event_id', response_event_id)
-  try:
-    function_response_event_json = function_response_event.model_dumps_json(
-        exclude_none=True
-    )
-  except Exception:  # pylint: disable=broad-exception-caught
-    function_response_event_json = '<not serializable>'
 
-  span.set_attribute(
+  def serialize_function_response_event() -> _RawJson:
+    try:
+      return _RawJson(
+          function_response_event.model_dumps_json(exclude_none=True)
+      )
+    except Exception:  # pylint: disable=broad-exception-caught
+      return _RawJson('<not serializable>')
+
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.tool_response',
-      function_response_event_json,
+      serialize_function_response_event,
   )
   # Setting empty llm request and response (as UI expect these) while not
   # applicable for tool_response.
@@ -167,6 +596,8 @@ def trace_call_llm(
     llm_response: The LLM response object.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   # Special standard Open Telemetry GenaI attributes that indicate
   # that this is a span related to a Generative AI system.
   span.set_attribute('gen_ai.system', 'gcp.vertex.agent')
@@ -179,20 +610,16 @@ def trace_call_llm(
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
   # Consider removing once GenAI SDK provides a way to record this info.
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.llm_request',
-      _safe_json_serialize(_build_llm_request_for_trace(llm_request)),
+      lambda: _snapshot_llm_request(llm_request),
   )
   # Consider removing once GenAI SDK provides a way to record this info.
-
-  try:
-    llm_response_json = llm_response.model_dump_json(exclude_none=True)
-  except Exception:  # pylint: disable=broad-exception-caught
-    llm_response_json = '<not serializable>'
-
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.llm_response',
-      llm_response_json,
+      lambda: _LlmResponseSnapshot(llm_response),
   )
 
   if llm_response.usage_metadata is not None:
@@ -222,50 +649,38 @@ def trace_send_data(
     data: A list of content objects.
   """
   span = trace.get_current_span()
+  if not span.is_recording():
+    return
   span.set_attribute(
       'gcp.vertex.agent.invocation_id', invocation_context.invocation_id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
   # Once instrumentation is added to the GenAI SDK, consider whether this
   # information still needs to be recorded by the Agent Development Kit.
-  span.set_attribute(
+  _set_payload_attribute(
+      span,
       'gcp.vertex.agent.data',
-      _safe_json_serialize([
-          types.Content(role=content.role, parts=content.parts).model_dump(
-              exclude_none=True
-          )
-          for content in data
-      ]),
+      lambda: [_ContentSnapshot(content) for content in data],
   )
 
 
-def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
-  """Builds a dictionary representation of the LLM request for tracing.
+def _snapshot_llm_request(llm_request: LlmRequest) -> dict[str, Any]:
+  """Takes a snapshot of the LLM request for tracing.
 
-  This function prepares a dictionary representation of the LlmRequest
-  object, suitable for inclusion in a trace. It excludes fields that cannot
-  be serialized (e.g., function pointers) and avoids sending bytes data.
+  It excludes fields that cannot be serialized (e.g., function pointers) and
+  avoids sending bytes data.
 
   Args:
     llm_request: The LlmRequest object.
 
   Returns:
-    A dictionary representation of the LLM request.
+    A snapshot of the LLM request, see `_Payload`.
   """
   # Some fields in LlmRequest are function pointers and can not be serialized.
-  result = {
+  return {
       'model': llm_request.model,
-      'config': llm_request.config.model_dump(
-          exclude_none=True, exclude='response_schema'
-      ),
-      'contents': [],
+      'config': _ModelSnapshot(llm_request.config, exclude={'response_schema'}),
+      'contents': [
+          _ContentSnapshot(content) for content in llm_request.contents
+      ],
   }
-  # We do not want to send bytes data to the trace.
-  for content in llm_request.contents:
-    parts = [part for part in content.parts if not part.inline_data]
-    result['contents'].append(
-        types.Content(role=content.role, parts=parts).model_dump(
-            exclude_none=True
-        )
-    )
-  return result
@@ -12,23 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import TYPE_CHECKING
 
-from ..auth.auth_tool import AuthToolArguments
-from .apihub_tool.apihub_toolset import APIHubToolset
-from .base_tool import BaseTool
-from .example_tool import ExampleTool
-from .exit_loop_tool import exit_loop
-from .function_tool import FunctionTool
-from .get_user_choice_tool import get_user_choice_tool as get_user_choice
-from .google_search_tool import google_search
-from .load_artifacts_tool import load_artifacts_tool as load_artifacts
-from .load_memory_tool import load_memory_tool as load_memory
-from .long_running_tool import LongRunningFunctionTool
-from .preload_memory_tool import preload_memory_tool as preload_memory
-from .tool_context import ToolContext
-from .transfer_to_agent_tool import transfer_to_agent
-from .url_context_tool import url_context
-from .vertex_ai_search_tool import VertexAiSearchTool
+from ..utils.lazy_imports import lazy_getattr
+
+if TYPE_CHECKING:
+  from ..auth.auth_tool import AuthToolArguments
+  from .apihub_tool.apihub_toolset import APIHubToolset
+  from .base_tool import BaseTool
+  from .example_tool import ExampleTool
+  from .exit_loop_tool import exit_loop
+  from .function_tool import FunctionTool
+  from .get_user_choice_tool import get_user_choice_tool as get_user_choice
+  from .google_search_tool import google_search
+  from .load_artifacts_tool import load_artifacts_tool as load_artifacts
+  from .load_memory_tool import load_memory_tool as load_memory
+  from .long_running_tool import LongRunningFunctionTool
+  from .preload_memory_tool import preload_memory_tool as preload_memory
+  from .tool_context import ToolContext
+  from .transfer_to_agent_tool import transfer_to_agent
+  from .url_context_tool import url_context
+  from .vertex_ai_search_tool import VertexAiSearchTool
+
+# The tools are imported on first access, as some of them depend on heavy
+# libraries, e.g. the Vertex AI SDK for the ExampleTool.
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        'APIHubToolset': '.apihub_tool.apihub_toolset',
+        'AuthToolArguments': '..auth.auth_tool',
+        'BaseTool': '.base_tool',
+        'ExampleTool': '.example_tool',
+        'exit_loop': '.exit_loop_tool',
+        'FunctionTool': '.function_tool',
+        'get_user_choice': '.get_user_choice_tool:get_user_choice_tool',
+        'google_search': '.google_search_tool',
+        'load_artifacts': '.load_artifacts_tool:load_artifacts_tool',
+        'load_memory': '.load_memory_tool:load_memory_tool',
+        'LongRunningFunctionTool': '.long_running_tool',
+        'preload_memory': '.preload_memory_tool:preload_memory_tool',
+        'ToolContext': '.tool_context',
+        'transfer_to_agent': '.transfer_to_agent_tool',
+        'url_context': '.url_context_tool',
+        'VertexAiSearchTool': '.vertex_ai_search_tool',
+    },
+)
 
 __all__ = [
     'APIHubToolset',
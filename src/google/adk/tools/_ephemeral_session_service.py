@@ -0,0 +1,119 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from typing import MutableMapping
+from typing import Optional
+import uuid
+
+from typing_extensions import override
+
+from ..events.event import Event
+from ..sessions.base_session_service import BaseSessionService
+from ..sessions.base_session_service import GetSessionConfig
+from ..sessions.base_session_service import ListSessionsResponse
+from ..sessions.session import Session
+
+
+class EphemeralSessionService(BaseSessionService):
+  """Session service for the short lived sessions of agent tool calls.
+
+  Unlike `InMemorySessionService`, sessions are handed out as-is instead of
+  deep copies, the initial state is used without copying it (so it can be a
+  copy-on-write view of the caller's state), and deleted session objects are
+  recycled for later calls.
+  """
+
+  def __init__(self, max_pooled_sessions: int = 8):
+    self._sessions: dict[str, Session] = {}
+    self._pool: list[Session] = []
+    self._max_pooled_sessions = max_pooled_sessions
+
+  @override
+  async def create_session(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      state: Optional[MutableMapping[str, Any]] = None,
+      session_id: Optional[str] = None,
+  ) -> Session:
+    session_id = (
+        session_id.strip()
+        if session_id and session_id.strip()
+        else str(uuid.uuid4())
+    )
+    if self._pool:
+      session = self._pool.pop()
+      session.id = session_id
+      session.app_name = app_name
+      session.user_id = user_id
+    else:
+      session = Session(id=session_id, app_name=app_name, user_id=user_id)
+    # Assigned after construction so that pydantic does not copy the mapping.
+    session.state = state if state is not None else {}
+    session.events = []
+    session.last_update_time = time.time()
+    self._sessions[session_id] = session
+    return session
+
+  @override
+  async def get_session(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      config: Optional[GetSessionConfig] = None,
+  ) -> Optional[Session]:
+    session = self._sessions.get(session_id)
+    if (
+        session is None
+        or session.app_name != app_name
+        or session.user_id != user_id
+    ):
+      return None
+    return session
+
+  @override
+  async def list_sessions(
+      self, *, app_name: str, user_id: str
+  ) -> ListSessionsResponse:
+    return ListSessionsResponse(
+        sessions=[
+            session
+            for session in self._sessions.values()
+            if session.app_name == app_name and session.user_id == user_id
+        ]
+    )
+
+  @override
+  async def delete_session(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> None:
+    session = self._sessions.pop(session_id, None)
+    if session is None or len(self._pool) >= self._max_pooled_sessions:
+      return
+    session.state = {}
+    session.events = []
+    self._pool.append(session)
+
+  @override
+  async def append_event(self, session: Session, event: Event) -> Event:
+    await super().append_event(session=session, event=event)
+    session.last_update_time = event.timestamp
+    return event
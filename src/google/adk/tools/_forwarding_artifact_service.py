@@ -94,3 +94,93 @@ class ForwardingArtifactService(BaseArtifactService):
         session_id=self._invocation_context.session.id,
         filename=filename,
     )
+
+
+class SessionForwardingArtifactService(BaseArtifactService):
+  """Artifact service that forwards to the tool context of each session.
+
+  A long-lived runner serves many tool calls, each in its own session. The tool
+  context of a call is registered under its session id for the duration of the
+  call, and artifact operations of that session are forwarded to it.
+  """
+
+  def __init__(self):
+    self._forwarders: dict[str, ForwardingArtifactService] = {}
+
+  def register(self, session_id: str, tool_context: ToolContext) -> None:
+    self._forwarders[session_id] = ForwardingArtifactService(tool_context)
+
+  def unregister(self, session_id: str) -> None:
+    self._forwarders.pop(session_id, None)
+
+  def _get_forwarder(self, session_id: str) -> ForwardingArtifactService:
+    forwarder = self._forwarders.get(session_id)
+    if forwarder is None:
+      raise ValueError(f"No tool context registered for session {session_id}.")
+    return forwarder
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      artifact: types.Part,
+  ) -> int:
+    return await self._get_forwarder(session_id).save_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        artifact=artifact,
+    )
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      session_id: str,
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    return await self._get_forwarder(session_id).load_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+        version=version,
+    )
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: str
+  ) -> list[str]:
+    return await self._get_forwarder(session_id).list_artifact_keys(
+        app_name=app_name, user_id=user_id, session_id=session_id
+    )
+
+  @override
+  async def delete_artifact(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> None:
+    await self._get_forwarder(session_id).delete_artifact(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
+
+  @override
+  async def list_versions(
+      self, *, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> list[int]:
+    return await self._get_forwarder(session_id).list_versions(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        filename=filename,
+    )
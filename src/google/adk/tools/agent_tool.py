@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from google.genai import types
@@ -24,8 +25,8 @@ from typing_extensions import override
 from . import _automatic_function_calling_util
 from ..memory.in_memory_memory_service import InMemoryMemoryService
 from ..runners import Runner
-from ..sessions.in_memory_session_service import InMemorySessionService
-from ._forwarding_artifact_service import ForwardingArtifactService
+from ._ephemeral_session_service import EphemeralSessionService
+from ._forwarding_artifact_service import SessionForwardingArtifactService
 from .base_tool import BaseTool
 from .tool_context import ToolContext
 
@@ -49,9 +50,28 @@ class AgentTool(BaseTool):
   def __init__(self, agent: BaseAgent, skip_summarization: bool = False):
     self.agent = agent
     self.skip_summarization: bool = skip_summarization
+    self._runner: Optional[Runner] = None
+    self._artifact_service: Optional[SessionForwardingArtifactService] = None
 
     super().__init__(name=agent.name, description=agent.description)
 
+  def _get_runner(self) -> Runner:
+    """Returns the runner used for all calls of this tool.
+
+    The runner and its services are created once. Each call runs in its own
+    short lived session, which is recycled after the call.
+    """
+    if self._runner is None or self._runner.agent is not self.agent:
+      self._artifact_service = SessionForwardingArtifactService()
+      self._runner = Runner(
+          app_name=self.agent.name,
+          agent=self.agent,
+          artifact_service=self._artifact_service,
+          session_service=EphemeralSessionService(),
+          memory_service=InMemoryMemoryService(),
+      )
+    return self._runner
+
   @model_validator(mode='before')
   @classmethod
   def populate_name(cls, data: Any) -> Any:
@@ -110,27 +130,33 @@ class AgentTool(BaseTool):
           role='user',
           parts=[types.Part.from_text(text=args['request'])],
       )
-    runner = Runner(
-        app_name=self.agent.name,
-        agent=self.agent,
-        artifact_service=ForwardingArtifactService(tool_context),
-        session_service=InMemorySessionService(),
-        memory_service=InMemoryMemoryService(),
-    )
+    runner = self._get_runner()
+    artifact_service = self._artifact_service
+    # The sub-agent sees a copy-on-write view of the parent state, its own
+    # changes are forwarded to the parent through the event state deltas.
     session = await runner.session_service.create_session(
         app_name=self.agent.name,
         user_id='tmp_user',
-        state=tool_context.state.to_dict(),
+        state=tool_context.state.to_chain_map(),
     )
+    artifact_service.register(session.id, tool_context)
 
     last_event = None
-    async for event in runner.run_async(
-        user_id=session.user_id, session_id=session.id, new_message=content
-    ):
-      # Forward state delta to parent session.
-      if event.actions.state_delta:
-        tool_context.state.update(event.actions.state_delta)
-      last_event = event
+    try:
+      async for event in runner.run_async(
+          user_id=session.user_id, session_id=session.id, new_message=content
+      ):
+        # Forward state delta to parent session.
+        if event.actions.state_delta:
+          tool_context.state.update(event.actions.state_delta)
+        last_event = event
+    finally:
+      artifact_service.unregister(session.id)
+      await runner.session_service.delete_session(
+          app_name=session.app_name,
+          user_id=session.user_id,
+          session_id=session.id,
+      )
 
     if not last_event or not last_event.content or not last_event.content.parts:
       return ''
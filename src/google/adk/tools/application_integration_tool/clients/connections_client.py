@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import json
+import threading
 import time
 from typing import Any
 from typing import Dict
@@ -25,6 +26,40 @@ from google.auth import default as default_service_credential
 from google.auth.transport.requests import Request
 from google.oauth2 import service_account
 import requests
+from requests.adapters import HTTPAdapter
+
+# Maximum number of pooled connections kept open to the connectors API. This
+# also bounds how many schema requests can be in flight at the same time.
+MAX_CONCURRENT_REQUESTS = 16
+
+# Long running operations are polled with exponential backoff between these
+# bounds.
+_POLL_INITIAL_DELAY_SECONDS = 0.2
+_POLL_MAX_DELAY_SECONDS = 5.0
+_POLL_BACKOFF_MULTIPLIER = 2.0
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+  """Returns the process wide HTTP session used for connectors API calls.
+
+  The session keeps a pool of keep-alive connections so that consecutive and
+  concurrent calls do not pay for a new TLS handshake each time.
+  """
+  global _http_session
+  with _http_session_lock:
+    if _http_session is None:
+      session = requests.Session()
+      adapter = HTTPAdapter(
+          pool_connections=MAX_CONCURRENT_REQUESTS,
+          pool_maxsize=MAX_CONCURRENT_REQUESTS,
+      )
+      session.mount("https://", adapter)
+      session.mount("http://", adapter)
+      _http_session = session
+    return _http_session
 
 
 class ConnectionsClient:
@@ -53,6 +88,7 @@ class ConnectionsClient:
     self.connector_url = "https://connectors.googleapis.com"
     self.service_account_json = service_account_json
     self.credential_cache = None
+    self._credential_lock = threading.Lock()
 
   def get_connection_details(self) -> Dict[str, Any]:
     """Retrieves service details (service name and host) for a given connection.
@@ -797,12 +833,21 @@ class ConnectionsClient:
   def _get_access_token(self) -> str:
     """Gets the access token for the service account.
 
+    The token is cached until it expires. Concurrent callers share a single
+    refresh.
+
     Returns:
         The access token.
     """
     if self.credential_cache and not self.credential_cache.expired:
       return self.credential_cache.token
 
+    with self._credential_lock:
+      if self.credential_cache and not self.credential_cache.expired:
+        return self.credential_cache.token
+      return self._refresh_access_token()
+
+  def _refresh_access_token(self) -> str:
     if self.service_account_json:
       credentials = service_account.Credentials.from_service_account_info(
           json.loads(self.service_account_json),
@@ -844,7 +889,7 @@ class ConnectionsClient:
           "Authorization": f"Bearer {self._get_access_token()}",
       }
 
-      response = requests.get(url, headers=headers)
+      response = _get_http_session().get(url, headers=headers)
       response.raise_for_status()
       return response
 
@@ -871,6 +916,9 @@ class ConnectionsClient:
   def _poll_operation(self, operation_id: str) -> Dict[str, Any]:
     """Polls an operation until it is done.
 
+    The delay between polls grows exponentially, starting at
+    `_POLL_INITIAL_DELAY_SECONDS` and capped at `_POLL_MAX_DELAY_SECONDS`.
+
     Args:
         operation_id: The ID of the operation to poll.
 
@@ -882,12 +930,12 @@ class ConnectionsClient:
         ValueError: If there's a request error.
         Exception: For any other unexpected errors.
     """
-    operation_done: bool = False
-    operation_response: Dict[str, Any] = {}
-    while not operation_done:
-      get_operation_url = f"{self.connector_url}/v1/{operation_id}"
+    get_operation_url = f"{self.connector_url}/v1/{operation_id}"
+    delay = _POLL_INITIAL_DELAY_SECONDS
+    while True:
       response = self._execute_api_call(get_operation_url)
       operation_response = response.json()
-      operation_done = operation_response.get("done", False)
-      time.sleep(1)
-    return operation_response
+      if operation_response.get("done", False):
+        return operation_response
+      time.sleep(delay)
+      delay = min(delay * _POLL_BACKOFF_MULTIPLIER, _POLL_MAX_DELAY_SECONDS)
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 import json
 from typing import List
 from typing import Optional
 
 from google.adk.tools.application_integration_tool.clients.connections_client import ConnectionsClient
+from google.adk.tools.application_integration_tool.clients.connections_client import MAX_CONCURRENT_REQUESTS
 import google.auth
 from google.auth import default as default_service_credential
 import google.auth.transport.requests
@@ -141,10 +143,31 @@ class IntegrationClient:
           " one of them."
       )
     connector_spec = connections_client.get_connector_base_spec()
+    # Schemas are fetched concurrently since each one is a long running
+    # operation on the connectors API.
+    num_requests = len(self.entity_operations) + len(self.actions)
+    with ThreadPoolExecutor(
+        max_workers=min(num_requests, MAX_CONCURRENT_REQUESTS)
+    ) as executor:
+      entity_futures = {
+          entity: executor.submit(
+              connections_client.get_entity_schema_and_operations, entity
+          )
+          for entity in self.entity_operations
+      }
+      action_futures = {
+          action: executor.submit(connections_client.get_action_schema, action)
+          for action in self.actions
+      }
+      entity_schemas = {
+          entity: future.result() for entity, future in entity_futures.items()
+      }
+      action_schemas = {
+          action: future.result() for action, future in action_futures.items()
+      }
+
     for entity, operations in self.entity_operations.items():
-      schema, supported_operations = (
-          connections_client.get_entity_schema_and_operations(entity)
-      )
+      schema, supported_operations = entity_schemas[entity]
       if not operations:
         operations = supported_operations
       json_schema_as_string = json.dumps(schema)
@@ -195,7 +218,7 @@ class IntegrationClient:
               f"Invalid operation: {operation} for entity: {entity}"
           )
     for action in self.actions:
-      action_details = connections_client.get_action_schema(action)
+      action_details = action_schemas[action]
       input_schema = action_details["inputSchema"]
       output_schema = action_details["outputSchema"]
       # Remove spaces from the display name to generate valid spec
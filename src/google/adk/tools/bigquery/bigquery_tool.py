@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 from typing import Any
 from typing import Callable
@@ -127,3 +128,9 @@ class BigQueryTool(FunctionTool):
     if "config" in signature.parameters:
       args_to_call["config"] = tool_config
     return await super().run_async(args=args_to_call, tool_context=tool_context)
+
+  @override
+  async def _call_sync_func(self, args_to_call: dict[str, Any]) -> Any:
+    # The BigQuery client blocks on network I/O, so synchronous tools are run
+    # in a worker thread to keep the event loop responsive.
+    return await asyncio.to_thread(self.func, **args_to_call)
@@ -14,19 +14,89 @@
 
 from __future__ import annotations
 
+import collections
+import hashlib
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
 import google.api_core.client_info
 from google.auth.credentials import Credentials
 from google.cloud import bigquery
+import google.oauth2.credentials
 
 from ... import version
 
 USER_AGENT = f"adk-bigquery-tool google-adk/{version.__version__}"
 
+# Maximum number of BigQuery clients kept alive for reuse.
+MAX_CACHED_CLIENTS = 32
+
+_client_cache: collections.OrderedDict[Hashable, bigquery.Client] = (
+    collections.OrderedDict()
+)
+_client_cache_lock = threading.Lock()
+
+
+def _hash_secret(secret: str) -> str:
+  return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+
+def credentials_cache_key(
+    credentials: Optional[Credentials],
+) -> Optional[Hashable]:
+  """Returns a key identifying the principal behind the given credentials.
+
+  OAuth credentials are rebuilt from the session state on every tool call, so
+  they are identified by their client id and refresh token. Service account
+  credentials are identified by their account and scopes, and any other
+  credentials by their access token. Returns None if the principal cannot be
+  identified, in which case nothing should be cached for the credentials.
+  """
+  if isinstance(
+      credentials, google.oauth2.credentials.Credentials
+  ) and isinstance(credentials.refresh_token, str):
+    return (
+        "oauth2",
+        credentials.client_id,
+        _hash_secret(credentials.refresh_token),
+    )
+  service_account_email = getattr(credentials, "service_account_email", None)
+  if isinstance(service_account_email, str):
+    scopes = getattr(credentials, "scopes", None) or ()
+    return (
+        "service_account",
+        type(credentials).__module__,
+        type(credentials).__qualname__,
+        service_account_email,
+        tuple(sorted(scopes)),
+    )
+  token = getattr(credentials, "token", None)
+  if isinstance(token, str) and token:
+    return ("token", _hash_secret(token))
+  return None
+
 
 def get_bigquery_client(
     *, project: str, credentials: Credentials
 ) -> bigquery.Client:
-  """Get a BigQuery client."""
+  """Get a BigQuery client.
+
+  Clients are reused per project and credentials, so that consecutive tool
+  calls share the underlying HTTP connection pool.
+  """
+  credentials_key = credentials_cache_key(credentials)
+  key = (project, credentials_key)
+  if credentials_key is not None:
+    with _client_cache_lock:
+      cached = _client_cache.get(key)
+      if cached is not None:
+        _client_cache.move_to_end(key)
+        return cached
 
   client_info = google.api_core.client_info.ClientInfo(user_agent=USER_AGENT)
 
@@ -34,4 +104,51 @@ def get_bigquery_client(
       project=project, credentials=credentials, client_info=client_info
   )
 
+  if credentials_key is not None:
+    with _client_cache_lock:
+      _client_cache[key] = bigquery_client
+      _client_cache.move_to_end(key)
+      while len(_client_cache) > MAX_CACHED_CLIENTS:
+        _client_cache.popitem(last=False)
+
   return bigquery_client
+
+
+class TtlCache:
+  """A small thread-safe cache whose entries expire after a fixed time."""
+
+  def __init__(self, *, ttl_seconds: float, max_entries: int = 256):
+    self.ttl_seconds = ttl_seconds
+    self.max_entries = max_entries
+    self._entries: collections.OrderedDict[Hashable, Tuple[float, Any]] = (
+        collections.OrderedDict()
+    )
+    self._lock = threading.Lock()
+
+  def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Returns the cached value for key, computing and caching it if needed."""
+    now = time.monotonic()
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and entry[0] > now:
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    value = compute()
+
+    with self._lock:
+      self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+    return value
+
+  def discard_if(self, predicate: Callable[[Hashable], bool]) -> None:
+    """Removes the entries whose key matches the predicate."""
+    with self._lock:
+      for key in [key for key in self._entries if predicate(key)]:
+        del self._entries[key]
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
@@ -12,11 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+from typing import Any
+from typing import Callable
+
 from google.auth.credentials import Credentials
 from google.cloud import bigquery
 
 from . import client
 
+# Dataset and table metadata changes rarely, so it is cached for a short time to
+# avoid a round trip to BigQuery on every agent step.
+METADATA_CACHE_TTL_SECONDS = 60
+
+_metadata_cache = client.TtlCache(ttl_seconds=METADATA_CACHE_TTL_SECONDS)
+
+
+def _get_cached_metadata(
+    lookup: str,
+    credentials: Credentials,
+    resource_ids: tuple[str, ...],
+    compute: Callable[[], Any],
+) -> Any:
+  """Returns a copy of the cached metadata, computing it if needed."""
+  credentials_key = client.credentials_cache_key(credentials)
+  if credentials_key is None:
+    return compute()
+  # The caller owns the returned value, and may change it.
+  return copy.deepcopy(
+      _metadata_cache.get_or_compute(
+          (lookup, credentials_key) + resource_ids, compute
+      )
+  )
+
+
+def invalidate_cached_metadata(credentials: Credentials) -> None:
+  """Drops the metadata cached for the given credentials.
+
+  Called after statements that may have created, changed or dropped datasets
+  and tables, so that the next lookup sees the change.
+  """
+  credentials_key = client.credentials_cache_key(credentials)
+  if credentials_key is None:
+    return
+  _metadata_cache.discard_if(lambda key: key[1] == credentials_key)
+
 
 def list_dataset_ids(project_id: str, credentials: Credentials) -> list[str]:
   """List BigQuery dataset ids in a Google Cloud project.
@@ -46,10 +86,18 @@ def list_dataset_ids(project_id: str, credentials: Credentials) -> list[str]:
         project=project_id, credentials=credentials
     )
 
-    datasets = []
-    for dataset in bq_client.list_datasets(project_id):
-      datasets.append(dataset.dataset_id)
-    return datasets
+    def _list_dataset_ids():
+      datasets = []
+      for dataset in bq_client.list_datasets(project_id):
+        datasets.append(dataset.dataset_id)
+      return datasets
+
+    return _get_cached_metadata(
+        "list_dataset_ids",
+        credentials,
+        (project_id,),
+        _list_dataset_ids,
+    )
   except Exception as ex:
     return {
         "status": "ERROR",
@@ -111,10 +159,14 @@ def get_dataset_info(
     bq_client = client.get_bigquery_client(
         project=project_id, credentials=credentials
     )
-    dataset = bq_client.get_dataset(
-        bigquery.DatasetReference(project_id, dataset_id)
+    return _get_cached_metadata(
+        "get_dataset_info",
+        credentials,
+        (project_id, dataset_id),
+        lambda: bq_client.get_dataset(
+            bigquery.DatasetReference(project_id, dataset_id)
+        ).to_api_repr(),
     )
-    return dataset.to_api_repr()
   except Exception as ex:
     return {
         "status": "ERROR",
@@ -145,12 +197,20 @@ def list_table_ids(
         project=project_id, credentials=credentials
     )
 
-    tables = []
-    for table in bq_client.list_tables(
-        bigquery.DatasetReference(project_id, dataset_id)
-    ):
-      tables.append(table.table_id)
-    return tables
+    def _list_table_ids():
+      tables = []
+      for table in bq_client.list_tables(
+          bigquery.DatasetReference(project_id, dataset_id)
+      ):
+        tables.append(table.table_id)
+      return tables
+
+    return _get_cached_metadata(
+        "list_table_ids",
+        credentials,
+        (project_id, dataset_id),
+        _list_table_ids,
+    )
   except Exception as ex:
     return {
         "status": "ERROR",
@@ -260,11 +320,16 @@ def get_table_info(
     bq_client = client.get_bigquery_client(
         project=project_id, credentials=credentials
     )
-    return bq_client.get_table(
-        bigquery.TableReference(
-            bigquery.DatasetReference(project_id, dataset_id), table_id
-        )
-    ).to_api_repr()
+    return _get_cached_metadata(
+        "get_table_info",
+        credentials,
+        (project_id, dataset_id, table_id),
+        lambda: bq_client.get_table(
+            bigquery.TableReference(
+                bigquery.DatasetReference(project_id, dataset_id), table_id
+            )
+        ).to_api_repr(),
+    )
   except Exception as ex:
     return {
         "status": "ERROR",
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import functools
+import json
 import types
 from typing import Callable
 
@@ -20,11 +21,15 @@ from google.auth.credentials import Credentials
 from google.cloud import bigquery
 
 from . import client
+from . import metadata_tool
 from ..tool_context import ToolContext
 from .config import BigQueryToolConfig
 from .config import WriteMode
 
 MAX_DOWNLOADED_QUERY_RESULT_ROWS = 50
+# Approximate budget for the JSON size of the returned rows, so that a few wide
+# rows cannot blow up the LLM context.
+MAX_DOWNLOADED_QUERY_RESULT_BYTES = 64 * 1024
 BIGQUERY_SESSION_INFO_KEY = "bigquery_session_info"
 
 
@@ -153,15 +158,37 @@ def execute_sql(
         if bq_connection_properties
         else None
     )
-    row_iterator = bq_client.query_and_wait(
-        query,
-        job_config=job_config,
-        project=project_id,
-        max_results=MAX_DOWNLOADED_QUERY_RESULT_ROWS,
-    )
-    rows = [{key: val for key, val in row.items()} for row in row_iterator]
+    try:
+      row_iterator = bq_client.query_and_wait(
+          query,
+          job_config=job_config,
+          project=project_id,
+          max_results=MAX_DOWNLOADED_QUERY_RESULT_ROWS,
+      )
+    finally:
+      # The statement type is only known after a dry run, which the allowed
+      # write mode skips, so any statement that may have written drops the
+      # cached dataset and table metadata.
+      if config and config.write_mode != WriteMode.BLOCKED:
+        if (
+            config.write_mode == WriteMode.ALLOWED
+            or dry_run_query_job.statement_type != "SELECT"
+        ):
+          metadata_tool.invalidate_cached_metadata(credentials)
+    # Rows are consumed as the iterator pages through them, and reading stops
+    # once the byte budget is exhausted.
+    rows = []
+    result_bytes = 0
+    result_is_truncated = False
+    for row in row_iterator:
+      row_dict = {key: val for key, val in row.items()}
+      result_bytes += len(json.dumps(row_dict, default=str))
+      if rows and result_bytes > MAX_DOWNLOADED_QUERY_RESULT_BYTES:
+        result_is_truncated = True
+        break
+      rows.append(row_dict)
     result = {"status": "SUCCESS", "rows": rows}
-    if (
+    if result_is_truncated or (
         MAX_DOWNLOADED_QUERY_RESULT_ROWS is not None
         and len(rows) == MAX_DOWNLOADED_QUERY_RESULT_ROWS
     ):
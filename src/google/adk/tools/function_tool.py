@@ -60,9 +60,19 @@ class FunctionTool(BaseTool):
     super().__init__(name=name, description=doc)
     self.func = func
     self._ignore_params = ['tool_context', 'input_stream']
+    self._cached_declaration: Optional[
+        tuple[Callable[..., Any], tuple[Any, ...], types.FunctionDeclaration]
+    ] = None
 
   @override
   def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+    # Building the declaration inspects the function and generates pydantic
+    # schemas, which is too expensive to repeat on every LLM request.
+    cache_key = (self._api_variant, tuple(self._ignore_params))
+    cached = self._cached_declaration
+    if cached and cached[0] is self.func and cached[1] == cache_key:
+      return cached[2]
+
     function_decl = types.FunctionDeclaration.model_validate(
         build_function_declaration(
             func=self.func,
@@ -72,6 +82,7 @@ class FunctionTool(BaseTool):
             variant=self._api_variant,
         )
     )
+    self._cached_declaration = (self.func, cache_key, function_decl)
 
     return function_decl
 
@@ -79,6 +90,29 @@ class FunctionTool(BaseTool):
   async def run_async(
       self, *, args: dict[str, Any], tool_context: ToolContext
   ) -> Any:
+    args_to_call = self._get_args_to_call(args, tool_context)
+
+    # Before invoking the function, we check for if the list of args passed in
+    # has all the mandatory arguments or not.
+    # If the check fails, then we don't invoke the tool and let the Agent know
+    # that there was a missing a input parameter. This will basically help
+    # the underlying model fix the issue and retry.
+    missing_args_error = self._get_missing_mandatory_args_error(args_to_call)
+    if missing_args_error:
+      return missing_args_error
+
+    if self._is_coroutine_func():
+      return await self.func(**args_to_call)
+    else:
+      return await self._call_sync_func(args_to_call)
+
+  async def _call_sync_func(self, args_to_call: dict[str, Any]) -> Any:
+    """Calls the synchronous function, on the event loop thread by default."""
+    return self.func(**args_to_call)
+
+  def _get_args_to_call(
+      self, args: dict[str, Any], tool_context: ToolContext
+  ) -> dict[str, Any]:
     args_to_call = args.copy()
     signature = inspect.signature(self.func)
     valid_params = {param for param in signature.parameters}
@@ -86,13 +120,11 @@ class FunctionTool(BaseTool):
       args_to_call['tool_context'] = tool_context
 
     # Filter args_to_call to only include valid parameters for the function
-    args_to_call = {k: v for k, v in args_to_call.items() if k in valid_params}
+    return {k: v for k, v in args_to_call.items() if k in valid_params}
 
-    # Before invoking the function, we check for if the list of args passed in
-    # has all the mandatory arguments or not.
-    # If the check fails, then we don't invoke the tool and let the Agent know
-    # that there was a missing a input parameter. This will basically help
-    # the underlying model fix the issue and retry.
+  def _get_missing_mandatory_args_error(
+      self, args_to_call: dict[str, Any]
+  ) -> Optional[dict[str, str]]:
     mandatory_args = self._get_mandatory_args()
     missing_mandatory_args = [
         arg for arg in mandatory_args if arg not in args_to_call
@@ -104,18 +136,16 @@ class FunctionTool(BaseTool):
 {missing_mandatory_args_str}
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
       return {'error': error_str}
+    return None
 
+  def _is_coroutine_func(self) -> bool:
     # Functions are callable objects, but not all callable objects are functions
     # checking coroutine function is not enough. We also need to check whether
     # Callable's __call__ function is a coroutine funciton
-    if (
-        inspect.iscoroutinefunction(self.func)
-        or hasattr(self.func, '__call__')
+    return inspect.iscoroutinefunction(self.func) or (
+        hasattr(self.func, '__call__')
         and inspect.iscoroutinefunction(self.func.__call__)
-    ):
-      return await self.func(**args_to_call)
-    else:
-      return self.func(**args_to_call)
+    )
 
   # TODO(hangfei): fix call live for function stream.
   async def _call_live(
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
@@ -23,19 +25,36 @@ from .base_tool import BaseTool
 from .tool_context import ToolContext
 
 if TYPE_CHECKING:
+  from ..agents.invocation_context import InvocationContext
   from ..models import LlmRequest
 
 
 class PreloadMemoryTool(BaseTool):
   """A tool that preloads the memory for the current user.
 
+  The memory is searched once per invocation, and the rendered instruction is
+  reused by every LLM request of the invocation.
+
   NOTE: Currently this tool only uses text part from the memory.
   """
 
-  def __init__(self):
+  def __init__(self, *, prefetch: bool = False):
+    """Initializes the PreloadMemoryTool.
+
+    Args:
+      prefetch: Whether to start the memory search as soon as the LLM request
+        starts being built, so that it runs concurrently with the other request
+        processors instead of after them.
+    """
     # Name and description are not used because this tool only
     # changes llm_request.
     super().__init__(name='preload_memory', description='preload_memory')
+    self.prefetch = prefetch
+
+  def start_memory_search(self, invocation_context: InvocationContext) -> None:
+    """Starts searching the memory for the user query in the background."""
+    if user_query := _get_user_query(invocation_context):
+      self._get_memory_instruction(invocation_context, user_query)
 
   @override
   async def process_llm_request(
@@ -44,18 +63,42 @@ class PreloadMemoryTool(BaseTool):
       tool_context: ToolContext,
       llm_request: LlmRequest,
   ) -> None:
-    user_content = tool_context.user_content
-    if (
-        not user_content
-        or not user_content.parts
-        or not user_content.parts[0].text
-    ):
+    invocation_context = tool_context._invocation_context
+    user_query = _get_user_query(invocation_context)
+    if not user_query:
       return
 
-    user_query: str = user_content.parts[0].text
+    future = self._get_memory_instruction(invocation_context, user_query)
+    try:
+      si = await future
+    except Exception:
+      # Failed searches are not cached, the next LLM request retries.
+      invocation_context._preloaded_memory_instructions.pop(user_query, None)
+      raise
+    if si:
+      llm_request.append_instructions([si])
+
+  def _get_memory_instruction(
+      self, invocation_context: InvocationContext, user_query: str
+  ) -> asyncio.Future[Optional[str]]:
+    cache = invocation_context._preloaded_memory_instructions
+    future = cache.get(user_query)
+    if future is None:
+      future = asyncio.ensure_future(
+          self._search_memory_instruction(invocation_context, user_query)
+      )
+      future.add_done_callback(_retrieve_exception)
+      # The cache keeps a reference to the search until the invocation ends.
+      cache[user_query] = future
+    return future
+
+  async def _search_memory_instruction(
+      self, invocation_context: InvocationContext, user_query: str
+  ) -> Optional[str]:
+    tool_context = ToolContext(invocation_context)
     response = await tool_context.search_memory(user_query)
     if not response.memories:
-      return
+      return None
 
     memory_text_lines = []
     for memory in response.memories:
@@ -66,7 +109,7 @@ class PreloadMemoryTool(BaseTool):
             f'{memory.author}: {memory_text}' if memory.author else memory_text
         )
     if not memory_text_lines:
-      return
+      return None
 
     full_memory_text = '\n'.join(memory_text_lines)
     si = f"""The following content is from your previous conversations with the user.
@@ -75,7 +118,25 @@ They may be useful for answering the user's current query.
 {full_memory_text}
 </PAST_CONVERSATIONS>
 """
-    llm_request.append_instructions([si])
+    return si
+
+
+def _retrieve_exception(future: asyncio.Future[Optional[str]]) -> None:
+  # The error of a search is raised to the LLM request which awaits it. This
+  # keeps asyncio from logging it when no LLM request awaits a prefetch.
+  if not future.cancelled():
+    future.exception()
+
+
+def _get_user_query(invocation_context: InvocationContext) -> Optional[str]:
+  user_content = invocation_context.user_content
+  if (
+      not user_content
+      or not user_content.parts
+      or not user_content.parts[0].text
+  ):
+    return None
+  return user_content.parts[0].text
 
 
 preload_memory_tool = PreloadMemoryTool()
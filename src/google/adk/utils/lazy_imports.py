@@ -0,0 +1,53 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy loading of the attributes of a package, as described in PEP 562."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any
+from typing import Callable
+
+
+def lazy_getattr(
+    package: str, lazy_imports: dict[str, str]
+) -> Callable[[str], Any]:
+  """Returns a module `__getattr__` which imports attributes on first access.
+
+  The imported attribute is then set on the package, so it is only looked up
+  once.
+
+  Args:
+    package: The name of the package.
+    lazy_imports: Maps the attributes to the modules which define them,
+      relative to the package, e.g. `.llm_agent`. A module is followed by
+      `:name` when the attribute is named differently in the module.
+
+  Returns:
+    The `__getattr__` of the package.
+  """
+
+  def __getattr__(name: str) -> Any:
+    target = lazy_imports.get(name)
+    if target is None:
+      raise AttributeError(f'module {package!r} has no attribute {name!r}')
+    module_name, _, attribute = target.partition(':')
+    module = importlib.import_module(module_name, package)
+    value = getattr(module, attribute or name)
+    setattr(sys.modules[package], name, value)
+    return value
+
+  return __getattr__
@@ -0,0 +1,158 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load tests `adk api_server` with an increasing number of workers.
+
+Each request runs an agent which spends some CPU time, as parsing and tool
+calls do, over a session stored in a shared SQLite database. The requests per
+second should scale with the workers, up to the number of cores.
+
+Usage:
+  python -m tests.benchmarks.api_server_workers_benchmark [max_workers]
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+APP_NAME = 'cpu_agent'
+NUM_REQUESTS = 400
+CONCURRENCY = 32
+
+_AGENT_PY = """
+import time
+
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.genai import types
+
+
+class CpuAgent(BaseAgent):
+
+  async def _run_async_impl(self, ctx):
+    # Spends 5 ms of CPU time.
+    deadline = time.process_time() + 0.005
+    while time.process_time() < deadline:
+      pass
+    yield Event(
+        author=self.name,
+        invocation_id=ctx.invocation_id,
+        content=types.Content(role='model', parts=[types.Part(text='Done.')]),
+    )
+
+
+root_agent = CpuAgent(name='cpu_agent')
+"""
+
+
+def _free_port() -> int:
+  with socket.socket() as s:
+    s.bind(('127.0.0.1', 0))
+    return s.getsockname()[1]
+
+
+async def _wait_until_ready(client: httpx.AsyncClient):
+  for _ in range(600):
+    try:
+      response = await client.get('/list-apps')
+      if response.status_code == 200:
+        return
+    except httpx.TransportError:
+      pass
+    await asyncio.sleep(0.1)
+  raise TimeoutError('The server did not start.')
+
+
+async def _load_test(port: int) -> float:
+  """Returns the requests per second."""
+  async with httpx.AsyncClient(
+      base_url=f'http://127.0.0.1:{port}',
+      timeout=60,
+      limits=httpx.Limits(max_connections=CONCURRENCY),
+  ) as client:
+    await _wait_until_ready(client)
+    session_ids = []
+    for i in range(CONCURRENCY):
+      response = await client.post(f'/apps/{APP_NAME}/users/user/sessions')
+      response.raise_for_status()
+      session_ids.append(response.json()['id'])
+
+    async def run(i: int):
+      response = await client.post(
+          '/run',
+          json={
+              'app_name': APP_NAME,
+              'user_id': 'user',
+              'session_id': session_ids[i % CONCURRENCY],
+              'new_message': {'role': 'user', 'parts': [{'text': f'{i}'}]},
+          },
+      )
+      response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(i) for i in range(NUM_REQUESTS)))
+    return NUM_REQUESTS / (time.perf_counter() - start)
+
+
+def main(max_workers: int):
+  with tempfile.TemporaryDirectory() as tmp_dir:
+    agents_dir = os.path.join(tmp_dir, 'agents')
+    os.makedirs(os.path.join(agents_dir, APP_NAME))
+    with open(os.path.join(agents_dir, APP_NAME, '__init__.py'), 'w') as f:
+      f.write('from . import agent\n')
+    with open(os.path.join(agents_dir, APP_NAME, 'agent.py'), 'w') as f:
+      f.write(_AGENT_PY)
+
+    print(
+        f'{NUM_REQUESTS} requests, {CONCURRENCY} concurrent, on'
+        f' {os.cpu_count()} cores'
+    )
+    print(f'{"workers":>8} {"requests/s":>12}')
+    workers = 1
+    while workers <= max_workers:
+      port = _free_port()
+      db_path = os.path.join(tmp_dir, f'sessions_{workers}.db')
+      server = subprocess.Popen(
+          [
+              sys.executable,
+              '-m',
+              'google.adk.cli',
+              'api_server',
+              f'--port={port}',
+              f'--workers={workers}',
+              f'--session_service_uri=sqlite:///{db_path}',
+              '--log_level=WARNING',
+              '--no-reload',
+              agents_dir,
+          ],
+          stdout=subprocess.DEVNULL,
+          stderr=subprocess.DEVNULL,
+      )
+      try:
+        requests_per_second = asyncio.run(_load_test(port))
+      finally:
+        server.terminate()
+        server.wait()
+      print(f'{workers:>8} {requests_per_second:>12.0f}')
+      workers *= 2
+
+
+if __name__ == '__main__':
+  main(int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1)
@@ -0,0 +1,131 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks the GcsArtifactService against a fake GCS with network latency.
+
+The fake GCS blocks for a fixed round-trip time on each request, like the
+synchronous google.cloud.storage client does.
+
+Usage:
+  python -m tests.benchmarks.gcs_artifact_benchmark
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+from unittest import mock
+
+from google.adk.artifacts import GcsArtifactService
+from google.api_core import exceptions
+from google.genai import types
+
+ROUND_TRIP_SECONDS = 0.02
+NUM_CONCURRENT_SAVES = 20
+NUM_SEQUENTIAL_SAVES = 20
+
+
+class FakeBlob:
+
+  def __init__(self, bucket: 'FakeBucket', name: str):
+    self._bucket = bucket
+    self.name = name
+    self.content_type: Optional[str] = None
+
+  def upload_from_string(
+      self, data, content_type=None, if_generation_match=None
+  ):
+    time.sleep(ROUND_TRIP_SECONDS)
+    with self._bucket.lock:
+      if if_generation_match == 0 and self.name in self._bucket.contents:
+        raise exceptions.PreconditionFailed(self.name)
+      self._bucket.contents[self.name] = data
+    self.content_type = content_type
+
+  def download_as_bytes(self):
+    time.sleep(ROUND_TRIP_SECONDS)
+    return self._bucket.contents.get(self.name, b'')
+
+  def delete(self):
+    time.sleep(ROUND_TRIP_SECONDS)
+    self._bucket.contents.pop(self.name, None)
+
+
+class FakeBucket:
+
+  def __init__(self):
+    self.lock = threading.Lock()
+    self.contents: dict[str, bytes] = {}
+
+  def blob(self, name: str) -> FakeBlob:
+    return FakeBlob(self, name)
+
+
+class FakeClient:
+
+  def __init__(self):
+    self._bucket = FakeBucket()
+
+  def bucket(self, name: str) -> FakeBucket:
+    del name
+    return self._bucket
+
+  def list_blobs(self, bucket: FakeBucket, prefix: str):
+    time.sleep(ROUND_TRIP_SECONDS)
+    with bucket.lock:
+      names = [name for name in bucket.contents if name.startswith(prefix)]
+    return [FakeBlob(bucket, name) for name in names]
+
+
+async def main():
+  with mock.patch('google.cloud.storage.Client', return_value=FakeClient()):
+    service = GcsArtifactService(bucket_name='benchmark')
+  artifact = types.Part.from_bytes(data=b'data', mime_type='text/plain')
+
+  async def save(filename: str):
+    return await service.save_artifact(
+        app_name='app',
+        user_id='user',
+        session_id='session',
+        filename=filename,
+        artifact=artifact,
+    )
+
+  start = time.perf_counter()
+  await asyncio.gather(*(save(f'file{i}') for i in range(NUM_CONCURRENT_SAVES)))
+  concurrent_ms = (time.perf_counter() - start) * 1000
+
+  start = time.perf_counter()
+  for _ in range(NUM_SEQUENTIAL_SAVES):
+    await save('file0')
+  sequential_ms = (time.perf_counter() - start) * 1000 / NUM_SEQUENTIAL_SAVES
+
+  start = time.perf_counter()
+  await service.list_artifact_keys(
+      app_name='app', user_id='user', session_id='session'
+  )
+  list_keys_ms = (time.perf_counter() - start) * 1000
+
+  round_trip_ms = ROUND_TRIP_SECONDS * 1000
+  print(f'Round trip: {round_trip_ms:.0f} ms')
+  print(
+      f'{NUM_CONCURRENT_SAVES} concurrent saves of new artifacts:'
+      f' {concurrent_ms:.0f} ms'
+  )
+  print(f'Saves of a new version: {sequential_ms:.1f} ms/save')
+  print(f'list_artifact_keys: {list_keys_ms:.1f} ms')
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
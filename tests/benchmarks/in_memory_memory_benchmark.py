@@ -0,0 +1,104 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks searching 1M events in the InMemoryMemoryService.
+
+Usage:
+  python -m tests.benchmarks.in_memory_memory_benchmark [num_events]
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+from google.adk.events import Event
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+
+NUM_EVENTS = 1_000_000
+EVENTS_PER_SESSION = 1_000
+WORDS_PER_EVENT = 12
+VOCABULARY_SIZE = 50_000
+NUM_QUERIES = 100
+TOP_K = 10
+
+
+def _make_sessions(num_events: int, vocabulary: list[str]) -> list[Session]:
+  rng = random.Random(0)
+  sessions = []
+  for session_index in range(num_events // EVENTS_PER_SESSION):
+    events = []
+    for event_index in range(EVENTS_PER_SESSION):
+      # Zipf-like word distribution, so that some words are very common.
+      words = [
+          vocabulary[int(rng.paretovariate(1.0)) % len(vocabulary)]
+          for _ in range(WORDS_PER_EVENT)
+      ]
+      events.append(
+          Event(
+              id=f'{session_index}-{event_index}',
+              invocation_id='invocation',
+              author='user',
+              content=types.Content(parts=[types.Part(text=' '.join(words))]),
+          )
+      )
+    sessions.append(
+        Session(
+            app_name='benchmark',
+            user_id='user',
+            id=str(session_index),
+            events=events,
+        )
+    )
+  return sessions
+
+
+async def main():
+  num_events = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_EVENTS
+  vocabulary = [
+      ''.join(chr(ord('a') + int(digit)) for digit in str(index))
+      for index in range(VOCABULARY_SIZE)
+  ]
+  sessions = _make_sessions(num_events, vocabulary)
+  rng = random.Random(1)
+  queries = [
+      ' '.join(rng.sample(vocabulary[10:1000], 3)) for _ in range(NUM_QUERIES)
+  ]
+
+  service = InMemoryMemoryService(top_k=TOP_K)
+  start = time.perf_counter()
+  for session in sessions:
+    await service.add_session_to_memory(session)
+  index_s = time.perf_counter() - start
+
+  start = time.perf_counter()
+  await service.add_session_to_memory(sessions[0])
+  readd_ms = (time.perf_counter() - start) * 1000
+
+  start = time.perf_counter()
+  for query in queries:
+    await service.search_memory(
+        app_name='benchmark', user_id='user', query=query
+    )
+  search_ms = (time.perf_counter() - start) * 1000 / NUM_QUERIES
+
+  print(f'{num_events} events, indexing: {index_s:.2f} s')
+  print(f'{num_events} events, re-adding a session: {readd_ms:.2f} ms')
+  print(f'{num_events} events, top-{TOP_K} search: {search_ms:.2f} ms/query')
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
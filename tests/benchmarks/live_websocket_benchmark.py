@@ -0,0 +1,157 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks the audio throughput of concurrent /run_live sessions.
+
+Each session streams 20 ms PCM frames to an api_server whose runner echoes
+them back, over JSON messages with base64 audio and over binary messages. The
+clients run in the same process as the server.
+
+Usage:
+  python -m tests.benchmarks.live_websocket_benchmark [num_sessions]
+"""
+
+import asyncio
+import base64
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+from unittest import mock
+
+from google.adk.cli.fast_api import get_fast_api_app
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.genai import types
+import httpx
+import uvicorn
+import websockets
+
+NUM_SESSIONS = 50
+FRAMES_PER_SESSION = 250
+# 20 ms of 16 kHz 16-bit mono PCM.
+FRAME = b'\x01\x02' * 320
+APP_NAME = 'live_echo'
+
+_AGENT_PY = """
+from google.adk.agents import Agent
+
+root_agent = Agent(name='live_echo', model='gemini-2.0-flash-live-001')
+"""
+
+
+async def _echo_run_live(self, session, live_request_queue, **kwargs):
+  while True:
+    request = await live_request_queue.get()
+    if request.close:
+      return
+    yield Event(
+        author=APP_NAME,
+        invocation_id='invocation',
+        partial=True,
+        content=types.Content(
+            role='model', parts=[types.Part(inline_data=request.blob)]
+        ),
+    )
+
+
+def _free_port() -> int:
+  with socket.socket() as s:
+    s.bind(('127.0.0.1', 0))
+    return s.getsockname()[1]
+
+
+async def _run_session(port: int, session_id: str, binary: bool) -> int:
+  """Streams the frames and returns the number of bytes received."""
+  url = (
+      f'ws://127.0.0.1:{port}/run_live?app_name={APP_NAME}&user_id=user'
+      f'&session_id={session_id}'
+  )
+  if binary:
+    url += '&binary=true&input_mime_type=audio/pcm'
+  received_bytes = 0
+  async with websockets.connect(url, max_size=None) as websocket:
+
+    async def send():
+      json_frame = json.dumps({
+          'blob': {
+              'mime_type': 'audio/pcm',
+              'data': base64.b64encode(FRAME).decode(),
+          }
+      })
+      for _ in range(FRAMES_PER_SESSION):
+        await websocket.send(FRAME if binary else json_frame)
+
+    sender = asyncio.create_task(send())
+    # Each frame comes back as an event, or as a binary message if binary.
+    for _ in range(FRAMES_PER_SESSION):
+      received_bytes += len(await websocket.recv())
+    await sender
+  return received_bytes
+
+
+async def _benchmark(port: int, num_sessions: int, binary: bool):
+  async with httpx.AsyncClient(base_url=f'http://127.0.0.1:{port}') as client:
+    for i in range(num_sessions):
+      response = await client.post(
+          f'/apps/{APP_NAME}/users/user/sessions/{binary}-{i}'
+      )
+      response.raise_for_status()
+
+  start = time.perf_counter()
+  received = await asyncio.gather(*(
+      _run_session(port, f'{binary}-{i}', binary) for i in range(num_sessions)
+  ))
+  seconds = time.perf_counter() - start
+  frames = num_sessions * FRAMES_PER_SESSION
+  audio_seconds = FRAMES_PER_SESSION * 0.02
+  print(
+      f'{"binary" if binary else "json":<8}'
+      f' {frames / seconds:>10.0f} frames/s'
+      f' {num_sessions * audio_seconds / seconds:>8.1f}x realtime'
+      f' {sum(received) / frames:>8.0f} bytes/frame received'
+  )
+
+
+async def main(num_sessions: int):
+  with tempfile.TemporaryDirectory() as agents_dir:
+    os.makedirs(os.path.join(agents_dir, APP_NAME))
+    with open(os.path.join(agents_dir, APP_NAME, '__init__.py'), 'w') as f:
+      f.write('from . import agent\n')
+    with open(os.path.join(agents_dir, APP_NAME, 'agent.py'), 'w') as f:
+      f.write(_AGENT_PY)
+
+    app = get_fast_api_app(agents_dir=agents_dir, web=False)
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host='127.0.0.1', port=port, log_level='warning')
+    )
+    with mock.patch.object(Runner, 'run_live', _echo_run_live):
+      serve = asyncio.create_task(server.serve())
+      while not server.started:
+        await asyncio.sleep(0.01)
+      print(
+          f'{num_sessions} sessions of {FRAMES_PER_SESSION} frames of'
+          f' {len(FRAME)} bytes'
+      )
+      for binary in (False, True):
+        await _benchmark(port, num_sessions, binary)
+      server.should_exit = True
+      await serve
+
+
+if __name__ == '__main__':
+  asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_SESSIONS))
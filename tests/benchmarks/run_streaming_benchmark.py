@@ -0,0 +1,175 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks the time to first byte and CPU per event of /run and /run_sse.
+
+The runner streams partial text events, as a model streaming its response
+does. The time to first byte is measured with a delay between the events, and
+the CPU time per event, which includes the client in the same process, without
+one.
+
+Usage:
+  python -m tests.benchmarks.run_streaming_benchmark
+"""
+
+import asyncio
+import os
+import socket
+import tempfile
+import time
+from unittest import mock
+
+from google.adk.cli.fast_api import get_fast_api_app
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.genai import types
+import httpx
+import uvicorn
+
+APP_NAME = 'text_stream'
+NUM_EVENTS = 2000
+TTFB_NUM_EVENTS = 50
+TTFB_EVENT_INTERVAL_SECONDS = 0.01
+# The size of the text of a streamed chunk.
+CHUNK = 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 2
+
+_AGENT_PY = """
+from google.adk.agents import Agent
+
+root_agent = Agent(name='text_stream', model='gemini-2.0-flash')
+"""
+
+_num_events = NUM_EVENTS
+_event_interval_seconds = 0.0
+
+
+async def _streaming_run_async(
+    self, user_id, session_id, new_message, **kwargs
+):
+  for _ in range(_num_events):
+    if _event_interval_seconds:
+      await asyncio.sleep(_event_interval_seconds)
+    yield Event(
+        author=APP_NAME,
+        invocation_id='invocation',
+        partial=True,
+        content=types.Content(role='model', parts=[types.Part(text=CHUNK)]),
+    )
+
+
+def _free_port() -> int:
+  with socket.socket() as s:
+    s.bind(('127.0.0.1', 0))
+    return s.getsockname()[1]
+
+
+async def _request(
+    client: httpx.AsyncClient, path: str, headers: dict[str, str], body: dict
+) -> tuple[float, int]:
+  """Returns the time to first byte and the number of bytes received."""
+  start = time.perf_counter()
+  ttfb = None
+  received_bytes = 0
+  async with client.stream('POST', path, json=body, headers=headers) as r:
+    r.raise_for_status()
+    async for chunk in r.aiter_raw():
+      if ttfb is None:
+        ttfb = time.perf_counter() - start
+      received_bytes += len(chunk)
+  return ttfb, received_bytes
+
+
+async def _benchmark(client: httpx.AsyncClient, name: str, path: str, **kwargs):
+  global _num_events, _event_interval_seconds
+  headers = kwargs.pop('headers', {})
+  body = {
+      'app_name': APP_NAME,
+      'user_id': 'user',
+      'session_id': 'session',
+      'new_message': {'role': 'user', 'parts': [{'text': 'Hi'}]},
+      **kwargs,
+  }
+
+  _num_events = TTFB_NUM_EVENTS
+  _event_interval_seconds = TTFB_EVENT_INTERVAL_SECONDS
+  ttfb, _ = await _request(client, path, headers, body)
+
+  _num_events = NUM_EVENTS
+  _event_interval_seconds = 0.0
+  start = time.process_time()
+  _, received_bytes = await _request(client, path, headers, body)
+  cpu_seconds = time.process_time() - start
+  print(
+      f'{name:<24} {ttfb * 1000:>8.1f} {cpu_seconds * 1e6 / NUM_EVENTS:>10.1f}'
+      f' {received_bytes / NUM_EVENTS:>12.0f}'
+  )
+
+
+async def main():
+  with tempfile.TemporaryDirectory() as agents_dir:
+    os.makedirs(os.path.join(agents_dir, APP_NAME))
+    with open(os.path.join(agents_dir, APP_NAME, '__init__.py'), 'w') as f:
+      f.write('from . import agent\n')
+    with open(os.path.join(agents_dir, APP_NAME, 'agent.py'), 'w') as f:
+      f.write(_AGENT_PY)
+
+    app = get_fast_api_app(agents_dir=agents_dir, web=False)
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host='127.0.0.1', port=port, log_level='warning')
+    )
+    with mock.patch.object(Runner, 'run_async', _streaming_run_async):
+      serve = asyncio.create_task(server.serve())
+      while not server.started:
+        await asyncio.sleep(0.01)
+      async with httpx.AsyncClient(
+          base_url=f'http://127.0.0.1:{port}', timeout=None
+      ) as client:
+        response = await client.post(
+            f'/apps/{APP_NAME}/users/user/sessions/session'
+        )
+        response.raise_for_status()
+        print(
+            f'{TTFB_NUM_EVENTS} events {TTFB_EVENT_INTERVAL_SECONDS * 1000:.0f}'
+            f' ms apart for the time to first byte, {NUM_EVENTS} events of'
+            f' {len(CHUNK)} chars for the CPU time'
+        )
+        print(
+            f'{"endpoint":<24} {"ttfb ms":>8} {"cpu us/ev":>10}'
+            f' {"bytes/event":>12}'
+        )
+        await _benchmark(client, '/run json', '/run')
+        await _benchmark(
+            client,
+            '/run ndjson',
+            '/run',
+            headers={'Accept': 'application/x-ndjson'},
+        )
+        await _benchmark(
+            client,
+            '/run ndjson text deltas',
+            '/run',
+            headers={'Accept': 'application/x-ndjson'},
+            text_deltas=True,
+        )
+        await _benchmark(client, '/run_sse', '/run_sse')
+        await _benchmark(
+            client, '/run_sse text deltas', '/run_sse', text_deltas=True
+        )
+      server.should_exit = True
+      await serve
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
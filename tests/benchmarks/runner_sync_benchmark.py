@@ -0,0 +1,151 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks sequential calls of the synchronous Runner.run.
+
+Compares the background event loop of the runner with a new thread and event
+loop per call, which Runner.run used to do. The agent calls a local HTTP server
+through a client bound to its event loop, as model clients are, so it can only
+reuse its connection when the loop outlives the call.
+
+Usage:
+  python -m tests.benchmarks.runner_sync_benchmark [num_calls]
+"""
+
+import asyncio
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import queue
+import sys
+import threading
+import time
+
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.adk.runners import InMemoryRunner
+from google.adk.runners import Runner
+from google.genai import types
+import httpx
+
+NUM_CALLS = 1000
+
+
+class _Handler(BaseHTTPRequestHandler):
+  protocol_version = 'HTTP/1.1'
+  disable_nagle_algorithm = True
+
+  def do_GET(self):
+    self.send_response(200)
+    self.send_header('Content-Length', '2')
+    self.end_headers()
+    self.wfile.write(b'ok')
+
+  def log_message(self, *args):
+    pass
+
+
+class _HttpAgent(BaseAgent):
+  """Calls the server with a client per event loop, as model clients do."""
+
+  url: str
+  connections: int = 0
+
+  async def _run_async_impl(self, ctx):
+    loop = asyncio.get_running_loop()
+    client = getattr(loop, '_benchmark_client', None)
+    if client is None:
+      client = httpx.AsyncClient()
+      loop._benchmark_client = client
+      self.connections += 1
+    response = await client.get(self.url)
+    yield Event(
+        author=self.name,
+        invocation_id=ctx.invocation_id,
+        content=types.Content(
+            role='model', parts=[types.Part(text=response.text)]
+        ),
+    )
+
+
+def _run_with_new_loop(runner: Runner, **kwargs):
+  """Runs the agent as Runner.run used to: in a new thread and event loop."""
+  event_queue = queue.Queue()
+
+  async def _invoke_run_async():
+    try:
+      async for event in runner.run_async(**kwargs):
+        event_queue.put(event)
+    finally:
+      event_queue.put(None)
+
+  thread = threading.Thread(target=lambda: asyncio.run(_invoke_run_async()))
+  thread.start()
+  while (event := event_queue.get()) is not None:
+    yield event
+  thread.join()
+
+
+async def _create_sessions(runner: Runner, num_sessions: int) -> list[str]:
+  return [
+      (
+          await runner.session_service.create_session(
+              app_name='benchmark', user_id='u'
+          )
+      ).id
+      for _ in range(num_sessions)
+  ]
+
+
+def _benchmark(name: str, run, agent: _HttpAgent, num_calls: int):
+  runner = InMemoryRunner(agent=agent, app_name='benchmark')
+  # A session per call keeps the cost of copying the session history out.
+  session_ids = asyncio.run(_create_sessions(runner, num_calls))
+  message = types.Content(role='user', parts=[types.Part(text='Hi')])
+  start = time.perf_counter()
+  for session_id in session_ids:
+    for _ in run(
+        runner, user_id='u', session_id=session_id, new_message=message
+    ):
+      pass
+  seconds = time.perf_counter() - start
+  asyncio.run(runner.close())
+  print(
+      f'{name:<24} {seconds * 1e6 / num_calls:>10.0f} {agent.connections:>12}'
+  )
+
+
+def main(num_calls: int):
+  server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  url = f'http://127.0.0.1:{server.server_address[1]}/'
+
+  print(f'{num_calls} sequential calls')
+  print(f'{"runner":<24} {"us/call":>10} {"clients":>12}')
+  _benchmark(
+      'new loop per call',
+      _run_with_new_loop,
+      _HttpAgent(name='agent', url=url),
+      num_calls,
+  )
+  _benchmark(
+      'background loop',
+      lambda runner, **kwargs: runner.run(**kwargs),
+      _HttpAgent(name='agent', url=url),
+      num_calls,
+  )
+  server.shutdown()
+
+
+if __name__ == '__main__':
+  main(int(sys.argv[1]) if len(sys.argv) > 1 else NUM_CALLS)
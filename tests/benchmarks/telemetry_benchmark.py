@@ -0,0 +1,169 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks the overhead of tracing an LLM call with a long history.
+
+For each payload capture mode, reports the time spent in trace_call_llm on the
+hot path, and the time to export the span, which includes the deferred
+serialization of the payloads.
+
+Usage:
+  python -m tests.benchmarks.telemetry_benchmark
+"""
+
+import asyncio
+import time
+
+from google.adk import telemetry
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.sessions import InMemorySessionService
+from google.adk.telemetry import DeferredPayloadSpanProcessor
+from google.adk.telemetry import PayloadCaptureConfig
+from google.adk.telemetry import PayloadCaptureMode
+from google.genai import types
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+NUM_TURNS = 200
+NUM_IMAGES = 5
+IMAGE_SIZE = 1024 * 1024
+NUM_CALLS = 50
+
+
+def _make_llm_request() -> LlmRequest:
+  contents = []
+  for turn in range(NUM_TURNS):
+    contents.append(
+        types.Content(
+            role='user',
+            parts=[types.Part.from_text(text=f'Question {turn}. ' * 20)],
+        )
+    )
+    contents.append(
+        types.Content(
+            role='model',
+            parts=[types.Part.from_text(text=f'Answer {turn}. ' * 50)],
+        )
+    )
+  for _ in range(NUM_IMAGES):
+    contents.append(
+        types.Content(
+            role='user',
+            parts=[
+                types.Part.from_bytes(
+                    data=b'\0' * IMAGE_SIZE, mime_type='image/png'
+                )
+            ],
+        )
+    )
+  return LlmRequest(
+      model='gemini-2.0-flash',
+      contents=contents,
+      config=types.GenerateContentConfig(system_instruction='Be helpful.'),
+  )
+
+
+async def _make_invocation_context() -> InvocationContext:
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='benchmark', user_id='user'
+  )
+  return InvocationContext(
+      invocation_id='invocation',
+      agent=LlmAgent(name='agent'),
+      session=session,
+      session_service=session_service,
+  )
+
+
+def _run(
+    invocation_context: InvocationContext,
+    llm_request: LlmRequest,
+    llm_response: LlmResponse,
+    deferred: bool,
+) -> tuple[float, float]:
+  """Returns the hot path and export times of a call, in milliseconds."""
+  exporter = InMemorySpanExporter()
+  span_processor = SimpleSpanProcessor(exporter)
+  if deferred:
+    span_processor = DeferredPayloadSpanProcessor(span_processor)
+  provider = TracerProvider()
+  provider.add_span_processor(span_processor)
+  tracer = provider.get_tracer('benchmark')
+
+  hot_path_seconds = 0.0
+  export_seconds = 0.0
+  for _ in range(NUM_CALLS):
+    with tracer.start_as_current_span('call_llm'):
+      start = time.perf_counter()
+      telemetry.trace_call_llm(
+          invocation_context, 'event', llm_request, llm_response
+      )
+      hot_path_seconds += time.perf_counter() - start
+    start = time.perf_counter()
+    for span in exporter.get_finished_spans():
+      dict(span.attributes)
+    export_seconds += time.perf_counter() - start
+    exporter.clear()
+  return (
+      hot_path_seconds * 1000 / NUM_CALLS,
+      export_seconds * 1000 / NUM_CALLS,
+  )
+
+
+async def main():
+  invocation_context = await _make_invocation_context()
+  llm_request = _make_llm_request()
+  llm_response = LlmResponse(
+      content=types.Content(
+          role='model', parts=[types.Part.from_text(text='Answer. ' * 100)]
+      )
+  )
+
+  print(
+      f'{NUM_TURNS} turns and {NUM_IMAGES} images of'
+      f' {IMAGE_SIZE // 1024} KiB, {NUM_CALLS} calls'
+  )
+  print(f'{"mode":<24} {"hot path ms":>12} {"export ms":>10}')
+  configs = [
+      ('full', PayloadCaptureConfig(), False),
+      ('full, deferred', PayloadCaptureConfig(), True),
+      (
+          'truncated',
+          PayloadCaptureConfig(mode=PayloadCaptureMode.TRUNCATED),
+          False,
+      ),
+      (
+          'sampled 10%',
+          PayloadCaptureConfig(
+              mode=PayloadCaptureMode.SAMPLED, sample_rate=0.1
+          ),
+          False,
+      ),
+      ('off', PayloadCaptureConfig(mode=PayloadCaptureMode.OFF), False),
+  ]
+  for name, config, deferred in configs:
+    telemetry.set_payload_capture_config(config)
+    hot_path_ms, export_ms = _run(
+        invocation_context, llm_request, llm_response, deferred
+    )
+    print(f'{name:<24} {hot_path_ms:>12.2f} {export_ms:>10.2f}')
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
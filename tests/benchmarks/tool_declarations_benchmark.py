@@ -0,0 +1,88 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks adding the tools of an agent with 50 tools to LLM requests.
+
+Usage:
+  python -m tests.benchmarks.tool_declarations_benchmark
+"""
+
+import asyncio
+import time
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.tools.tool_context import ToolContext
+
+NUM_TOOLS = 50
+NUM_STEPS = 200
+
+
+def _make_tool(index: int):
+  def tool(city: str, days: int, units: str) -> dict[str, str]:
+    """Returns the weather forecast for a city.
+
+    Args:
+      city: The city to get the forecast for.
+      days: The number of days to forecast.
+      units: The units to use.
+    """
+    return {'city': city}
+
+  tool.__name__ = f'get_forecast_{index}'
+  return tool
+
+
+async def _run_step(agent: LlmAgent, invocation_context: InvocationContext):
+  llm_request = LlmRequest()
+  for tool in await agent.canonical_tools(ReadonlyContext(invocation_context)):
+    await tool.process_llm_request(
+        tool_context=ToolContext(invocation_context), llm_request=llm_request
+    )
+  return llm_request
+
+
+async def main():
+  agent = LlmAgent(
+      name='agent', tools=[_make_tool(i) for i in range(NUM_TOOLS)]
+  )
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='benchmark', user_id='user'
+  )
+  invocation_context = InvocationContext(
+      invocation_id='invocation',
+      agent=agent,
+      session=session,
+      session_service=session_service,
+  )
+
+  start = time.perf_counter()
+  await _run_step(agent, invocation_context)
+  cold_ms = (time.perf_counter() - start) * 1000
+
+  start = time.perf_counter()
+  for _ in range(NUM_STEPS):
+    await _run_step(agent, invocation_context)
+  warm_ms = (time.perf_counter() - start) * 1000 / NUM_STEPS
+
+  print(f'{NUM_TOOLS} tools, first step: {cold_ms:.2f} ms')
+  print(f'{NUM_TOOLS} tools, cached steps: {warm_ms:.2f} ms/step')
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
@@ -1,9 +1,11 @@
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from google.adk.agents.live_request_queue import LiveRequest
 from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.live_request_queue import OverflowPolicy
 from google.genai import types
 import pytest
 
@@ -54,3 +56,103 @@ async def test_get():
 
     assert result == res
     mock_get.assert_called_once()
+
+
+def _blob(data: bytes, mime_type: str = "audio/pcm") -> types.Blob:
+  return types.Blob(data=data, mime_type=mime_type)
+
+
+def _drain(queue: LiveRequestQueue) -> list[LiveRequest]:
+  requests = []
+  while not queue._queue.empty():
+    requests.append(queue._queue.get_nowait())
+  return requests
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_blobs():
+  queue = LiveRequestQueue(max_realtime_requests=2)
+  content = types.Content(parts=[types.Part(text="hello")])
+  queue.send_realtime(_blob(b"1"))
+  queue.send_content(content)
+  queue.send_realtime(_blob(b"2"))
+  queue.send_realtime(_blob(b"3"))
+
+  stats = queue.get_stats()
+  assert [r.content or r.blob.data for r in _drain(queue)] == [
+      content,
+      b"2",
+      b"3",
+  ]
+  assert stats.queued_requests == 3
+  assert stats.queued_realtime_requests == 2
+  assert stats.queued_realtime_bytes == 2
+  assert stats.dropped_realtime_requests == 1
+  assert stats.dropped_realtime_bytes == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_newest_blobs():
+  queue = LiveRequestQueue(
+      max_realtime_bytes=4, overflow_policy=OverflowPolicy.DROP_NEWEST
+  )
+  queue.send_realtime(_blob(b"12"))
+  queue.send_realtime(_blob(b"34"))
+  queue.send_realtime(_blob(b"56"))
+  queue.close()
+
+  assert [r.blob.data if r.blob else r.close for r in _drain(queue)] == [
+      b"12",
+      b"34",
+      True,
+  ]
+  assert queue.get_stats().dropped_realtime_bytes == 2
+
+
+@pytest.mark.asyncio
+async def test_full_queue_coalesces_blobs_of_same_mime_type():
+  queue = LiveRequestQueue(
+      max_realtime_requests=2, overflow_policy=OverflowPolicy.COALESCE
+  )
+  queue.send_realtime(_blob(b"1"))
+  queue.send_realtime(_blob(b"2"))
+  queue.send_realtime(_blob(b"3"))
+  queue.send_realtime(_blob(b"4", mime_type="image/jpeg"))
+
+  stats = queue.get_stats()
+  assert [r.blob.data for r in _drain(queue)] == [b"23", b"4"]
+  assert stats.coalesced_realtime_requests == 1
+  assert stats.dropped_realtime_requests == 1
+  assert stats.queued_realtime_bytes == 3
+  assert queue.get_stats().queued_realtime_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_request():
+  queue = LiveRequestQueue()
+  get = asyncio.create_task(queue.get())
+  await asyncio.sleep(0)
+  assert not get.done()
+
+  queue.send_realtime(_blob(b"1"))
+
+  assert (await get).blob.data == b"1"
+
+
+@pytest.mark.asyncio
+async def test_waiting_getters_get_one_request_each():
+  queue = LiveRequestQueue(
+      max_realtime_requests=1, overflow_policy=OverflowPolicy.DROP_NEWEST
+  )
+  gets = [asyncio.create_task(queue.get()) for _ in range(2)]
+  await asyncio.sleep(0)
+
+  queue.send_realtime(_blob(b"1"))
+  queue.send_realtime(_blob(b"2"))
+  await asyncio.sleep(0)
+  assert [get.done() for get in gets].count(True) == 1
+
+  queue.close()
+  results = await asyncio.gather(*gets)
+  assert [r.blob.data if r.blob else r.close for r in results] == [b"1", True]
+  assert queue.get_stats().dropped_realtime_requests == 1
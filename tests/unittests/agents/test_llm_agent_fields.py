@@ -280,3 +280,30 @@ def test_allow_transfer_by_default():
 
   assert not agent.disallow_transfer_to_parent
   assert not agent.disallow_transfer_to_peers
+
+
+async def test_canonical_tools_reuses_function_tools():
+  def tool_a(x: int) -> int:
+    """Tool a."""
+    return x
+
+  def tool_b(x: int) -> int:
+    """Tool b."""
+    return x
+
+  agent = LlmAgent(name='test_agent', tools=[tool_a])
+  ctx = await _create_readonly_context(agent)
+
+  tools1 = await agent.canonical_tools(ctx)
+  tools2 = await agent.canonical_tools(ctx)
+  assert tools1[0] is tools2[0]
+
+  agent.tools = [tool_a, tool_b]
+  tools3 = await agent.canonical_tools(ctx)
+  assert tools3[0] is tools1[0]
+  assert tools3[1].name == 'tool_b'
+
+  agent.tools = [tool_b]
+  tools4 = await agent.canonical_tools(ctx)
+  assert tools4[0] is tools3[1]
+  assert len(agent._function_tools) == 1
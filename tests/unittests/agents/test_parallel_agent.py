@@ -15,17 +15,27 @@
 """Tests for the ParallelAgent."""
 
 import asyncio
+import contextlib
+from typing import Any
 from typing import AsyncGenerator
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.llm_agent import LlmAgent
 from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.agents.run_config import RunConfig
 from google.adk.agents.sequential_agent import SequentialAgent
 from google.adk.events import Event
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.base_llm_connection import BaseLlmConnection
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
 import pytest
 from typing_extensions import override
+from websockets.exceptions import ConnectionClosedOK
 
 
 class _TestingAgent(BaseAgent):
@@ -135,3 +145,290 @@ async def test_run_async_branches(request: pytest.FixtureRequest):
   # Sub-agents should have different branches.
   assert events[2].branch != events[1].branch
   assert events[2].branch != events[0].branch
+
+
+class _Tracker:
+  """Records the sub-agents running, and the sub-agents cancelled."""
+
+  def __init__(self):
+    self.running = []
+    self.max_running = 0
+    self.cancelled = []
+
+
+class _TrackingAgent(_TestingAgent):
+
+  tracker: Any
+  error: bool = False
+
+  @override
+  async def _run_async_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    tracker = self.tracker
+    tracker.running.append(self.name)
+    tracker.max_running = max(tracker.max_running, len(tracker.running))
+    try:
+      await asyncio.sleep(self.delay)
+      if self.error:
+        raise ValueError(f'{self.name} failed')
+      yield Event(
+          author=self.name,
+          branch=ctx.branch,
+          invocation_id=ctx.invocation_id,
+      )
+    except asyncio.CancelledError:
+      tracker.cancelled.append(self.name)
+      raise
+    finally:
+      tracker.running.remove(self.name)
+
+
+def _create_tracking_agents(
+    test_name: str, delays: list[float]
+) -> list[_TrackingAgent]:
+  tracker = _Tracker()
+  return [
+      _TrackingAgent(
+          name=f'{test_name}_test_agent_{i}', delay=delay, tracker=tracker
+      )
+      for i, delay in enumerate(delays)
+  ]
+
+
+@pytest.mark.asyncio
+async def test_run_async_max_concurrency(request: pytest.FixtureRequest):
+  agents = _create_tracking_agents(request.function.__name__, [0.01] * 10)
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=agents,
+      max_concurrency=3,
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+  events = [e async for e in parallel_agent.run_async(parent_ctx)]
+
+  assert sorted(e.author for e in events) == sorted(a.name for a in agents)
+  assert agents[0].tracker.max_running == 3
+  assert not agents[0].tracker.cancelled
+
+
+@pytest.mark.asyncio
+async def test_run_async_required_completions(request: pytest.FixtureRequest):
+  agents = _create_tracking_agents(
+      request.function.__name__, [0.01, 10, 0.02, 10]
+  )
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=agents,
+      required_completions=2,
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+  events = [e async for e in parallel_agent.run_async(parent_ctx)]
+
+  assert [e.author for e in events] == [agents[0].name, agents[2].name]
+  assert sorted(agents[0].tracker.cancelled) == [agents[1].name, agents[3].name]
+  assert not agents[0].tracker.running
+
+
+@pytest.mark.asyncio
+async def test_run_async_sub_agent_timeout(request: pytest.FixtureRequest):
+  agents = _create_tracking_agents(request.function.__name__, [0.3, 0.3, 10])
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=agents,
+      sub_agent_timeout=0.5,
+      max_concurrency=1,
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+  events = [e async for e in parallel_agent.run_async(parent_ctx)]
+
+  # The timeout of each sub-agent starts when the sub-agent starts.
+  assert [e.author for e in events] == [agents[0].name, agents[1].name]
+  assert agents[0].tracker.cancelled == [agents[2].name]
+
+
+@pytest.mark.asyncio
+async def test_run_async_error_cancels_sub_agents(
+    request: pytest.FixtureRequest,
+):
+  agents = _create_tracking_agents(request.function.__name__, [10, 0.01, 10])
+  agents[1].error = True
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=agents,
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+  with pytest.raises(ValueError, match='failed'):
+    async for _ in parallel_agent.run_async(parent_ctx):
+      pass
+
+  assert sorted(agents[0].tracker.cancelled) == [agents[0].name, agents[2].name]
+  assert not agents[0].tracker.running
+
+
+class _EchoLlmConnection(BaseLlmConnection):
+  """Answers each content sent to it, until it is closed."""
+
+  def __init__(self):
+    self.realtime_blobs = []
+    self._responses = asyncio.Queue()
+
+  async def send_history(self, history: list[types.Content]):
+    pass
+
+  async def send_content(self, content: types.Content):
+    self._responses.put_nowait(
+        LlmResponse(
+            content=types.ModelContent(f'Heard: {content.parts[0].text}'),
+            turn_complete=True,
+        )
+    )
+
+  async def send_realtime(self, blob: types.Blob):
+    self.realtime_blobs.append(blob)
+
+  async def receive(self) -> AsyncGenerator[LlmResponse, None]:
+    while True:
+      response = await self._responses.get()
+      if response is None:
+        raise ConnectionClosedOK(None, None)
+      yield response
+
+  async def close(self):
+    self._responses.put_nowait(None)
+
+
+class _EchoModel(BaseLlm):
+
+  model: str = 'echo'
+  connections: list = []
+
+  @override
+  async def generate_content_async(
+      self, llm_request: LlmRequest, stream: bool = False
+  ) -> AsyncGenerator[LlmResponse, None]:
+    raise NotImplementedError()
+    yield  # AsyncGenerator requires having at least one yield statement
+
+  @contextlib.asynccontextmanager
+  async def connect(self, llm_request: LlmRequest) -> BaseLlmConnection:
+    connection = _EchoLlmConnection()
+    self.connections.append(connection)
+    yield connection
+
+
+@pytest.mark.asyncio
+async def test_run_live(request: pytest.FixtureRequest):
+  model = _EchoModel(connections=[])
+  agents = [
+      LlmAgent(name=f'{request.function.__name__}_test_agent_{i}', model=model)
+      for i in range(2)
+  ]
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=agents,
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+  parent_ctx.live_request_queue = LiveRequestQueue()
+  parent_ctx.run_config = RunConfig()
+  parent_ctx.live_request_queue.send_realtime(
+      types.Blob(mime_type='audio/pcm', data=b'\x00\x01')
+  )
+  parent_ctx.live_request_queue.send_content(
+      types.Content(role='user', parts=[types.Part(text='Hello')])
+  )
+
+  events = []
+
+  async def run():
+    async for event in parallel_agent.run_live(parent_ctx):
+      if event.content:
+        events.append(event)
+        if len(events) == len(agents):
+          parent_ctx.live_request_queue.close()
+
+  await asyncio.wait_for(run(), timeout=10)
+
+  assert sorted(e.author for e in events) == [agent.name for agent in agents]
+  for event in events:
+    assert event.content.parts[0].text == 'Heard: Hello'
+    assert event.branch == f'{parallel_agent.name}.{event.author}'
+  # Each connection gets all the live requests.
+  assert len(model.connections) == len(agents)
+  for connection in model.connections:
+    assert [blob.data for blob in connection.realtime_blobs] == [b'\x00\x01']
+
+
+class _LiveRequestsAgent(BaseAgent):
+  """Echoes the contents of its live requests, and stops on 'stop'."""
+
+  @override
+  async def _run_live_impl(
+      self, ctx: InvocationContext
+  ) -> AsyncGenerator[Event, None]:
+    text = 'started'
+    while True:
+      yield Event(
+          author=self.name,
+          branch=ctx.branch,
+          invocation_id=ctx.invocation_id,
+          content=types.ModelContent(text),
+      )
+      if text == 'stop':
+        return
+      live_request = await ctx.live_request_queue.get()
+      if live_request.close:
+        return
+      text = live_request.content.parts[0].text
+
+
+@pytest.mark.asyncio
+async def test_run_live_copies_requests_to_running_sub_agents(
+    request: pytest.FixtureRequest,
+):
+  agents = [
+      _LiveRequestsAgent(name=f'{request.function.__name__}_test_agent_{i}')
+      for i in range(2)
+  ]
+  parallel_agent = ParallelAgent(
+      name=f'{request.function.__name__}_test_parallel_agent',
+      sub_agents=agents,
+      max_concurrency=1,
+  )
+  parent_ctx = await _create_parent_invocation_context(
+      request.function.__name__, parallel_agent
+  )
+  parent_ctx.live_request_queue = LiveRequestQueue()
+  for text in ['first', 'stop']:
+    parent_ctx.live_request_queue.send_content(types.UserContent(text))
+
+  events = []
+
+  async def run():
+    async for event in parallel_agent.run_live(parent_ctx):
+      events.append((event.author, event.content.parts[0].text))
+      if event.author == agents[1].name:
+        parent_ctx.live_request_queue.send_content(types.UserContent('last'))
+        parent_ctx.live_request_queue.close()
+
+  await asyncio.wait_for(run(), timeout=10)
+
+  # The second sub-agent starts once the first one stopped, and only gets the
+  # requests sent from then on.
+  assert events == [
+      (agents[0].name, 'started'),
+      (agents[0].name, 'first'),
+      (agents[0].name, 'stop'),
+      (agents[1].name, 'started'),
+      (agents[1].name, 'last'),
+  ]
@@ -0,0 +1,60 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.agents.transcription_entry import TranscriptionCache
+from google.adk.agents.transcription_entry import TranscriptionEntry
+from google.genai import types
+
+
+def _audio_entry(data: bytes) -> TranscriptionEntry:
+  return TranscriptionEntry(
+      role="user", data=types.Blob(data=data, mime_type="audio/pcm")
+  )
+
+
+def test_cache_drops_oldest_entries_beyond_max_entries():
+  cache = TranscriptionCache(max_entries=2)
+  for data in (b"1", b"2", b"3"):
+    cache.append(_audio_entry(data))
+
+  assert [entry.data.data for entry in cache] == [b"2", b"3"]
+  assert cache.size_bytes == 2
+  assert cache.dropped_entries == 1
+
+
+def test_cache_drops_oldest_entries_beyond_max_bytes():
+  cache = TranscriptionCache(max_bytes=4)
+  cache.append(_audio_entry(b"12"))
+  cache.append(
+      TranscriptionEntry(
+          role="model", data=types.Content(parts=[types.Part(text="ab")])
+      )
+  )
+  cache.append(_audio_entry(b"34"))
+
+  assert len(cache) == 2
+  assert cache.size_bytes == 4
+  assert cache.dropped_entries == 1
+
+  cache.clear()
+
+  assert len(cache) == 0
+  assert cache.size_bytes == 0
+
+
+def test_cache_keeps_latest_entry_larger_than_max_bytes():
+  cache = TranscriptionCache(max_bytes=4)
+  cache.append(_audio_entry(b"123456"))
+
+  assert len(cache) == 1
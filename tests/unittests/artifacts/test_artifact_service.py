@@ -14,22 +14,33 @@
 
 """Tests for the artifact service."""
 
+import asyncio
 import enum
+import os
+import tempfile
+import threading
 from typing import Optional
 from typing import Union
 from unittest import mock
 
+from google.adk.artifacts import FileArtifactService
 from google.adk.artifacts import GcsArtifactService
+from google.adk.artifacts import in_memory_artifact_service
 from google.adk.artifacts import InMemoryArtifactService
+from google.api_core import exceptions
 from google.genai import types
 import pytest
 
 Enum = enum.Enum
 
+# Uploads run in worker threads, and GCS creates blobs atomically.
+_upload_lock = threading.Lock()
+
 
 class ArtifactServiceType(Enum):
   IN_MEMORY = "IN_MEMORY"
   GCS = "GCS"
+  FILE = "FILE"
 
 
 class MockBlob:
@@ -49,16 +60,34 @@ class MockBlob:
     self.name = name
     self.content: Optional[bytes] = None
     self.content_type: Optional[str] = None
+    self.generation: Optional[int] = None
+
+  @property
+  def size(self) -> Optional[int]:
+    return None if self.content is None else len(self.content)
 
   def upload_from_string(
-      self, data: Union[str, bytes], content_type: Optional[str] = None
+      self,
+      data: Union[str, bytes],
+      content_type: Optional[str] = None,
+      if_generation_match: Optional[int] = None,
   ) -> None:
     """Mocks uploading data to the blob (from a string or bytes).
 
     Args:
         data: The data to upload (string or bytes).
         content_type:  The content type of the data (optional).
+        if_generation_match: Only 0 is supported, which fails the upload if
+          the blob exists (optional).
     """
+    with _upload_lock:
+      if if_generation_match == 0 and self.content is not None:
+        raise exceptions.PreconditionFailed(f"{self.name} exists")
+      self._upload(data, content_type)
+
+  def _upload(
+      self, data: Union[str, bytes], content_type: Optional[str]
+  ) -> None:
     if isinstance(data, str):
       self.content = data.encode("utf-8")
     elif isinstance(data, bytes):
@@ -68,19 +97,48 @@ class MockBlob:
 
     if content_type:
       self.content_type = content_type
+    self.generation = (self.generation or 0) + 1
 
-  def download_as_bytes(self) -> bytes:
+  def reload(self) -> None:
+    """Mocks reloading the blob's metadata."""
+    if self.content is None:
+      raise exceptions.NotFound(self.name)
+
+  def download_as_bytes(
+      self,
+      start: Optional[int] = None,
+      end: Optional[int] = None,
+      if_generation_match: Optional[int] = None,
+  ) -> bytes:
     """Mocks downloading the blob's content as bytes.
 
+    Args:
+        start: The offset of the first byte to download (optional).
+        end: The offset of the last byte to download, inclusive (optional).
+        if_generation_match: Fails the download if the blob has another
+          generation (optional).
+
     Returns:
         bytes: The content of the blob as bytes.
-
-    Raises:
-        Exception: If the blob doesn't exist (hasn't been uploaded to).
     """
     if self.content is None:
       return b""
-    return self.content
+    if if_generation_match not in (None, self.generation):
+      raise exceptions.PreconditionFailed(f"{self.name} changed")
+    start = start or 0
+    end = len(self.content) - 1 if end is None else end
+    return self.content[start : end + 1]
+
+  def open(
+      self,
+      mode: str,
+      chunk_size: Optional[int] = None,
+      content_type: Optional[str] = None,
+  ) -> "MockBlobWriter":
+    """Mocks opening the blob for a resumable upload."""
+    assert mode == "wb"
+    del chunk_size
+    return MockBlobWriter(self, content_type)
 
   def delete(self) -> None:
     """Mocks deleting a blob."""
@@ -88,6 +146,22 @@ class MockBlob:
     self.content_type = None
 
 
+class MockBlobWriter:
+  """Mocks a writer of a resumable upload, which creates the blob on close."""
+
+  def __init__(self, blob: MockBlob, content_type: Optional[str]) -> None:
+    self._blob = blob
+    self._content_type = content_type
+    self._buffer = bytearray()
+
+  def write(self, data: bytes) -> int:
+    self._buffer += data
+    return len(data)
+
+  def close(self) -> None:
+    self._blob._upload(bytes(self._buffer), self._content_type)
+
+
 class MockBucket:
   """Mocks a GCS Bucket object."""
 
@@ -113,6 +187,22 @@ class MockBucket:
       self.blobs[blob_name] = MockBlob(blob_name)
     return self.blobs[blob_name]
 
+  def copy_blob(
+      self,
+      blob: MockBlob,
+      destination_bucket: "MockBucket",
+      new_name: str,
+      if_generation_match: Optional[int] = None,
+  ) -> MockBlob:
+    """Mocks copying a blob within the bucket."""
+    assert destination_bucket is self
+    destination = self.blob(new_name)
+    with _upload_lock:
+      if if_generation_match == 0 and destination.content is not None:
+        raise exceptions.PreconditionFailed(f"{new_name} exists")
+      destination._upload(blob.content, blob.content_type)
+    return destination
+
 
 class MockClient:
   """Mocks the GCS Client."""
@@ -129,11 +219,11 @@ class MockClient:
 
   def list_blobs(self, bucket: MockBucket, prefix: Optional[str] = None):
     """Mocks listing blobs in a bucket, optionally with a prefix."""
-    if prefix:
-      return [
-          blob for name, blob in bucket.blobs.items() if name.startswith(prefix)
-      ]
-    return list(bucket.blobs.values())
+    return [
+        blob
+        for name, blob in bucket.blobs.items()
+        if blob.content is not None and (not prefix or name.startswith(prefix))
+    ]
 
 
 def mock_gcs_artifact_service():
@@ -149,12 +239,19 @@ def get_artifact_service(
   """Creates an artifact service for testing."""
   if service_type == ArtifactServiceType.GCS:
     return mock_gcs_artifact_service()
+  if service_type == ArtifactServiceType.FILE:
+    return FileArtifactService(root_dir=tempfile.mkdtemp())
   return InMemoryArtifactService()
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_load_empty(service_type):
   """Tests loading an artifact when none exists."""
@@ -169,7 +266,12 @@ async def test_load_empty(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_save_load_delete(service_type):
   """Tests saving, loading, and deleting an artifact."""
@@ -213,7 +315,12 @@ async def test_save_load_delete(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_list_keys(service_type):
   """Tests listing keys in the artifact service."""
@@ -244,7 +351,12 @@ async def test_list_keys(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_list_versions(service_type):
   """Tests listing versions of an artifact."""
@@ -278,3 +390,433 @@ async def test_list_versions(service_type):
   )
 
   assert response_versions == list(range(3))
+
+
+@pytest.mark.asyncio
+async def test_gcs_concurrent_saves_get_distinct_versions():
+  """Tests that concurrent saves never overwrite each other's versions."""
+  artifact_service = mock_gcs_artifact_service()
+  other_service = mock_gcs_artifact_service()
+  other_service.bucket = artifact_service.bucket
+  other_service.storage_client = artifact_service.storage_client
+
+  async def save(service, data: bytes):
+    return await service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="file",
+        artifact=types.Part.from_bytes(data=data, mime_type="text/plain"),
+    )
+
+  versions = await asyncio.gather(
+      *(save(artifact_service, b"a%d" % i) for i in range(3)),
+      *(save(other_service, b"b%d" % i) for i in range(3)),
+  )
+
+  assert sorted(versions) == list(range(6))
+  contents = set()
+  for version in versions:
+    artifact = await artifact_service.load_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="file",
+        version=version,
+    )
+    contents.add(artifact.inline_data.data)
+  assert len(contents) == 6
+
+
+@pytest.mark.asyncio
+async def test_gcs_save_caches_latest_version():
+  """Tests that saves only list the versions of an artifact once."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+
+  with mock.patch.object(
+      artifact_service.storage_client,
+      "list_blobs",
+      wraps=artifact_service.storage_client.list_blobs,
+  ) as mock_list_blobs:
+    for _ in range(3):
+      await artifact_service.save_artifact(
+          app_name="app0",
+          user_id="user0",
+          session_id="123",
+          filename="file",
+          artifact=artifact,
+      )
+
+  assert mock_list_blobs.call_count == 1
+  assert await artifact_service.list_versions(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  ) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_gcs_failed_save_does_not_skip_version():
+  """Tests that a save failing for another reason releases its version."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+
+  async def save():
+    return await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="file",
+        artifact=artifact,
+    )
+
+  assert await save() == 0
+  with mock.patch.object(
+      MockBlob,
+      "upload_from_string",
+      side_effect=exceptions.ServiceUnavailable("unavailable"),
+  ):
+    with pytest.raises(exceptions.ServiceUnavailable):
+      await save()
+  assert await save() == 1
+  assert await artifact_service.list_versions(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  ) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_file_artifacts_are_deduplicated_and_persisted(tmp_path):
+  """Tests that identical contents are stored once, across restarts."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  for session_id in ("session1", "session2"):
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id=session_id,
+        filename="file",
+        artifact=artifact,
+    )
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="session1",
+      filename="user:profile",
+      artifact=types.Part.from_bytes(data=b"other", mime_type="text/plain"),
+  )
+
+  blobs = [
+      name for _, _, names in os.walk(tmp_path / "blobs") for name in names
+  ]
+  assert len(blobs) == 2
+
+  loaded_service = FileArtifactService(root_dir=str(tmp_path))
+  assert await loaded_service.list_artifact_keys(
+      app_name="app0", user_id="user0", session_id="session2"
+  ) == ["file", "user:profile"]
+  assert (
+      await loaded_service.load_artifact(
+          app_name="app0",
+          user_id="user0",
+          session_id="session2",
+          filename="file",
+      )
+      == artifact
+  )
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_contents_are_removed_when_unreferenced(tmp_path):
+  """Tests that contents are only removed with their last reference."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+  for session_id in ("session1", "session2"):
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id=session_id,
+        filename="file",
+        artifact=artifact,
+    )
+
+  await artifact_service.delete_artifact(
+      app_name="app0", user_id="user0", session_id="session1", filename="file"
+  )
+  assert await artifact_service.load_artifact(
+      app_name="app0", user_id="user0", session_id="session2", filename="file"
+  )
+
+  await artifact_service.delete_artifact(
+      app_name="app0", user_id="user0", session_id="session2", filename="file"
+  )
+  assert not [
+      name for _, _, names in os.walk(tmp_path / "blobs") for name in names
+  ]
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_map(tmp_path):
+  """Tests memory-mapping an artifact."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  for data in (b"first", b"second"):
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id="123",
+        filename="file",
+        artifact=types.Part.from_bytes(data=data, mime_type="text/plain"),
+    )
+
+  buffer, mime_type = artifact_service.map_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  )
+  assert bytes(buffer) == b"second"
+  assert mime_type == "text/plain"
+  buffer.release()
+  assert not artifact_service.map_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="missing"
+  )
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_index_ignores_interrupted_write(tmp_path):
+  """Tests that a partially written index record is ignored on load."""
+  artifact_service = FileArtifactService(root_dir=str(tmp_path))
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="file",
+      artifact=types.Part.from_bytes(data=b"data", mime_type="text/plain"),
+  )
+  with open(tmp_path / "index.jsonl", "a") as f:
+    f.write('{"op": "save", "sco')
+
+  loaded_service = FileArtifactService(root_dir=str(tmp_path))
+  await loaded_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="file",
+      artifact=types.Part.from_bytes(data=b"data2", mime_type="text/plain"),
+  )
+
+  reloaded_service = FileArtifactService(root_dir=str(tmp_path))
+  assert await reloaded_service.list_versions(
+      app_name="app0", user_id="user0", session_id="123", filename="file"
+  ) == [0, 1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
+)
+async def test_stream_artifact(service_type):
+  """Tests writing and reading an artifact in chunks."""
+  artifact_service = get_artifact_service(service_type)
+  key = dict(app_name="app0", user_id="user0", session_id="123")
+  assert not await artifact_service.open_artifact_reader(**key, filename="file")
+
+  await artifact_service.save_artifact(
+      **key,
+      filename="file",
+      artifact=types.Part.from_bytes(data=b"first", mime_type="text/plain"),
+  )
+  async with await artifact_service.open_artifact_writer(
+      **key, filename="file", mime_type="text/plain"
+  ) as writer:
+    for chunk in (b"0123", b"4567", b"89"):
+      await writer.write(chunk)
+  assert writer.version == 1
+
+  reader = await artifact_service.open_artifact_reader(**key, filename="file")
+  assert (reader.version, reader.mime_type, reader.size) == (
+      1,
+      "text/plain",
+      10,
+  )
+  assert b"".join([chunk async for chunk in reader]) == b"0123456789"
+  assert b"".join([c async for c in reader.iter_range(2, 6)]) == b"2345"
+  assert b"".join([c async for c in reader.iter_range(8, 20)]) == b"89"
+
+  reader = await artifact_service.open_artifact_reader(
+      **key, filename="file", version=0
+  )
+  assert b"".join([chunk async for chunk in reader]) == b"first"
+  assert not await artifact_service.open_artifact_reader(
+      **key, filename="file", version=2
+  )
+  artifact = await artifact_service.load_artifact(**key, filename="file")
+  assert artifact.inline_data.data == b"0123456789"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
+)
+async def test_aborted_artifact_writer_saves_nothing(service_type):
+  """Tests that an artifact writer saves nothing when an error is raised."""
+  artifact_service = get_artifact_service(service_type)
+  key = dict(app_name="app0", user_id="user0", session_id="123")
+
+  with pytest.raises(RuntimeError):
+    async with await artifact_service.open_artifact_writer(
+        **key, filename="file", mime_type="text/plain"
+    ) as writer:
+      await writer.write(b"partial")
+      raise RuntimeError("interrupted")
+
+  assert not await artifact_service.list_versions(**key, filename="file")
+
+
+def _bytes_artifact(data: bytes) -> types.Part:
+  return types.Part.from_bytes(data=data, mime_type="application/octet-stream")
+
+
+@pytest.mark.asyncio
+async def test_in_memory_max_versions_per_artifact():
+  """Tests that versions beyond the limit are discarded."""
+  artifact_service = InMemoryArtifactService(max_versions_per_artifact=2)
+  key = dict(app_name="app0", user_id="user0", session_id="123")
+  for data in (b"0", b"1", b"2"):
+    await artifact_service.save_artifact(
+        **key, filename="file", artifact=_bytes_artifact(data)
+    )
+
+  assert await artifact_service.list_versions(**key, filename="file") == [1, 2]
+  assert not await artifact_service.load_artifact(
+      **key, filename="file", version=0
+  )
+  loaded = await artifact_service.load_artifact(**key, filename="file")
+  assert loaded.inline_data.data == b"2"
+  stats = artifact_service.get_stats()
+  assert (stats.resident_versions, stats.resident_bytes) == (2, 2)
+  assert stats.dropped_versions == 1
+
+
+@pytest.mark.asyncio
+async def test_in_memory_evicts_least_recently_used_across_sessions():
+  """Tests that the least recently used versions are evicted first."""
+  artifact_service = InMemoryArtifactService(max_bytes=10)
+  for session_id in ("s1", "s2"):
+    await artifact_service.save_artifact(
+        app_name="app0",
+        user_id="user0",
+        session_id=session_id,
+        filename="file",
+        artifact=_bytes_artifact(b"x" * 4),
+    )
+  # Uses the first session's artifact, so the second one is evicted.
+  await artifact_service.load_artifact(
+      app_name="app0", user_id="user0", session_id="s1", filename="file"
+  )
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="s3",
+      filename="file",
+      artifact=_bytes_artifact(b"x" * 4),
+  )
+
+  for session_id, expected in (("s1", [0]), ("s2", []), ("s3", [0])):
+    assert (
+        await artifact_service.list_versions(
+            app_name="app0",
+            user_id="user0",
+            session_id=session_id,
+            filename="file",
+        )
+        == expected
+    )
+  assert not await artifact_service.list_artifact_keys(
+      app_name="app0", user_id="user0", session_id="s2"
+  )
+  stats = artifact_service.get_stats()
+  assert (stats.resident_bytes, stats.evicted_versions) == (8, 1)
+  assert (stats.evicted_bytes, stats.dropped_versions) == (4, 1)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_spills_evicted_versions_to_disk(tmp_path):
+  """Tests that evicted versions are loaded from the spill directory."""
+  artifact_service = InMemoryArtifactService(
+      max_bytes=6, spill_dir=str(tmp_path)
+  )
+  key = dict(app_name="app0", user_id="user0", session_id="123")
+  await artifact_service.save_artifact(
+      **key, filename="file", artifact=_bytes_artifact(b"first")
+  )
+  await artifact_service.save_artifact(
+      **key, filename="file", artifact=_bytes_artifact(b"second")
+  )
+  await artifact_service.save_artifact(
+      **key, filename="text", artifact=types.Part.from_text(text="hello")
+  )
+
+  assert artifact_service.artifacts["app0/user0/123/file"] == [None, None]
+  assert await artifact_service.list_versions(**key, filename="file") == [0, 1]
+  loaded = await artifact_service.load_artifact(
+      **key, filename="file", version=0
+  )
+  assert loaded.inline_data.data == b"first"
+  reader = await artifact_service.open_artifact_reader(**key, filename="file")
+  assert b"".join([c async for c in reader.iter_range(1, 4)]) == b"eco"
+  stats = artifact_service.get_stats()
+  assert (stats.spilled_versions, stats.spilled_bytes) == (2, 11)
+  assert (stats.resident_versions, stats.dropped_versions) == (1, 0)
+
+  await artifact_service.delete_artifact(**key, filename="file")
+  assert not os.listdir(tmp_path)
+  assert artifact_service.get_stats().spilled_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_in_memory_artifact_saved_again_while_spilling(tmp_path):
+  """Tests that versions replaced while they are spilled are discarded."""
+  artifact_service = InMemoryArtifactService(
+      max_bytes=5, spill_dir=str(tmp_path)
+  )
+  key = dict(app_name="app0", user_id="user0", session_id="123")
+  write_spill_file = in_memory_artifact_service._write_spill_file
+  can_write = threading.Event()
+
+  def blocked_write_spill_file(spill_dir, part):
+    can_write.wait()
+    return write_spill_file(spill_dir, part)
+
+  for data in (b"12", b"34"):
+    await artifact_service.save_artifact(
+        **key, filename="file", artifact=_bytes_artifact(data)
+    )
+  with mock.patch.object(
+      in_memory_artifact_service,
+      "_write_spill_file",
+      side_effect=blocked_write_spill_file,
+  ):
+    # Evicts the first two versions, which are spilled in a worker thread.
+    save = asyncio.create_task(
+        artifact_service.save_artifact(
+            **key, filename="file", artifact=_bytes_artifact(b"56789")
+        )
+    )
+    await asyncio.sleep(0.01)
+    await artifact_service.delete_artifact(**key, filename="file")
+    await artifact_service.save_artifact(
+        **key, filename="file", artifact=_bytes_artifact(b"x")
+    )
+    can_write.set()
+    assert await save == 2
+
+  assert await artifact_service.list_versions(**key, filename="file") == [0]
+  loaded = await artifact_service.load_artifact(**key, filename="file")
+  assert loaded.inline_data.data == b"x"
+  assert not os.listdir(tmp_path)
@@ -27,6 +27,9 @@ from unittest.mock import patch
 from fastapi.testclient import TestClient
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.run_config import RunConfig
+from google.adk.artifacts.base_artifact_service import ArtifactReader
+from google.adk.artifacts.base_artifact_service import read_bytes_range
+from google.adk.cli.fast_api import _encode_event
 from google.adk.cli.fast_api import get_fast_api_app
 from google.adk.evaluation.eval_case import EvalCase
 from google.adk.evaluation.eval_case import Invocation
@@ -318,6 +321,33 @@ def mock_artifact_service():
       if key in artifacts:
         del artifacts[key]
 
+    async def save_artifact(
+        self, app_name, user_id, session_id, filename, artifact
+    ):
+      """Save a new version of an artifact."""
+      key = f"{app_name}:{user_id}:{session_id}:{filename}"
+      versions = artifacts.setdefault(key, [])
+      versions.append({"version": len(versions), "artifact": artifact})
+      return len(versions) - 1
+
+    async def open_artifact_reader(
+        self, app_name, user_id, session_id, filename, version=None
+    ):
+      """Open an artifact for reading in chunks."""
+      artifact = await self.load_artifact(
+          app_name, user_id, session_id, filename, version
+      )
+      if artifact is None:
+        return None
+      data = artifact.inline_data.data
+      return ArtifactReader(
+          version=version or 0,
+          mime_type=artifact.inline_data.mime_type,
+          size=len(data),
+          read_range=read_bytes_range(data),
+          chunk_size=4,
+      )
+
   return MockArtifactService()
 
 
@@ -782,6 +812,96 @@ def test_agent_run(test_app, create_test_session):
   logger.info("Agent run test completed successfully")
 
 
+def test_preload_reports_readiness(tmp_path):
+  """Test that the preloaded apps are ready once the server has started."""
+  for app_name, agent_py in [
+      (
+          "preload_ok_agent",
+          (
+              "from google.adk.agents import Agent\n"
+              "root_agent = Agent(name='ok', model='gemini-2.0-flash')\n"
+          ),
+      ),
+      ("preload_broken_agent", "raise RuntimeError('boom')\n"),
+  ]:
+    (tmp_path / app_name).mkdir()
+    (tmp_path / app_name / "__init__.py").write_text("from . import agent\n")
+    (tmp_path / app_name / "agent.py").write_text(agent_py)
+
+  app = get_fast_api_app(agents_dir=str(tmp_path), web=False, preload=True)
+  client = TestClient(app)
+
+  response = client.get("/ready")
+  assert response.status_code == 503
+  assert response.json()["apps"]["preload_ok_agent"] == {"status": "loading"}
+
+  with client:
+    response = client.get("/ready")
+    ok_response = client.get("/ready", params={"app_name": "preload_ok_agent"})
+    broken_response = client.get(
+        "/ready", params={"app_name": "preload_broken_agent"}
+    )
+
+  # An app which failed to load does not keep the other apps from serving.
+  assert response.status_code == 200
+  apps = response.json()["apps"]
+  assert apps["preload_ok_agent"] == {"status": "ready"}
+  assert apps["preload_broken_agent"]["status"] == "failed"
+  assert "boom" in apps["preload_broken_agent"]["error"]
+  assert ok_response.status_code == 200
+  assert broken_response.status_code == 503
+  assert broken_response.json()["status"] == "not ready"
+
+
+def test_agent_run_ndjson(test_app, create_test_session):
+  """Test streaming the events of an agent run as newline delimited JSON."""
+  info = create_test_session
+  payload = {
+      "app_name": info["app_name"],
+      "user_id": info["user_id"],
+      "session_id": info["session_id"],
+      "new_message": {"role": "user", "parts": [{"text": "Hello agent"}]},
+  }
+
+  response = test_app.post(
+      "/run", json=payload, headers={"Accept": "application/x-ndjson"}
+  )
+
+  assert response.status_code == 200
+  assert response.headers["content-type"] == "application/x-ndjson"
+  lines = response.text.splitlines()
+  assert len(lines) == 3
+  events = [json.loads(line) for line in lines]
+  assert events[0]["content"]["parts"][0]["text"] == "LLM reply"
+  assert events[1]["content"]["parts"][0]["inlineData"]["data"]
+  assert events[2]["interrupted"] == True
+
+
+def test_encode_event_text_deltas():
+  """Test that only partial text events are encoded as text deltas."""
+  partial_event = Event(
+      author="dummy agent",
+      invocation_id="invocation_id",
+      partial=True,
+      content=types.Content(role="model", parts=[types.Part(text="Hel")]),
+  )
+
+  assert json.loads(_encode_event(partial_event, text_deltas=True)) == {
+      "id": partial_event.id,
+      "invocationId": "invocation_id",
+      "author": "dummy agent",
+      "partial": True,
+      "textDelta": "Hel",
+  }
+  assert json.loads(_encode_event(partial_event))["content"]["parts"] == [
+      {"text": "Hel"}
+  ]
+  final_event = _event_1()
+  assert json.loads(_encode_event(final_event, text_deltas=True)) == (
+      final_event.model_dump(mode="json", exclude_none=True, by_alias=True)
+  )
+
+
 def test_list_artifact_names(test_app, create_test_session):
   """Test listing artifact names for a session."""
   info = create_test_session
@@ -795,6 +915,131 @@ def test_list_artifact_names(test_app, create_test_session):
   logger.info(f"Listed {len(data)} artifacts")
 
 
+def test_load_artifact_range(
+    test_app, test_session_info, mock_artifact_service
+):
+  """Test loading byte ranges of an artifact."""
+  info = test_session_info
+  asyncio.run(
+      mock_artifact_service.save_artifact(
+          app_name=info["app_name"],
+          user_id=info["user_id"],
+          session_id=info["session_id"],
+          filename="data.bin",
+          artifact=types.Part.from_bytes(
+              data=b"0123456789", mime_type="application/octet-stream"
+          ),
+      )
+  )
+  url = f"/apps/{info['app_name']}/users/{info['user_id']}/sessions/{info['session_id']}/artifacts/data.bin"
+
+  response = test_app.get(url, headers={"Range": "bytes=2-6"})
+  assert response.status_code == 206
+  assert response.content == b"23456"
+  assert response.headers["content-range"] == "bytes 2-6/10"
+
+  response = test_app.get(url + "/versions/0", headers={"Range": "bytes=-3"})
+  assert response.status_code == 206
+  assert response.content == b"789"
+
+  response = test_app.get(url, headers={"Range": "bytes=10-"})
+  assert response.status_code == 416
+  assert response.headers["content-range"] == "bytes */10"
+
+  # Without a Range header the artifact is returned as JSON.
+  response = test_app.get(url)
+  assert response.status_code == 200
+  assert response.json()["inlineData"]["mimeType"] == "application/octet-stream"
+
+
+async def echo_run_live(self, session, live_request_queue):
+  request = await live_request_queue.get()
+  yield Event(
+      author="dummy agent",
+      invocation_id="invocation_id",
+      content=types.Content(
+          role="model",
+          parts=[types.Part(text="echo"), types.Part(inline_data=request.blob)],
+      ),
+  )
+
+
+def test_run_live_binary_frames(test_app, create_test_session, monkeypatch):
+  """Test exchanging inline data in binary WebSocket messages."""
+  monkeypatch.setattr(Runner, "run_live", echo_run_live)
+  info = create_test_session
+  url = (
+      f"/run_live?app_name={info['app_name']}&user_id={info['user_id']}"
+      f"&session_id={info['session_id']}&binary=true"
+      "&input_mime_type=audio/pcm"
+  )
+
+  with test_app.websocket_connect(url) as websocket:
+    websocket.send_bytes(b"\x00\x01\x02")
+    event = json.loads(websocket.receive_text())
+    header = json.loads(websocket.receive_text())
+    data = websocket.receive_bytes()
+
+  assert event["content"]["parts"] == [
+      {"text": "echo"},
+      {"inlineData": {"mimeType": "audio/pcm"}},
+  ]
+  assert header == {
+      "binaryHeader": {
+          "eventId": event["id"],
+          "invocationId": "invocation_id",
+          "author": "dummy agent",
+          "partIndex": 1,
+          "mimeType": "audio/pcm",
+      }
+  }
+  assert data == b"\x00\x01\x02"
+
+
+def test_run_live_binary_frames_for_audio_only_events(
+    test_app, create_test_session
+):
+  """Test that events only carrying audio are sent as binary messages."""
+  info = create_test_session
+  url = (
+      f"/run_live?app_name={info['app_name']}&user_id={info['user_id']}"
+      f"&session_id={info['session_id']}&binary=true"
+  )
+
+  with test_app.websocket_connect(url) as websocket:
+    first_event = json.loads(websocket.receive_text())
+    header = json.loads(websocket.receive_text())
+    audio = websocket.receive_bytes()
+    last_event = json.loads(websocket.receive_text())
+
+  assert first_event["content"]["parts"] == [{"text": "LLM reply"}]
+  assert header["binaryHeader"]["author"] == "dummy agent"
+  assert header["binaryHeader"]["partIndex"] == 0
+  assert header["binaryHeader"]["mimeType"] == "audio/pcm;rate=24000"
+  assert audio == b"\x00\xFF"
+  assert last_event["interrupted"] == True
+
+
+def test_run_live_json_frames(test_app, create_test_session, monkeypatch):
+  """Test exchanging inline data as base64 in JSON WebSocket messages."""
+  monkeypatch.setattr(Runner, "run_live", echo_run_live)
+  info = create_test_session
+  url = (
+      f"/run_live?app_name={info['app_name']}&user_id={info['user_id']}"
+      f"&session_id={info['session_id']}"
+  )
+
+  with test_app.websocket_connect(url) as websocket:
+    websocket.send_text(
+        json.dumps({"blob": {"mime_type": "audio/pcm", "data": "AAEC"}})
+    )
+    event = json.loads(websocket.receive_text())
+
+  assert event["content"]["parts"][1] == {
+      "inlineData": {"mimeType": "audio/pcm", "data": "AAEC"}
+  }
+
+
 def test_create_eval_set(test_app, test_session_info):
   """Test creating an eval set."""
   url = f"/apps/{test_session_info['app_name']}/eval_sets/test_eval_set_id"
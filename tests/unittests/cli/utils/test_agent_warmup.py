@@ -0,0 +1,70 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for warming up the agents of the api_server."""
+
+from typing import Optional
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.cli.utils.agent_warmup import AgentWarmupTiming
+from google.adk.cli.utils.agent_warmup import warm_up_agent
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
+import pytest
+
+from ... import testing_utils
+
+
+class _CountingToolset(BaseToolset):
+
+  def __init__(self, fail: bool = False):
+    super().__init__()
+    self.get_tools_calls = 0
+    self.fail = fail
+
+  async def get_tools(
+      self, readonly_context: Optional[ReadonlyContext] = None
+  ) -> list[BaseTool]:
+    self.get_tools_calls += 1
+    if self.fail:
+      raise ConnectionError("spec unavailable")
+    return []
+
+  async def close(self) -> None:
+    pass
+
+
+@pytest.mark.asyncio
+async def test_warm_up_agent_resolves_tools_of_all_llm_agents():
+  toolset = _CountingToolset()
+  failing_toolset = _CountingToolset(fail=True)
+  model = testing_utils.MockModel.create(responses=[])
+  root_agent = SequentialAgent(
+      name="root",
+      sub_agents=[
+          LlmAgent(name="first", model=model, tools=[toolset]),
+          LlmAgent(name="second", model=model, tools=[failing_toolset]),
+      ],
+  )
+  timing = AgentWarmupTiming(load_seconds=1.0)
+
+  await warm_up_agent(root_agent, timing)
+
+  assert toolset.get_tools_calls == 1
+  assert failing_toolset.get_tools_calls == 1
+  assert timing.tools_seconds > 0
+  assert timing.models_seconds > 0
+  assert timing.total_seconds > 1.0
@@ -14,7 +14,6 @@
 
 """Tests for utilities in cli_tool_click."""
 
-
 from __future__ import annotations
 
 import builtins
@@ -237,6 +236,54 @@ def test_cli_api_server_invokes_uvicorn(
   assert _patch_uvicorn.calls, "uvicorn.Server.run must be called"
 
 
+def test_cli_api_server_with_workers_runs_worker_pool(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    _patch_uvicorn: _Recorder,
+) -> None:
+  """`adk api_server --workers` should serve from a worker pool."""
+  rec = _Recorder()
+  monkeypatch.setattr(cli_tools_click.worker_pool, "run_worker_pool", rec)
+  agents_dir = tmp_path / "agents_api"
+  agents_dir.mkdir()
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main,
+      [
+          "api_server",
+          "--workers=4",
+          "--session_service_uri=sqlite:///sessions.db",
+          str(agents_dir),
+      ],
+  )
+  assert result.exit_code == 0
+  assert rec.calls[0][1]["workers"] == 4
+  assert not _patch_uvicorn.calls
+
+
+def test_cli_api_server_reports_invalid_worker_services(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    _patch_uvicorn: _Recorder,
+) -> None:
+  """Services the workers cannot share should fail as a usage error."""
+
+  def _get_fast_api_app(**_kwargs):
+    raise ValueError("Keep the session service shared")
+
+  monkeypatch.setattr(cli_tools_click, "get_fast_api_app", _get_fast_api_app)
+  agents_dir = tmp_path / "agents_api"
+  agents_dir.mkdir()
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main,
+      ["api_server", "--workers=4", str(agents_dir)],
+  )
+  assert result.exit_code == 1
+  assert "Error: Keep the session service shared" in result.output
+  assert not _patch_uvicorn.calls
+
+
 def test_cli_eval_success_path(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
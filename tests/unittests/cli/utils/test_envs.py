@@ -0,0 +1,56 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for loading the .env files of the agents."""
+
+import os
+
+from google.adk.cli.utils import envs
+
+
+def _write_dotenv(tmp_path, app_name, content):
+  (tmp_path / app_name).mkdir(exist_ok=True)
+  dotenv_file = tmp_path / app_name / ".env"
+  dotenv_file.write_text(content)
+  return dotenv_file
+
+
+def test_load_dotenv_for_agent_overrides_the_previous_app(
+    tmp_path, monkeypatch
+):
+  monkeypatch.delenv("ADK_TEST_ENV_VAR", raising=False)
+  _write_dotenv(tmp_path, "app_a", "ADK_TEST_ENV_VAR=a\n")
+  _write_dotenv(tmp_path, "app_b", "ADK_TEST_ENV_VAR=b\n")
+
+  envs.load_dotenv_for_agent("app_a", str(tmp_path))
+  assert os.environ["ADK_TEST_ENV_VAR"] == "a"
+  envs.load_dotenv_for_agent("app_b", str(tmp_path))
+  assert os.environ["ADK_TEST_ENV_VAR"] == "b"
+  envs.load_dotenv_for_agent("app_a", str(tmp_path))
+  assert os.environ["ADK_TEST_ENV_VAR"] == "a"
+
+
+def test_load_dotenv_for_agent_parses_a_changed_file_again(
+    tmp_path, monkeypatch
+):
+  monkeypatch.delenv("ADK_TEST_ENV_VAR", raising=False)
+  dotenv_file = _write_dotenv(tmp_path, "app", "ADK_TEST_ENV_VAR=old\n")
+  envs.load_dotenv_for_agent("app", str(tmp_path))
+  assert os.environ["ADK_TEST_ENV_VAR"] == "old"
+
+  dotenv_file.write_text("ADK_TEST_ENV_VAR=new\n")
+  mtime_ns = dotenv_file.stat().st_mtime_ns + 1_000_000_000
+  os.utime(dotenv_file, ns=(mtime_ns, mtime_ns))
+  envs.load_dotenv_for_agent("app", str(tmp_path))
+  assert os.environ["ADK_TEST_ENV_VAR"] == "new"
@@ -0,0 +1,150 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the SpanStore of the dev server trace exporters."""
+
+from unittest import mock
+
+from google.adk import telemetry
+from google.adk.cli.utils.span_store import SpanStore
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import SpanContext
+
+_span_ids = iter(range(1, 1000000))
+
+
+def _span(name, trace_id, session_id=None, event_id=None, text=""):
+  attributes = {"text": text}
+  if session_id:
+    attributes["gcp.vertex.agent.session_id"] = session_id
+  if event_id:
+    attributes["gcp.vertex.agent.event_id"] = event_id
+  return ReadableSpan(
+      name=name,
+      context=SpanContext(
+          trace_id=trace_id, span_id=next(_span_ids), is_remote=False
+      ),
+      attributes=attributes,
+  )
+
+
+class FakeClock:
+
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+
+def test_get_session_spans_returns_spans_of_session_traces():
+  store = SpanStore()
+  spans = [
+      _span("execute_tool", trace_id=1),
+      _span("call_llm", trace_id=1, session_id="s1"),
+      _span("call_llm", trace_id=2, session_id="s2"),
+      _span("invocation", trace_id=1),
+      _span("call_llm", trace_id=3, session_id="s1"),
+  ]
+  for span in spans:
+    store.add(span)
+
+  assert store.get_session_spans("s1") == [
+      spans[0],
+      spans[1],
+      spans[3],
+      spans[4],
+  ]
+  assert store.get_session_spans("s2") == [spans[2]]
+  assert store.get_session_spans("missing") == []
+
+
+def test_get_event_attributes_returns_latest_event_span():
+  store = SpanStore()
+  store.add(_span("call_llm", trace_id=1, event_id="e1", text="first"))
+  store.add(_span("invocation", trace_id=1, event_id="e1", text="ignored"))
+  last = _span("execute_tool get_weather", trace_id=1, event_id="e1", text="2")
+  store.add(last)
+
+  attributes = store.get_event_attributes("e1")
+
+  assert attributes["text"] == "2"
+  assert attributes["trace_id"] == 1
+  assert attributes["span_id"] == last.context.span_id
+  assert store.get_event_attributes("missing") is None
+
+
+def test_oldest_spans_are_evicted_beyond_max_spans():
+  store = SpanStore(max_spans=2)
+  store.add(_span("call_llm", trace_id=1, session_id="s1", event_id="e1"))
+  store.add(_span("call_llm", trace_id=2, session_id="s2", event_id="e2"))
+  store.add(_span("call_llm", trace_id=3, session_id="s2", event_id="e3"))
+
+  assert len(store) == 2
+  assert store.get_session_spans("s1") == []
+  assert len(store.get_session_spans("s2")) == 2
+  assert store.get_event_attributes("e1") is None
+  assert store._session_traces.keys() == {"s2"}
+
+
+def test_oldest_spans_are_evicted_beyond_max_bytes():
+  store = SpanStore(max_bytes=2000)
+  store.add(_span("call_llm", trace_id=1, session_id="s1", text="x" * 1000))
+  store.add(_span("call_llm", trace_id=2, session_id="s2", text="x" * 1000))
+
+  assert store.get_session_spans("s1") == []
+  assert len(store.get_session_spans("s2")) == 1
+
+
+def test_spans_expire_after_ttl():
+  clock = FakeClock()
+  store = SpanStore(ttl_seconds=10, clock=clock)
+  store.add(_span("call_llm", trace_id=1, session_id="s1"))
+  clock.now = 5
+  store.add(_span("call_llm", trace_id=2, session_id="s2"))
+
+  clock.now = 12
+  assert store.get_session_spans("s1") == []
+  assert len(store.get_session_spans("s2")) == 1
+  assert len(store) == 1
+
+
+def test_deferred_payloads_are_serialized_when_read():
+  store = SpanStore(max_bytes=2000)
+  payload = telemetry._Payload({"text": "x" * 1000}, max_length=None)
+  span = telemetry.DeferredPayloadSpan(
+      _span("call_llm", trace_id=1, session_id="s1", event_id="e1"),
+      {"gcp.vertex.agent.llm_request": payload},
+  )
+
+  with mock.patch.object(
+      telemetry._Payload,
+      "serialize",
+      autospec=True,
+      side_effect=telemetry._Payload.serialize,
+  ) as serialize:
+    store.add(span)
+    serialize.assert_not_called()
+    # The payload counts towards the size of the store.
+    store.add(_span("call_llm", trace_id=2, session_id="s2", text="x" * 1000))
+    assert store.get_session_spans("s1") == []
+
+    store = SpanStore()
+    store.add(span)
+    attributes = store.get_event_attributes("e1")
+
+  assert attributes["gcp.vertex.agent.llm_request"] == (
+      '{"text": "' + "x" * 1000 + '"}'
+  )
+  serialize.assert_called_once()
@@ -0,0 +1,100 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for serving the FastAPI app from a pool of workers."""
+
+import builtins
+import sys
+
+from fastapi import FastAPI
+from google.adk.cli.utils import worker_pool
+import pytest
+
+
+@pytest.mark.parametrize(
+    "session_service_uri",
+    [None, "sqlite://", "sqlite:///:memory:", "sqlite+aiosqlite://"],
+)
+def test_validate_shared_services_requires_shared_sessions(
+    session_service_uri,
+):
+  with pytest.raises(ValueError, match="session service shared"):
+    worker_pool.validate_shared_services(
+        workers=2,
+        session_service_uri=session_service_uri,
+        artifact_service_uri="gs://bucket",
+        memory_service_uri="rag://corpus",
+    )
+
+
+@pytest.mark.parametrize(
+    "session_service_uri",
+    [
+        "sqlite:///sessions.db",
+        "postgresql://user@localhost/sessions",
+        "agentengine://123",
+    ],
+)
+def test_validate_shared_services_accepts_shared_sessions(
+    session_service_uri,
+):
+  worker_pool.validate_shared_services(
+      workers=2,
+      session_service_uri=session_service_uri,
+      artifact_service_uri="gs://bucket",
+      memory_service_uri="rag://corpus",
+  )
+
+
+def test_validate_shared_services_allows_in_memory_services_in_one_worker():
+  worker_pool.validate_shared_services(
+      workers=1,
+      session_service_uri=None,
+      artifact_service_uri=None,
+      memory_service_uri=None,
+  )
+
+
+def test_run_worker_pool_requires_gunicorn(monkeypatch):
+  orig_import = builtins.__import__
+
+  def _fake_import(name, *args, **kwargs):
+    if name.startswith("gunicorn"):
+      raise ImportError(name)
+    return orig_import(name, *args, **kwargs)
+
+  monkeypatch.setattr(builtins, "__import__", _fake_import)
+
+  with pytest.raises(ImportError, match="requires gunicorn"):
+    worker_pool.run_worker_pool(FastAPI(), host="127.0.0.1", port=0, workers=2)
+
+
+def test_run_worker_pool_configures_gunicorn(monkeypatch):
+  base = pytest.importorskip("gunicorn.app.base")
+  configs = []
+
+  def _run(self):
+    configs.append(self.cfg)
+    assert self.load() is app
+
+  monkeypatch.setattr(base.BaseApplication, "run", _run)
+  monkeypatch.setattr(sys, "argv", ["adk"])
+  app = FastAPI()
+
+  worker_pool.run_worker_pool(app, host="0.0.0.0", port=8080, workers=3)
+
+  assert configs[0].bind == ["0.0.0.0:8080"]
+  assert configs[0].workers == 3
+  assert configs[0].preload_app
+  assert configs[0].worker_class_str == "uvicorn.workers.UvicornWorker"
@@ -0,0 +1,178 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.events import Event
+from google.adk.memory import _utils
+from google.adk.memory.in_memory_memory_service import _extract_words_lower
+from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+import pytest
+
+MOCK_APP_NAME = 'test-app'
+MOCK_USER_ID = 'test-user'
+
+
+def _event(event_id: str, text: str, timestamp: float = 1.0) -> Event:
+  return Event(
+      id=event_id,
+      invocation_id='inv',
+      author='user',
+      timestamp=timestamp,
+      content=types.Content(parts=[types.Part(text=text)]),
+  )
+
+
+def _session(events: list[Event], session_id: str = 'session') -> Session:
+  return Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id=session_id,
+      last_update_time=1,
+      events=events,
+  )
+
+
+def _texts(response) -> list[str]:
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+async def _search(service: InMemoryMemoryService, query: str):
+  return await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=query
+  )
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_matches_with_bm25():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(
+      _session([
+          _event('1', 'the weather is nice today'),
+          _event('2', 'paris weather: rain in paris, more rain in paris'),
+          _event('3', 'lunch was great'),
+          _event('4', 'paris in spring'),
+      ])
+  )
+
+  response = await _search(service, 'Paris weather')
+
+  assert _texts(response) == [
+      'paris weather: rain in paris, more rain in paris',
+      'paris in spring',
+      'the weather is nice today',
+  ]
+
+
+@pytest.mark.asyncio
+async def test_search_respects_top_k():
+  service = InMemoryMemoryService(top_k=1)
+  await service.add_session_to_memory(
+      _session([
+          _event('1', 'apple'),
+          _event('2', 'apple apple banana'),
+      ])
+  )
+
+  response = await _search(service, 'apple')
+
+  assert len(response.memories) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_is_scoped_to_user():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(_session([_event('1', 'secret')]))
+
+  response = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id='other-user', query='secret'
+  )
+
+  assert not response.memories
+
+
+@pytest.mark.asyncio
+async def test_search_without_matches_returns_nothing():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(_session([_event('1', 'hello world')]))
+
+  assert not (await _search(service, 'goodbye')).memories
+  assert not (await _search(service, '')).memories
+
+
+@pytest.mark.asyncio
+async def test_readding_session_indexes_only_new_events():
+  service = InMemoryMemoryService()
+  events = [_event('1', 'hello world')]
+  await service.add_session_to_memory(_session(events))
+
+  with mock.patch(
+      'google.adk.memory.in_memory_memory_service._extract_words_lower',
+      wraps=_extract_words_lower,
+  ) as mock_extract:
+    await service.add_session_to_memory(
+        _session(events + [_event('2', 'hello again')])
+    )
+
+  mock_extract.assert_called_once_with('hello again')
+  assert _texts(await _search(service, 'hello')) == [
+      'hello world',
+      'hello again',
+  ]
+
+
+@pytest.mark.asyncio
+async def test_readding_session_drops_removed_events():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(
+      _session([_event('1', 'hello world'), _event('2', 'hello again')])
+  )
+
+  await service.add_session_to_memory(_session([_event('2', 'hello again')]))
+
+  assert _texts(await _search(service, 'hello')) == ['hello again']
+  assert not (await _search(service, 'world')).memories
+
+
+@pytest.mark.asyncio
+async def test_memory_entry_fields():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(
+      _session([_event('1', 'hello', timestamp=0)])
+  )
+
+  memory = (await _search(service, 'hello')).memories[0]
+
+  assert memory.author == 'user'
+  assert memory.timestamp == _utils.format_timestamp(0)
+
+
+@pytest.mark.asyncio
+async def test_add_events_to_memory():
+  service = InMemoryMemoryService()
+  await service.add_session_to_memory(_session([_event('1', 'hello world')]))
+
+  await service.add_events_to_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      session_id='session',
+      events=[_event('1', 'hello world'), _event('2', 'hello again')],
+  )
+
+  assert _texts(await _search(service, 'hello')) == [
+      'hello world',
+      'hello again',
+  ]
@@ -0,0 +1,247 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+
+from google.adk.events import Event
+from google.adk.memory.local_vector_memory_service import LocalVectorMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+import pytest
+
+MOCK_APP_NAME = 'test-app'
+MOCK_USER_ID = 'test-user'
+
+VOCABULARY = ['cat', 'dog', 'weather', 'rain', 'paris', 'food']
+
+
+class FakeEmbedding:
+  """Embeds texts as bag-of-words vectors over a small vocabulary."""
+
+  def __init__(self):
+    self.calls: list[list[str]] = []
+
+  def __call__(self, texts: list[str]) -> list[list[float]]:
+    self.calls.append(texts)
+    return [
+        [float(text.lower().split().count(word)) for word in VOCABULARY]
+        for text in texts
+    ]
+
+
+def _event(event_id: str, text: str) -> Event:
+  return Event(
+      id=event_id,
+      invocation_id='inv',
+      author='user',
+      timestamp=1.0,
+      content=types.Content(parts=[types.Part(text=text)]),
+  )
+
+
+def _session(
+    events: list[Event], user_id: str = MOCK_USER_ID, session_id='session'
+) -> Session:
+  return Session(
+      app_name=MOCK_APP_NAME,
+      user_id=user_id,
+      id=session_id,
+      last_update_time=1,
+      events=events,
+  )
+
+
+async def _search(service: LocalVectorMemoryService, query: str):
+  response = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query=query
+  )
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+EVENTS = [
+    _event('1', 'cat cat dog'),
+    _event('2', 'weather rain rain'),
+    _event('3', 'paris weather'),
+    _event('4', 'food'),
+]
+
+
+@pytest.mark.parametrize('index_type', ['flat', 'hnsw'])
+@pytest.mark.asyncio
+async def test_search_returns_most_similar_events(index_type):
+  service = LocalVectorMemoryService(
+      FakeEmbedding(), top_k=2, index_type=index_type
+  )
+  await service.add_session_to_memory(_session(EVENTS))
+
+  assert await _search(service, 'weather') == [
+      'paris weather',
+      'weather rain rain',
+  ]
+  assert (await _search(service, 'cat'))[0] == 'cat cat dog'
+
+
+@pytest.mark.asyncio
+async def test_add_session_embeds_in_batches():
+  embedding = FakeEmbedding()
+  service = LocalVectorMemoryService(embedding, batch_size=3)
+
+  await service.add_session_to_memory(_session(EVENTS))
+
+  assert [len(batch) for batch in embedding.calls] == [3, 1]
+
+
+@pytest.mark.asyncio
+async def test_readding_session_embeds_only_new_events():
+  embedding = FakeEmbedding()
+  service = LocalVectorMemoryService(embedding)
+  await service.add_session_to_memory(_session(EVENTS[:2]))
+
+  await service.add_session_to_memory(_session(EVENTS))
+
+  assert embedding.calls[1] == ['paris weather', 'food']
+
+
+@pytest.mark.asyncio
+async def test_async_embedding_function():
+  embedding = FakeEmbedding()
+
+  async def embed(texts):
+    return embedding(texts)
+
+  service = LocalVectorMemoryService(embed, top_k=1)
+  await service.add_session_to_memory(_session(EVENTS))
+
+  assert await _search(service, 'food') == ['food']
+
+
+@pytest.mark.asyncio
+async def test_search_is_scoped_to_user():
+  service = LocalVectorMemoryService(FakeEmbedding())
+  await service.add_session_to_memory(
+      _session([_event('1', 'cat')], user_id='other-user')
+  )
+
+  assert not await _search(service, 'cat')
+
+
+@pytest.mark.parametrize('index_type', ['flat', 'hnsw'])
+@pytest.mark.asyncio
+async def test_persisted_memories_are_loaded(tmp_path, index_type):
+  service = LocalVectorMemoryService(
+      FakeEmbedding(),
+      top_k=1,
+      index_type=index_type,
+      persist_dir=str(tmp_path),
+  )
+  await service.add_session_to_memory(_session(EVENTS[:2]))
+  await service.add_session_to_memory(_session(EVENTS))
+
+  embedding = FakeEmbedding()
+  loaded = LocalVectorMemoryService(
+      embedding, top_k=1, index_type=index_type, persist_dir=str(tmp_path)
+  )
+  await loaded.add_session_to_memory(_session(EVENTS))
+
+  assert embedding.calls == []
+  assert await _search(loaded, 'paris') == ['paris weather']
+  assert await _search(loaded, 'food') == ['food']
+
+
+@pytest.mark.asyncio
+async def test_concurrent_adds_are_persisted(tmp_path):
+  service = LocalVectorMemoryService(
+      FakeEmbedding(), top_k=1, persist_dir=str(tmp_path)
+  )
+  await asyncio.gather(*(
+      service.add_events_to_memory(
+          app_name=MOCK_APP_NAME,
+          user_id=MOCK_USER_ID,
+          session_id=f'session-{i}',
+          events=[event],
+      )
+      for i, event in enumerate(EVENTS)
+  ))
+
+  loaded = LocalVectorMemoryService(
+      FakeEmbedding(), top_k=1, persist_dir=str(tmp_path)
+  )
+  assert await _search(loaded, 'paris') == ['paris weather']
+  assert await _search(loaded, 'food') == ['food']
+
+
+@pytest.mark.asyncio
+async def test_interrupted_write_is_dropped_on_load(tmp_path):
+  service = LocalVectorMemoryService(
+      FakeEmbedding(), top_k=1, persist_dir=str(tmp_path)
+  )
+  await service.add_session_to_memory(_session(EVENTS[:1]))
+  # Simulates a crash after the vectors were written but not the entries.
+  with open(os.path.join(tmp_path, 'vectors.f32'), 'ab') as f:
+    f.write(b'\0' * 4 * len(VOCABULARY))
+  with open(os.path.join(tmp_path, 'entries.jsonl'), 'a') as f:
+    f.write('{"app_name": ')
+
+  loaded = LocalVectorMemoryService(
+      FakeEmbedding(), top_k=1, persist_dir=str(tmp_path)
+  )
+  await loaded.add_session_to_memory(_session(EVENTS[3:]))
+
+  assert await _search(loaded, 'cat') == ['cat cat dog']
+  assert await _search(loaded, 'food') == ['food']
+
+
+@pytest.mark.asyncio
+async def test_mismatched_dimension_raises():
+  service = LocalVectorMemoryService(FakeEmbedding())
+  await service.add_session_to_memory(_session(EVENTS[:1]))
+  service._embedding_function = lambda texts: [[1.0]] * len(texts)
+
+  with pytest.raises(ValueError, match='dimension'):
+    await service.add_session_to_memory(_session(EVENTS))
+
+
+@pytest.mark.asyncio
+async def test_add_events_to_memory():
+  embedding = FakeEmbedding()
+  service = LocalVectorMemoryService(embedding, top_k=1)
+
+  await service.add_events_to_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      session_id='session',
+      events=EVENTS[:2],
+  )
+  await service.add_session_to_memory(_session(EVENTS))
+
+  assert embedding.calls == [
+      ['cat cat dog', 'weather rain rain'],
+      ['paris weather', 'food'],
+  ]
+  assert await _search(service, 'rain') == ['weather rain rain']
+
+
+@pytest.mark.asyncio
+async def test_search_after_many_adds():
+  service = LocalVectorMemoryService(FakeEmbedding(), top_k=1)
+  for i in range(40):
+    await service.add_events_to_memory(
+        app_name=MOCK_APP_NAME,
+        user_id=MOCK_USER_ID if i % 2 else 'other-user',
+        session_id='session',
+        events=[_event(str(i), 'food' if i == 33 else 'cat dog')],
+    )
+
+  assert await _search(service, 'food') == ['food']
@@ -172,3 +172,59 @@ async def test_search_memory(mock_get_api_client):
 
   assert len(result.memories) == 1
   assert result.memories[0].content.parts[0].text == 'test_content'
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('mock_get_api_client')
+async def test_readd_session_sends_only_new_events(mock_get_api_client):
+  memory_service = mock_vertex_ai_memory_bank_service()
+  await memory_service.add_session_to_memory(MOCK_SESSION)
+  new_event = Event(
+      id='666',
+      invocation_id='789',
+      author='user',
+      timestamp=12346,
+      content=types.Content(parts=[types.Part(text='new_content')]),
+  )
+
+  await memory_service.add_session_to_memory(
+      MOCK_SESSION.model_copy(
+          update={'events': MOCK_SESSION.events + [new_event]}
+      )
+  )
+  await memory_service.add_session_to_memory(
+      MOCK_SESSION.model_copy(
+          update={'events': MOCK_SESSION.events + [new_event]}
+      )
+  )
+
+  assert mock_get_api_client.async_request.await_count == 2
+  request_dict = mock_get_api_client.async_request.await_args.kwargs[
+      'request_dict'
+  ]
+  assert request_dict['direct_contents_source']['events'] == [
+      {'content': {'parts': [{'text': 'new_content'}]}}
+  ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('mock_get_api_client')
+async def test_add_events_to_memory(mock_get_api_client):
+  memory_service = mock_vertex_ai_memory_bank_service()
+
+  await memory_service.add_events_to_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      session_id=MOCK_SESSION.id,
+      events=MOCK_SESSION.events[:1],
+  )
+  await memory_service.add_session_to_memory(MOCK_SESSION)
+
+  mock_get_api_client.async_request.assert_awaited_once()
+  request_dict = mock_get_api_client.async_request.await_args.kwargs[
+      'request_dict'
+  ]
+  assert request_dict['scope'] == {
+      'app_name': MOCK_APP_NAME,
+      'user_id': MOCK_USER_ID,
+  }
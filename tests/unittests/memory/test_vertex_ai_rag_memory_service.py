@@ -0,0 +1,200 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+from unittest import mock
+
+from google.adk.events import Event
+from google.adk.memory.vertex_ai_rag_memory_service import _merge_event_lists
+from google.adk.memory.vertex_ai_rag_memory_service import VertexAiRagMemoryService
+from google.adk.sessions import Session
+from google.genai import types
+import pytest
+
+MOCK_APP_NAME = 'test-app'
+MOCK_USER_ID = 'test-user'
+
+
+def _event(event_id: str, text: str, timestamp: float) -> Event:
+  return Event(
+      id=event_id,
+      invocation_id='inv',
+      author='user',
+      timestamp=timestamp,
+      content=types.Content(parts=[types.Part(text=text)]),
+  )
+
+
+def _session(events: list[Event]) -> Session:
+  return Session(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      id='session',
+      last_update_time=1,
+      events=events,
+  )
+
+
+@pytest.fixture
+def mock_rag():
+  with mock.patch(
+      'google.adk.memory.vertex_ai_rag_memory_service.rag'
+  ) as mock_rag:
+    uploaded = []
+
+    def upload_file(corpus_name, path, display_name):
+      with open(path) as f:
+        uploaded.append((corpus_name, display_name, f.read().splitlines()))
+
+    mock_rag.upload_file.side_effect = upload_file
+    mock_rag.uploaded = uploaded
+    yield mock_rag
+
+
+def _service(*corpora: str) -> VertexAiRagMemoryService:
+  service = VertexAiRagMemoryService(rag_corpus=corpora[0])
+  service._vertex_rag_store.rag_resources = [
+      types.VertexRagStoreRagResource(rag_corpus=corpus) for corpus in corpora
+  ]
+  return service
+
+
+@pytest.mark.asyncio
+async def test_add_session_uploads_to_all_corpora_off_loop(mock_rag):
+  main_thread = threading.get_ident()
+  upload_threads = []
+  upload_file = mock_rag.upload_file.side_effect
+
+  def record_thread(**kwargs):
+    upload_threads.append(threading.get_ident())
+    upload_file(**kwargs)
+
+  mock_rag.upload_file.side_effect = record_thread
+  service = _service('corpus-1', 'corpus-2')
+
+  await service.add_session_to_memory(_session([_event('1', 'hello', 1)]))
+
+  assert sorted(corpus for corpus, _, _ in mock_rag.uploaded) == [
+      'corpus-1',
+      'corpus-2',
+  ]
+  assert all(thread != main_thread for thread in upload_threads)
+  assert mock_rag.uploaded[0][1] == 'test-app.test-user.session'
+
+
+@pytest.mark.asyncio
+async def test_add_session_uploads_only_new_events(mock_rag):
+  service = _service('corpus')
+  events = [_event('1', 'hello', 1), _event('2', 'world', 2)]
+  await service.add_session_to_memory(_session(events))
+
+  await service.add_session_to_memory(
+      _session(events + [_event('3', 'again', 3)])
+  )
+  await service.add_session_to_memory(
+      _session(events + [_event('3', 'again', 3)])
+  )
+
+  assert len(mock_rag.uploaded) == 2
+  assert [json.loads(line)['text'] for line in mock_rag.uploaded[1][2]] == [
+      'again'
+  ]
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_is_retried(mock_rag):
+  service = _service('corpus')
+  mock_rag.upload_file.side_effect = [RuntimeError('boom'), None]
+  session = _session([_event('1', 'hello', 1)])
+
+  with pytest.raises(RuntimeError):
+    await service.add_session_to_memory(session)
+  await service.add_session_to_memory(session)
+
+  assert mock_rag.upload_file.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_add_session_without_rag_resources_raises(mock_rag):
+  service = _service('corpus')
+  service._vertex_rag_store.rag_resources = []
+
+  with pytest.raises(ValueError):
+    await service.add_session_to_memory(_session([_event('1', 'hello', 1)]))
+
+
+@pytest.mark.asyncio
+async def test_search_merges_overlapping_contexts(mock_rag):
+  def context(user_id: str, *timestamps: float):
+    return mock.Mock(
+        source_display_name=f'test-app.{user_id}.session',
+        text='\n'.join(
+            json.dumps({'author': 'user', 'timestamp': t, 'text': f'text {t}'})
+            for t in timestamps
+        ),
+    )
+
+  mock_rag.retrieval_query.return_value.contexts.contexts = [
+      context(MOCK_USER_ID, 1, 2),
+      context(MOCK_USER_ID, 2, 3),
+      context('other-user', 9),
+      context(MOCK_USER_ID, 7),
+  ]
+  service = _service('corpus')
+
+  response = await service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='text'
+  )
+
+  assert [memory.content.parts[0].text for memory in response.memories] == [
+      'text 1',
+      'text 2',
+      'text 3',
+      'text 7',
+  ]
+
+
+def test_merge_event_lists_merges_transitive_overlaps():
+  def events(*timestamps):
+    return [_event(str(t), str(t), t) for t in timestamps]
+
+  merged = _merge_event_lists(
+      [events(1, 2), events(5, 6), events(3, 4), events(2, 3), events(6)]
+  )
+
+  assert [sorted(e.timestamp for e in group) for group in merged] == [
+      [1, 2, 3, 4],
+      [5, 6],
+  ]
+
+
+@pytest.mark.asyncio
+async def test_add_events_to_memory(mock_rag):
+  service = _service('corpus')
+  events = [_event('1', 'hello', 1), _event('2', 'world', 2)]
+
+  await service.add_events_to_memory(
+      app_name=MOCK_APP_NAME,
+      user_id=MOCK_USER_ID,
+      session_id='session',
+      events=events[:1],
+  )
+  await service.add_session_to_memory(_session(events))
+
+  assert [
+      [json.loads(line)['text'] for line in lines]
+      for _, _, lines in mock_rag.uploaded
+  ] == [['hello'], ['world']]
+  assert mock_rag.uploaded[0][1] == 'test-app.test-user.session'
@@ -15,6 +15,7 @@
 from datetime import datetime
 from datetime import timezone
 import enum
+import os
 
 from google.adk.events import Event
 from google.adk.events import EventActions
@@ -398,3 +399,24 @@ async def test_get_session_with_config(service_type):
   )
   events = session.events
   assert len(events) == num_test_events - after_timestamp + 1
+
+
+@pytest.mark.skipif(
+    not hasattr(os, 'fork'), reason='Requires forking the process.'
+)
+def test_database_session_service_drops_connections_after_fork(tmp_path):
+  session_service = DatabaseSessionService(
+      f'sqlite:///{tmp_path / "sessions.db"}'
+  )
+  pool = session_service.db_engine.pool
+  assert pool.checkedin() > 0
+
+  pid = os.fork()
+  if pid == 0:
+    # The child must not reuse the connections of its parent.
+    os._exit(0 if session_service.db_engine.pool.checkedin() == 0 else 1)
+  _, status = os.waitpid(pid, 0)
+
+  assert os.waitstatus_to_exitcode(status) == 0
+  assert session_service.db_engine.pool is pool
+  assert pool.checkedin() > 0
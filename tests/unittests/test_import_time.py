@@ -0,0 +1,83 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests that importing the ADK stays fast."""
+
+import subprocess
+import sys
+
+import pytest
+
+# The time budget of `from google.adk import Agent`, which is generous to
+# leave room for slow machines. It took over 6 seconds when the heavy
+# libraries were imported eagerly, and takes under 2 seconds on the same
+# machine since.
+_IMPORT_TIME_BUDGET_SECONDS = 4.0
+
+# Libraries which are only needed by some tools and services.
+_HEAVY_MODULES = [
+    'docker',
+    'google.cloud.aiplatform',
+    'google.cloud.storage',
+    'googleapiclient',
+    'sqlalchemy',
+    'vertexai',
+]
+
+
+def _import_times(statement: str) -> dict[str, tuple[int, int]]:
+  """Returns the self and cumulative import time of each top-level module."""
+  result = subprocess.run(
+      [sys.executable, '-X', 'importtime', '-c', statement],
+      capture_output=True,
+      text=True,
+      check=True,
+  )
+  times = {}
+  for line in result.stderr.splitlines():
+    if not line.startswith('import time:') or 'self [us]' in line:
+      continue
+    self_us, cumulative_us, name = line[len('import time:') :].split('|')
+    times[name.rstrip()] = (int(self_us), int(cumulative_us))
+  return times
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        'from google.adk import Agent',
+        'from google.adk.agents import LlmAgent',
+        'from google.adk.tools import FunctionTool',
+        'from google.adk.runners import InMemoryRunner',
+    ],
+)
+def test_import_does_not_load_heavy_modules(statement):
+  times = _import_times(statement)
+
+  imported_modules = {name.strip() for name in times}
+  for module in _HEAVY_MODULES:
+    assert module not in imported_modules
+
+
+def test_import_agent_within_budget():
+  times = _import_times('from google.adk import Agent')
+
+  # The cumulative times of the modules imported at the top level add up to
+  # the total import time.
+  total_us = sum(
+      cumulative_us
+      for name, (_, cumulative_us) in times.items()
+      if not name.startswith(' ')
+  )
+  assert total_us / 1e6 < _IMPORT_TIME_BUDGET_SECONDS
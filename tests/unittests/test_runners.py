@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from typing import Optional
 
 from google.adk.agents.base_agent import BaseAgent
@@ -21,7 +22,9 @@ from google.adk.events.event import Event
 from google.adk.runners import Runner
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.sessions.session import Session
+from google.adk.tools.base_toolset import BaseToolset
 from google.genai import types
+import pytest
 
 
 class MockAgent(BaseAgent):
@@ -290,6 +293,108 @@ class TestRunnerFindAgentToRun:
     result = self.runner._find_agent_to_run(session, self.root_agent)
     assert result == self.sub_agent2
 
+  def test_find_agent_to_run_only_looks_at_new_events(self):
+    """Test that the events looked at by an earlier call are not looked at."""
+    root_event = Event(
+        invocation_id="inv1",
+        author="root_agent",
+        content=types.Content(
+            role="model", parts=[types.Part(text="Root response")]
+        ),
+    )
+    user_event = Event(
+        invocation_id="inv2",
+        author="user",
+        content=types.Content(role="user", parts=[types.Part(text="Hello")]),
+    )
+    session = Session(
+        id="test_session",
+        user_id="test_user",
+        app_name="test_app",
+        events=[root_event, user_event],
+    )
+    assert self.runner._find_agent_to_run(session, self.root_agent) == (
+        self.root_agent
+    )
+
+    # Had the first event been looked at again, sub_agent1 would be found.
+    root_event.author = "sub_agent1"
+    session.events.append(
+        Event(
+            invocation_id="inv2",
+            author="non_transferable",
+            content=types.Content(
+                role="model", parts=[types.Part(text="Response")]
+            ),
+        )
+    )
+    assert self.runner._find_agent_to_run(session, self.root_agent) == (
+        self.root_agent
+    )
+
+    session.events.append(
+        Event(
+            invocation_id="inv3",
+            author="sub_agent2",
+            content=types.Content(
+                role="model", parts=[types.Part(text="Response")]
+            ),
+        )
+    )
+    assert self.runner._find_agent_to_run(session, self.root_agent) == (
+        self.sub_agent2
+    )
+
+  def test_find_agent_to_run_forgets_agent_removed_from_tree(self):
+    """Test that an agent removed from the tree is not resumed."""
+    session = Session(
+        id="test_session",
+        user_id="test_user",
+        app_name="test_app",
+        events=[
+            Event(
+                invocation_id="inv1",
+                author="sub_agent1",
+                content=types.Content(
+                    role="model", parts=[types.Part(text="Response")]
+                ),
+            )
+        ],
+    )
+    assert self.runner._find_agent_to_run(session, self.root_agent) == (
+        self.sub_agent1
+    )
+
+    self.root_agent.sub_agents = [self.sub_agent2]
+    assert self.runner._find_agent_to_run(session, self.root_agent) == (
+        self.root_agent
+    )
+
+  def test_find_agent_finds_agents_added_to_tree(self):
+    """Test that the agent index follows the changes of the agent tree."""
+    assert self.runner._find_agent(self.root_agent, "sub_agent1") == (
+        self.sub_agent1
+    )
+    assert self.runner._find_agent(self.root_agent, "new_agent") is None
+
+    new_agent = MockLlmAgent("new_agent", parent_agent=self.sub_agent1)
+    self.sub_agent1.sub_agents = [new_agent]
+    assert self.runner._find_agent(self.root_agent, "new_agent") == new_agent
+    assert self.runner._find_agent(self.sub_agent1, "new_agent") == new_agent
+    assert self.runner._find_agent(self.sub_agent1, "sub_agent2") is None
+
+  def test_find_agent_ignores_agents_outside_tree(self):
+    """Test that an agent whose parent does not list it is not found."""
+    detached_agent = MockLlmAgent("detached", parent_agent=self.root_agent)
+    assert self.runner._find_agent(self.root_agent, "detached") is None
+
+    self.root_agent.sub_agents.append(detached_agent)
+    assert self.runner._find_agent(self.root_agent, "detached") == (
+        detached_agent
+    )
+    self.root_agent.sub_agents.remove(detached_agent)
+    assert self.runner._find_agent(self.root_agent, "detached") is None
+
   def test_is_transferable_across_agent_tree_with_llm_agent(self):
     """Test _is_transferable_across_agent_tree with LLM agent."""
     result = self.runner._is_transferable_across_agent_tree(self.sub_agent1)
@@ -308,3 +413,94 @@ class TestRunnerFindAgentToRun:
     # MockAgent inherits from BaseAgent, not LlmAgent, so it should return False
     result = self.runner._is_transferable_across_agent_tree(non_llm_agent)
     assert result is False
+
+
+class LoopRecordingAgent(BaseAgent):
+  """Agent which records the event loop of each run, and may fail."""
+
+  loops: list = []
+  error: Optional[str] = None
+
+  async def _run_async_impl(self, invocation_context):
+    self.loops.append(asyncio.get_running_loop())
+    yield Event(
+        invocation_id=invocation_context.invocation_id,
+        author=self.name,
+        content=types.Content(role="model", parts=[types.Part(text="first")]),
+    )
+    if self.error:
+      raise ValueError(self.error)
+    yield Event(
+        invocation_id=invocation_context.invocation_id,
+        author=self.name,
+        content=types.Content(role="model", parts=[types.Part(text="second")]),
+    )
+
+
+class ClosingToolset(BaseToolset):
+
+  def __init__(self):
+    super().__init__()
+    self.closed_on_loop = None
+
+  async def get_tools(self, readonly_context=None):
+    return []
+
+  async def close(self):
+    self.closed_on_loop = asyncio.get_running_loop()
+
+
+class TestRunnerSyncRun:
+  """Tests for the background event loop of Runner.run."""
+
+  def setup_method(self):
+    self.session_service = InMemorySessionService()
+    self.agent = LoopRecordingAgent(name="agent")
+    self.runner = Runner(
+        app_name="test_app",
+        agent=self.agent,
+        session_service=self.session_service,
+    )
+    self.session = asyncio.run(
+        self.session_service.create_session(app_name="test_app", user_id="user")
+    )
+
+  def _run(self):
+    return self.runner.run(
+        user_id="user",
+        session_id=self.session.id,
+        new_message=types.Content(role="user", parts=[types.Part(text="Hi")]),
+    )
+
+  def test_run_reuses_event_loop(self):
+    assert len(list(self._run())) == 2
+    assert len(list(self._run())) == 2
+
+    assert self.agent.loops[0] is self.agent.loops[1]
+    asyncio.run(self.runner.close())
+
+  def test_run_raises_agent_error(self):
+    self.agent.error = "boom"
+    events = []
+
+    with pytest.raises(ValueError, match="boom"):
+      for event in self._run():
+        events.append(event)
+
+    assert len(events) == 1
+    asyncio.run(self.runner.close())
+
+  def test_close_stops_event_loop_after_closing_toolsets(self):
+    toolset = ClosingToolset()
+    self.agent.sub_agents = [
+        LlmAgent(name="llm_agent", model="gemini-2.0-flash", tools=[toolset])
+    ]
+    list(self._run())
+    thread = self.runner._background_thread
+    loop = self.agent.loops[0]
+
+    asyncio.run(self.runner.close())
+
+    assert toolset.closed_on_loop is loop
+    assert not thread.is_alive()
+    assert loop.is_closed()
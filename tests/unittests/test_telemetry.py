@@ -12,22 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
 import json
 from typing import Any
 from typing import Dict
 from typing import Optional
 from unittest import mock
 
+from google.adk import telemetry
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.adk.sessions import InMemorySessionService
+from google.adk.telemetry import DeferredPayloadSpanProcessor
+from google.adk.telemetry import PayloadCaptureConfig
+from google.adk.telemetry import PayloadCaptureMode
+from google.adk.telemetry import set_payload_capture_config
 from google.adk.telemetry import trace_call_llm
 from google.adk.telemetry import trace_merged_tool_calls
 from google.adk.telemetry import trace_tool_call
 from google.adk.tools.base_tool import BaseTool
 from google.genai import types
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 import pytest
 
 
@@ -324,3 +334,248 @@ def test_trace_merged_tool_calls_sets_correct_attributes(
       expected_calls, any_order=True
   )
   mock_event_fixture.model_dumps_json.assert_called_once_with(exclude_none=True)
+
+
+@pytest.fixture
+def payload_capture_config():
+  """Restores the payload capture config after the test."""
+  config = telemetry.get_payload_capture_config()
+  yield
+  set_payload_capture_config(config)
+
+
+def _attributes(mock_span):
+  return {
+      call_obj.args[0]: call_obj.args[1]
+      for call_obj in mock_span.set_attribute.call_args_list
+  }
+
+
+def _trace_tool_call_with_args(tool, event, args):
+  event.id = 'event_id'
+  event.content = types.Content(
+      role='user',
+      parts=[
+          types.Part(
+              function_response=types.FunctionResponse(
+                  id='tool_call_id', name='tool', response={'result': 'ok'}
+              )
+          )
+      ],
+  )
+  trace_tool_call(tool=tool, args=args, function_response_event=event)
+
+
+def test_trace_tool_call_truncates_payloads(
+    monkeypatch,
+    mock_span_fixture,
+    mock_tool_fixture,
+    mock_event_fixture,
+    payload_capture_config,
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  set_payload_capture_config(
+      PayloadCaptureConfig(mode=PayloadCaptureMode.TRUNCATED, max_length=20)
+  )
+
+  _trace_tool_call_with_args(
+      mock_tool_fixture, mock_event_fixture, {'query': 'x' * 100}
+  )
+
+  attributes = _attributes(mock_span_fixture)
+  assert attributes['gcp.vertex.agent.tool_call_args'] == (
+      '{"query": "xxxxxxxxx...<truncated>'
+  )
+  assert attributes['gcp.vertex.agent.tool_response'] == '{"result": "ok"}'
+
+
+@pytest.mark.parametrize(
+    'config, expected_args',
+    [
+        (PayloadCaptureConfig(mode=PayloadCaptureMode.OFF), '{}'),
+        (
+            PayloadCaptureConfig(
+                mode=PayloadCaptureMode.SAMPLED, sample_rate=0.0
+            ),
+            '{}',
+        ),
+        (
+            PayloadCaptureConfig(
+                mode=PayloadCaptureMode.SAMPLED, sample_rate=1.0
+            ),
+            '{"query": "weather"}',
+        ),
+    ],
+)
+def test_trace_tool_call_skips_uncaptured_payloads(
+    monkeypatch,
+    mock_span_fixture,
+    mock_tool_fixture,
+    mock_event_fixture,
+    payload_capture_config,
+    config,
+    expected_args,
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  mock_span_fixture.get_span_context.return_value.trace_id = 12345
+  set_payload_capture_config(config)
+
+  _trace_tool_call_with_args(
+      mock_tool_fixture, mock_event_fixture, {'query': 'weather'}
+  )
+
+  attributes = _attributes(mock_span_fixture)
+  assert attributes['gcp.vertex.agent.tool_call_args'] == expected_args
+  assert attributes['gen_ai.tool.call.id'] == 'tool_call_id'
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_replaces_inline_data_with_size(
+    monkeypatch, mock_span_fixture
+):
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  image = types.Part.from_bytes(data=b'x' * 1000, mime_type='image/png')
+  llm_request = LlmRequest(
+      contents=[types.Content(role='user', parts=[image])],
+      config=types.GenerateContentConfig(),
+  )
+  llm_response = LlmResponse(
+      content=types.Content(
+          role='model', parts=[image, types.Part.from_text(text='done')]
+      )
+  )
+
+  trace_call_llm(invocation_context, 'event_id', llm_request, llm_response)
+
+  attributes = _attributes(mock_span_fixture)
+  placeholder = {'inline_data': {'mime_type': 'image/png', 'size': 1000}}
+  llm_request_dict = json.loads(attributes['gcp.vertex.agent.llm_request'])
+  assert llm_request_dict['contents'] == [
+      {'role': 'user', 'parts': [placeholder]}
+  ]
+  llm_response_dict = json.loads(attributes['gcp.vertex.agent.llm_response'])
+  assert llm_response_dict['content'] == {
+      'role': 'model',
+      'parts': [placeholder, {'text': 'done'}],
+  }
+
+
+def _create_deferred_tracer(exporter):
+  provider = TracerProvider()
+  provider.add_span_processor(
+      DeferredPayloadSpanProcessor(SimpleSpanProcessor(exporter))
+  )
+  return provider.get_tracer('test')
+
+
+def test_deferred_payload_span_processor_serializes_on_export(
+    mock_tool_fixture, mock_event_fixture
+):
+  exporter = InMemorySpanExporter()
+  tracer = _create_deferred_tracer(exporter)
+  with mock.patch.object(
+      telemetry._Payload,
+      'serialize',
+      autospec=True,
+      side_effect=telemetry._Payload.serialize,
+  ) as serialize:
+    with tracer.start_as_current_span('execute_tool sample_tool') as span:
+      _trace_tool_call_with_args(
+          mock_tool_fixture, mock_event_fixture, {'query': 'weather'}
+      )
+      assert 'gcp.vertex.agent.tool_call_args' not in span.attributes
+      assert 'gen_ai.tool.name' in span.attributes
+    serialize.assert_not_called()
+
+    (exported,) = exporter.get_finished_spans()
+    assert exported.attributes['gcp.vertex.agent.tool_call_args'] == (
+        '{"query": "weather"}'
+    )
+    assert exported.attributes['gcp.vertex.agent.tool_response'] == (
+        '{"result": "ok"}'
+    )
+    assert serialize.call_count == 2
+    assert exported.attributes['gen_ai.tool.name'] == 'sample_tool'
+  assert not telemetry._deferred_payloads
+
+
+def test_deferred_payloads_are_snapshots(mock_tool_fixture, mock_event_fixture):
+  exporter = InMemorySpanExporter()
+  tracer = _create_deferred_tracer(exporter)
+  args = {'query': 'weather', 'places': ['Paris']}
+
+  with tracer.start_as_current_span('execute_tool sample_tool'):
+    _trace_tool_call_with_args(mock_tool_fixture, mock_event_fixture, args)
+  args['query'] = 'changed'
+  args['places'].append('Rome')
+
+  (exported,) = exporter.get_finished_spans()
+  assert json.loads(exported.attributes['gcp.vertex.agent.tool_call_args']) == {
+      'query': 'weather',
+      'places': ['Paris'],
+  }
+
+
+def test_deferred_payloads_of_dropped_spans_are_removed(
+    mock_tool_fixture, mock_event_fixture
+):
+  tracer = _create_deferred_tracer(InMemorySpanExporter())
+
+  span = tracer.start_span('execute_tool sample_tool')
+  with trace.use_span(span, end_on_exit=False):
+    _trace_tool_call_with_args(
+        mock_tool_fixture, mock_event_fixture, {'query': 'weather'}
+    )
+  assert telemetry._deferred_payloads
+  del span
+  gc.collect()
+
+  assert not telemetry._deferred_payloads
+
+
+@pytest.mark.asyncio
+async def test_truncated_deferred_payloads_are_serialized_partially(
+    payload_capture_config,
+):
+  exporter = InMemorySpanExporter()
+  tracer = _create_deferred_tracer(exporter)
+  set_payload_capture_config(
+      PayloadCaptureConfig(mode=PayloadCaptureMode.TRUNCATED, max_length=100)
+  )
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  llm_request = LlmRequest(
+      contents=[
+          types.Content(role='user', parts=[types.Part(text=f'Turn {i}')])
+          for i in range(100)
+      ],
+      config=types.GenerateContentConfig(),
+  )
+  llm_response = LlmResponse(
+      content=types.Content(role='model', parts=[types.Part(text='done')])
+  )
+  with tracer.start_as_current_span('call_llm'):
+    trace_call_llm(invocation_context, 'event_id', llm_request, llm_response)
+  with mock.patch.object(
+      telemetry._ContentSnapshot,
+      'build',
+      autospec=True,
+      side_effect=telemetry._ContentSnapshot.build,
+  ) as build:
+    (exported,) = exporter.get_finished_spans()
+    llm_request_json = exported.attributes['gcp.vertex.agent.llm_request']
+
+  assert llm_request_json.startswith('{"model": null, "config": {')
+  assert llm_request_json.endswith('...<truncated>')
+  assert len(llm_request_json) == 100 + len('...<truncated>')
+  assert build.call_count < 10
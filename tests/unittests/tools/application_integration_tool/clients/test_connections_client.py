@@ -78,11 +78,11 @@ class TestConnectionsClient:
         mock.patch.object(
             client, "_get_access_token", return_value=mock_credentials.token
         ),
-        mock.patch("requests.get", return_value=mock_response),
+        mock.patch("requests.Session.get", return_value=mock_response),
     ):
       response = client._execute_api_call("https://test.url")
       assert response.json() == {"data": "test"}
-      requests.get.assert_called_once_with(
+      requests.Session.get.assert_called_once_with(
           "https://test.url",
           headers={
               "Content-Type": "application/json",
@@ -128,7 +128,7 @@ class TestConnectionsClient:
         mock.patch.object(
             client, "_get_access_token", return_value=mock_credentials.token
         ),
-        mock.patch("requests.get", return_value=mock_response),
+        mock.patch("requests.Session.get", return_value=mock_response),
     ):
       with pytest.raises(
           ValueError, match="Invalid request. Please check the provided"
@@ -150,7 +150,7 @@ class TestConnectionsClient:
         mock.patch.object(
             client, "_get_access_token", return_value=mock_credentials.token
         ),
-        mock.patch("requests.get", return_value=mock_response),
+        mock.patch("requests.Session.get", return_value=mock_response),
     ):
       with pytest.raises(ValueError, match="Request error: "):
         client._execute_api_call("https://test.url")
@@ -165,7 +165,8 @@ class TestConnectionsClient:
             client, "_get_access_token", return_value=mock_credentials.token
         ),
         mock.patch(
-            "requests.get", side_effect=Exception("Something went wrong")
+            "requests.Session.get",
+            side_effect=Exception("Something went wrong"),
         ),
     ):
       with pytest.raises(
@@ -392,6 +393,42 @@ class TestConnectionsClient:
           in client._execute_api_call.mock_calls
       )
 
+  def test_poll_operation_uses_exponential_backoff(
+      self, project, location, connection_name
+  ):
+    client = ConnectionsClient(project, location, connection_name, None)
+    pending = mock.MagicMock()
+    pending.json.return_value = {"done": False}
+    done = mock.MagicMock()
+    done.json.return_value = {"done": True, "response": {}}
+
+    with (
+        mock.patch.object(
+            client,
+            "_execute_api_call",
+            side_effect=[pending, pending, pending, done],
+        ),
+        mock.patch("time.sleep") as mock_sleep,
+    ):
+      client._poll_operation("operations/test_op")
+      delays = [call.args[0] for call in mock_sleep.call_args_list]
+      assert len(delays) == 3
+      assert delays[0] < delays[1] < delays[2]
+
+  def test_poll_operation_does_not_sleep_when_done(
+      self, project, location, connection_name
+  ):
+    client = ConnectionsClient(project, location, connection_name, None)
+    done = mock.MagicMock()
+    done.json.return_value = {"done": True, "response": {}}
+
+    with (
+        mock.patch.object(client, "_execute_api_call", return_value=done),
+        mock.patch("time.sleep") as mock_sleep,
+    ):
+      client._poll_operation("operations/test_op")
+      mock_sleep.assert_not_called()
+
   def test_get_action_schema_no_operation_id(
       self, project, location, connection_name, mock_credentials
   ):
@@ -17,8 +17,11 @@ import os
 import re
 from unittest import mock
 
+from google.adk.tools.bigquery.client import credentials_cache_key
 from google.adk.tools.bigquery.client import get_bigquery_client
+from google.adk.tools.bigquery.client import TtlCache
 from google.auth.exceptions import DefaultCredentialsError
+from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
 import pytest
 
@@ -127,3 +130,90 @@ def test_bigquery_client_user_agent():
         r"adk-bigquery-tool google-adk/([0-9A-Za-z._\-+/]+)",
         client_info_arg.user_agent,
     )
+
+
+def test_bigquery_client_reused_for_same_credentials():
+  """Test BigQuery client is reused for the same project and credentials."""
+  credentials = Credentials(token="token")
+  client1 = get_bigquery_client(
+      project="test-gcp-project", credentials=credentials
+  )
+  client2 = get_bigquery_client(
+      project="test-gcp-project", credentials=credentials
+  )
+  assert client1 is client2
+
+
+def test_bigquery_client_not_shared_across_credentials():
+  """Test BigQuery client is not shared between different principals."""
+  client1 = get_bigquery_client(
+      project="test-gcp-project",
+      credentials=Credentials(token="token1"),
+  )
+  client2 = get_bigquery_client(
+      project="test-gcp-project",
+      credentials=Credentials(token="token2"),
+  )
+  assert client1 is not client2
+
+
+def test_bigquery_client_reused_for_same_service_account():
+  """Test service account credentials are identified by their account."""
+  creds1 = service_account.Credentials(
+      signer=mock.Mock(),
+      service_account_email="sa@test-gcp-project.iam.gserviceaccount.com",
+      token_uri="https://oauth2.googleapis.com/token",
+      scopes=["https://www.googleapis.com/auth/bigquery"],
+  )
+  creds2 = creds1.with_scopes(["https://www.googleapis.com/auth/bigquery"])
+  assert credentials_cache_key(creds1) == credentials_cache_key(creds2)
+  assert credentials_cache_key(creds1) != credentials_cache_key(
+      creds1.with_scopes(["https://www.googleapis.com/auth/cloud-platform"])
+  )
+
+
+def test_bigquery_client_not_cached_for_unidentified_credentials():
+  """Test credentials without a stable identity are not cached."""
+  credentials = mock.create_autospec(Credentials, instance=True)
+  assert credentials_cache_key(credentials) is None
+  client1 = get_bigquery_client(
+      project="test-gcp-project", credentials=credentials
+  )
+  client2 = get_bigquery_client(
+      project="test-gcp-project", credentials=credentials
+  )
+  assert client1 is not client2
+
+
+def test_bigquery_client_reused_for_same_oauth_user():
+  """Test OAuth credentials rebuilt from state reuse the same client."""
+  creds1 = Credentials(
+      token="token1", refresh_token="refresh", client_id="client"
+  )
+  creds2 = Credentials(
+      token="token2", refresh_token="refresh", client_id="client"
+  )
+  client1 = get_bigquery_client(project="test-gcp-project", credentials=creds1)
+  client2 = get_bigquery_client(project="test-gcp-project", credentials=creds2)
+  assert client1 is client2
+
+
+def test_ttl_cache_expires_entries():
+  """Test TtlCache serves cached values until they expire."""
+  cache = TtlCache(ttl_seconds=10)
+  compute = mock.Mock(side_effect=["first", "second"])
+  with mock.patch("time.monotonic", return_value=100):
+    assert cache.get_or_compute("key", compute) == "first"
+    assert cache.get_or_compute("key", compute) == "first"
+  with mock.patch("time.monotonic", return_value=111):
+    assert cache.get_or_compute("key", compute) == "second"
+  assert compute.call_count == 2
+
+
+def test_ttl_cache_does_not_cache_errors():
+  """Test TtlCache does not store a value when the computation fails."""
+  cache = TtlCache(ttl_seconds=10)
+  compute = mock.Mock(side_effect=[ValueError("boom"), "value"])
+  with pytest.raises(ValueError):
+    cache.get_or_compute("key", compute)
+  assert cache.get_or_compute("key", compute) == "value"
@@ -120,3 +120,37 @@ def test_get_table_info(mock_default_auth, mock_get_table):
       "error_details": "Your default credentials were not found",
   }
   mock_default_auth.assert_not_called()
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch("google.cloud.bigquery.Client.get_table", autospec=True)
+def test_get_table_info_is_cached(mock_get_table):
+  """Test get_table_info serves repeated calls from the metadata cache."""
+  metadata_tool._metadata_cache.clear()
+  credentials = Credentials(token="token")
+  mock_get_table.return_value.to_api_repr.return_value = {"id": "table"}
+
+  for _ in range(3):
+    result = metadata_tool.get_table_info(
+        "my_project_id", "my_dataset_id", "my_table_id", credentials
+    )
+    assert result == {"id": "table"}
+    # Changing the result does not change the cached metadata.
+    result["id"] = "changed"
+  mock_get_table.assert_called_once()
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+@mock.patch("google.cloud.bigquery.Client.list_tables", autospec=True)
+def test_list_table_ids_not_cached_for_unidentified_credentials(
+    mock_list_tables,
+):
+  """Test metadata is not cached for credentials without a stable identity."""
+  mock_credentials = mock.create_autospec(Credentials, instance=True)
+  mock_list_tables.return_value = []
+
+  for _ in range(2):
+    metadata_tool.list_table_ids(
+        "my_project_id", "my_dataset_id", mock_credentials
+    )
+  assert mock_list_tables.call_count == 2
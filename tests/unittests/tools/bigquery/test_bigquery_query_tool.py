@@ -22,6 +22,8 @@ from unittest import mock
 from google.adk.tools import BaseTool
 from google.adk.tools.bigquery import BigQueryCredentialsConfig
 from google.adk.tools.bigquery import BigQueryToolset
+from google.adk.tools.bigquery import client
+from google.adk.tools.bigquery import metadata_tool
 from google.adk.tools.bigquery.config import BigQueryToolConfig
 from google.adk.tools.bigquery.config import WriteMode
 from google.adk.tools.bigquery.query_tool import execute_sql
@@ -829,3 +831,73 @@ def test_execute_sql_no_default_auth(
   result = execute_sql(project, query, credentials, tool_config, tool_context)
   assert result == {"status": "SUCCESS", "rows": query_result}
   mock_default_auth.assert_not_called()
+
+
+def test_execute_sql_truncates_result_by_bytes():
+  """Test execute_sql stops reading rows once the byte budget is exceeded."""
+  project = "my_project"
+  query = "SELECT payload FROM my_dataset.my_table"
+  credentials = mock.create_autospec(Credentials, instance=True)
+  tool_config = BigQueryToolConfig(write_mode=WriteMode.ALLOWED)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  wide_row = {"payload": "x" * 1024}
+
+  with (
+      mock.patch("google.cloud.bigquery.Client", autospec=False) as Client,
+      mock.patch(
+          "google.adk.tools.bigquery.query_tool.MAX_DOWNLOADED_QUERY_RESULT_BYTES",
+          4 * 1024,
+      ),
+  ):
+    bq_client = Client.return_value
+    consumed_rows = []
+
+    def row_iterator():
+      for _ in range(10):
+        consumed_rows.append(wide_row)
+        yield wide_row
+
+    bq_client.query_and_wait.return_value = row_iterator()
+
+    result = execute_sql(project, query, credentials, tool_config, tool_context)
+    assert result["status"] == "SUCCESS"
+    assert len(result["rows"]) == 3
+    assert result["result_is_likely_truncated"] is True
+    assert len(consumed_rows) == 4
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_execute_sql_write_invalidates_cached_metadata():
+  """Test a table created by execute_sql is listed by list_table_ids."""
+  project = "my_project"
+  credentials = Credentials(token="write-invalidates-token")
+  tool_config = BigQueryToolConfig(write_mode=WriteMode.ALLOWED)
+  tool_context = mock.create_autospec(ToolContext, instance=True)
+  client._client_cache.clear()
+  metadata_tool._metadata_cache.clear()
+
+  with mock.patch("google.cloud.bigquery.Client", autospec=False) as Client:
+    bq_client = Client.return_value
+    tables = []
+    bq_client.list_tables.side_effect = lambda dataset_ref: list(tables)
+
+    def query_and_wait(query, **kwargs):
+      table = mock.create_autospec(bigquery.TableReference, instance=True)
+      table.table_id = "my_table"
+      tables.append(table)
+      return []
+
+    bq_client.query_and_wait.side_effect = query_and_wait
+
+    table_ids = metadata_tool.list_table_ids(project, "my_dataset", credentials)
+    assert table_ids == []
+    result = execute_sql(
+        project,
+        "CREATE TABLE my_dataset.my_table (num INT64)",
+        credentials,
+        tool_config,
+        tool_context,
+    )
+    assert result == {"status": "SUCCESS", "rows": []}
+    table_ids = metadata_tool.list_table_ids(project, "my_dataset", credentials)
+    assert table_ids == ["my_table"]
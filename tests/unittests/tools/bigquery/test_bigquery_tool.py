@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-
+import threading
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -142,6 +142,59 @@ class TestBigQueryTool:
       assert result["result"] == "Success with test_value"
       assert result["authenticated"] is True
 
+  @pytest.mark.asyncio
+  async def test_run_async_runs_sync_function_off_event_loop(
+      self, mock_tool_context
+  ):
+    """Test synchronous tool functions do not run on the event loop thread."""
+    loop_thread = threading.get_ident()
+
+    def sample_func(param1: str) -> dict:
+      return {"same_thread": threading.get_ident() == loop_thread}
+
+    tool = BigQueryTool(func=sample_func, credentials_config=None)
+    result = await tool.run_async(
+        args={"param1": "test_value"}, tool_context=mock_tool_context
+    )
+    assert result == {"same_thread": False}
+
+  @pytest.mark.asyncio
+  async def test_run_async_filters_args_of_sync_function(
+      self, mock_tool_context
+  ):
+    """Test synchronous tool functions get only the args they accept."""
+
+    def sample_func(param1: str) -> dict:
+      return {"param1": param1}
+
+    tool = BigQueryTool(func=sample_func, credentials_config=None)
+    result = await tool.run_async(
+        args={"param1": "test_value", "unknown": "ignored"},
+        tool_context=mock_tool_context,
+    )
+    assert result == {"param1": "test_value"}
+
+    result = await tool.run_async(args={}, tool_context=mock_tool_context)
+    assert "param1" in result["error"]
+
+  @pytest.mark.asyncio
+  async def test_run_async_awaits_async_callable_object(
+      self, mock_tool_context
+  ):
+    """Test callable objects with an async __call__ run on the event loop."""
+    loop_thread = threading.get_ident()
+
+    class AsyncCallable:
+
+      async def __call__(self, param1: str) -> dict:
+        return {"same_thread": threading.get_ident() == loop_thread}
+
+    tool = BigQueryTool(func=AsyncCallable(), credentials_config=None)
+    result = await tool.run_async(
+        args={"param1": "test_value"}, tool_context=mock_tool_context
+    )
+    assert result == {"same_thread": True}
+
   @pytest.mark.asyncio
   async def test_run_async_oauth_flow_in_progress(
       self, sample_function, credentials_config, mock_tool_context
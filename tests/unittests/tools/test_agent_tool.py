@@ -209,3 +209,48 @@ def test_custom_schema():
   # The second request is the tool agent request.
   assert mock_model.requests[1].config.response_schema == CustomOutput
   assert mock_model.requests[1].config.response_mime_type == 'application/json'
+
+
+def test_runner_reused_across_calls():
+  """The agent tool runs every call on the same runner."""
+  mock_model = testing_utils.MockModel.create(
+      responses=[
+          function_call_no_schema,
+          'response1',
+          'response2',
+          function_call_no_schema,
+          'response3',
+          'response4',
+      ]
+  )
+
+  tool_agent = Agent(
+      name='tool_agent',
+      model=mock_model,
+  )
+  agent_tool = AgentTool(agent=tool_agent)
+
+  root_agent = Agent(
+      name='root_agent',
+      model=mock_model,
+      tools=[agent_tool],
+  )
+
+  runner = testing_utils.InMemoryRunner(root_agent)
+  runner.run('test1')
+  tool_runner = agent_tool._runner
+  assert tool_runner is not None
+
+  assert testing_utils.simplify_events(runner.run('test2')) == [
+      ('root_agent', function_call_no_schema),
+      (
+          'root_agent',
+          Part.from_function_response(
+              name='tool_agent', response={'result': 'response3'}
+          ),
+      ),
+      ('root_agent', 'response4'),
+  ]
+  assert agent_tool._runner is tool_runner
+  # Sessions of finished calls are released.
+  assert not tool_runner.session_service._sessions
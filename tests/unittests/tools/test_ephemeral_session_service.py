@@ -0,0 +1,75 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.events.event import Event
+from google.adk.events.event_actions import EventActions
+from google.adk.sessions.state import State
+from google.adk.tools._ephemeral_session_service import EphemeralSessionService
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_recycled():
+  service = EphemeralSessionService()
+  session = await service.create_session(app_name='app', user_id='user')
+  session_id = session.id
+  await service.delete_session(
+      app_name='app', user_id='user', session_id=session_id
+  )
+
+  recycled = await service.create_session(app_name='app', user_id='user')
+  assert recycled is session
+  assert recycled.id != session_id
+  assert not recycled.events
+  assert not recycled.state
+
+
+@pytest.mark.asyncio
+async def test_state_is_copy_on_write_view():
+  parent_state = State(value={'a': 1}, delta={'b': 2})
+  service = EphemeralSessionService()
+  session = await service.create_session(
+      app_name='app', user_id='user', state=parent_state.to_chain_map()
+  )
+  assert session.state['a'] == 1
+  assert session.state['b'] == 2
+
+  await service.append_event(
+      session,
+      Event(author='agent', actions=EventActions(state_delta={'a': 10})),
+  )
+  assert session.state['a'] == 10
+  assert parent_state['a'] == 1
+
+  # Later parent changes are visible to the child.
+  parent_state['c'] = 3
+  assert session.state['c'] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_session_returns_same_object():
+  service = EphemeralSessionService()
+  session = await service.create_session(app_name='app', user_id='user')
+  assert (
+      await service.get_session(
+          app_name='app', user_id='user', session_id=session.id
+      )
+      is session
+  )
+  assert (
+      await service.get_session(
+          app_name='app', user_id='other', session_id=session.id
+      )
+      is None
+  )
@@ -13,9 +13,11 @@
 # limitations under the License.
 
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.sessions.session import Session
+from google.adk.tools._automatic_function_calling_util import build_function_declaration
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.tool_context import ToolContext
 import pytest
@@ -345,3 +347,34 @@ async def test_run_async_with_tool_context_and_unexpected_argument():
       "received_arg": "world",
       "context_present": True,
   }
+
+
+def test_get_declaration_is_cached():
+  """Test that the function declaration is only built once."""
+  tool = FunctionTool(function_for_testing_with_no_args)
+
+  with patch(
+      "google.adk.tools.function_tool.build_function_declaration",
+      wraps=build_function_declaration,
+  ) as mock_build:
+    declaration1 = tool._get_declaration()
+    declaration2 = tool._get_declaration()
+
+  assert declaration1 is declaration2
+  mock_build.assert_called_once()
+
+
+def test_get_declaration_cache_invalidated_on_ignore_params_change():
+  """Test that changing the ignored params rebuilds the declaration."""
+
+  def func(arg1: str, arg2: str):
+    """Function with two args."""
+    pass
+
+  tool = FunctionTool(func)
+  declaration1 = tool._get_declaration()
+  tool._ignore_params.append("arg2")
+  declaration2 = tool._get_declaration()
+
+  assert set(declaration1.parameters.properties) == {"arg1", "arg2"}
+  assert set(declaration2.parameters.properties) == {"arg1"}
@@ -0,0 +1,199 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import gc
+from typing import Optional
+from unittest import mock
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.agents.run_config import RunConfig
+from google.adk.flows.llm_flows.single_flow import SingleFlow
+from google.adk.memory.base_memory_service import BaseMemoryService
+from google.adk.memory.base_memory_service import SearchMemoryResponse
+from google.adk.memory.memory_entry import MemoryEntry
+from google.adk.models.llm_request import LlmRequest
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
+from google.adk.tools.preload_memory_tool import PreloadMemoryTool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+import pytest
+
+
+async def _create_invocation_context(
+    memory_service, user_text='hello', agent=None
+):
+  session_service = InMemorySessionService()
+  session = await session_service.create_session(
+      app_name='test_app', user_id='test_user'
+  )
+  return InvocationContext(
+      invocation_id='test_id',
+      agent=agent or LlmAgent(name='test_agent'),
+      session=session,
+      session_service=session_service,
+      memory_service=memory_service,
+      user_content=types.Content(
+          role='user', parts=[types.Part.from_text(text=user_text)]
+      ),
+  )
+
+
+def _create_memory_service():
+  memory_service = mock.create_autospec(BaseMemoryService, instance=True)
+  memory_service.search_memory.return_value = SearchMemoryResponse(
+      memories=[
+          MemoryEntry(
+              author='user',
+              content=types.Content(
+                  parts=[types.Part.from_text(text='I like tea.')]
+              ),
+          )
+      ]
+  )
+  return memory_service
+
+
+@pytest.mark.asyncio
+async def test_memory_searched_once_per_invocation():
+  memory_service = _create_memory_service()
+  invocation_context = await _create_invocation_context(memory_service)
+  tool = PreloadMemoryTool()
+
+  requests = [
+      LlmRequest(config=types.GenerateContentConfig()),
+      LlmRequest(config=types.GenerateContentConfig()),
+  ]
+  for llm_request in requests:
+    # Each step works on its own copy of the invocation context.
+    await tool.process_llm_request(
+        tool_context=ToolContext(invocation_context.model_copy()),
+        llm_request=llm_request,
+    )
+
+  memory_service.search_memory.assert_called_once_with(
+      app_name='test_app', user_id='test_user', query='hello'
+  )
+  for llm_request in requests:
+    assert '<PAST_CONVERSATIONS>' in llm_request.config.system_instruction
+    assert 'user: I like tea.' in llm_request.config.system_instruction
+
+
+@pytest.mark.asyncio
+async def test_failed_search_is_retried():
+  memory_service = _create_memory_service()
+  memory_service.search_memory.side_effect = [
+      RuntimeError('unavailable'),
+      SearchMemoryResponse(),
+  ]
+  invocation_context = await _create_invocation_context(memory_service)
+  tool = PreloadMemoryTool()
+
+  with pytest.raises(RuntimeError):
+    await tool.process_llm_request(
+        tool_context=ToolContext(invocation_context),
+        llm_request=LlmRequest(config=types.GenerateContentConfig()),
+    )
+  llm_request = LlmRequest(config=types.GenerateContentConfig())
+  await tool.process_llm_request(
+      tool_context=ToolContext(invocation_context), llm_request=llm_request
+  )
+  assert not llm_request.config.system_instruction
+  assert memory_service.search_memory.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_prefetch_starts_search_early():
+  memory_service = _create_memory_service()
+  invocation_context = await _create_invocation_context(memory_service)
+  tool = PreloadMemoryTool(prefetch=True)
+
+  tool.start_memory_search(invocation_context)
+  assert 'hello' in invocation_context._preloaded_memory_instructions
+
+  llm_request = LlmRequest(config=types.GenerateContentConfig())
+  await tool.process_llm_request(
+      tool_context=ToolContext(invocation_context), llm_request=llm_request
+  )
+  memory_service.search_memory.assert_called_once()
+  assert '<PAST_CONVERSATIONS>' in llm_request.config.system_instruction
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_is_not_reported_when_not_awaited():
+  memory_service = _create_memory_service()
+  memory_service.search_memory.side_effect = RuntimeError('unavailable')
+  invocation_context = await _create_invocation_context(memory_service)
+  errors = []
+  asyncio.get_running_loop().set_exception_handler(
+      lambda loop, context: errors.append(context)
+  )
+
+  PreloadMemoryTool(prefetch=True).start_memory_search(invocation_context)
+  future = invocation_context._preloaded_memory_instructions['hello']
+  await asyncio.wait([future])
+  del future
+  invocation_context._preloaded_memory_instructions.clear()
+  gc.collect()
+
+  assert not errors
+
+
+class _PreloadMemoryToolset(BaseToolset):
+
+  def __init__(self, tool: PreloadMemoryTool):
+    self.tool = tool
+
+  async def get_tools(
+      self, readonly_context: Optional[ReadonlyContext] = None
+  ) -> list[BaseTool]:
+    return [self.tool]
+
+  async def close(self) -> None:
+    pass
+
+
+@pytest.mark.asyncio
+async def test_prefetch_from_toolset():
+  memory_service = _create_memory_service()
+  tool = PreloadMemoryTool(prefetch=True)
+  invocation_context = await _create_invocation_context(
+      memory_service,
+      agent=LlmAgent(
+          name='test_agent',
+          model='gemini-2.0-flash',
+          tools=[_PreloadMemoryToolset(tool)],
+      ),
+  )
+  invocation_context.run_config = RunConfig()
+  llm_request = LlmRequest(config=types.GenerateContentConfig())
+
+  with mock.patch.object(
+      PreloadMemoryTool,
+      'start_memory_search',
+      autospec=True,
+      side_effect=PreloadMemoryTool.start_memory_search,
+  ) as mock_start:
+    async for _ in SingleFlow()._preprocess_async(
+        invocation_context, llm_request
+    ):
+      pass
+
+  mock_start.assert_called_once_with(tool, invocation_context)
+  memory_service.search_memory.assert_called_once()
+  assert '<PAST_CONVERSATIONS>' in llm_request.config.system_instruction